@@ -0,0 +1,69 @@
+"""Mide el tiempo que Banker.request_resources mantiene el lock, con y sin la verificación incremental.
+
+Se comparan dos formas de declarar la demanda máxima:
+  - "all": cada estudiante declara 1 laboratorio y 1 de cada herramienta (como UniversityBanker).
+  - "declared": cada estudiante declara solo el laboratorio y las herramientas que va a pedir.
+
+Uso:
+    python -m benchmarks.banker_lock_hold
+"""
+import random
+from time import perf_counter
+
+from models.concurrence_control.banker import Banker
+
+def build_claims(n_students: int, n_tools: int, claim: str, rng: random.Random):
+    """Devuelve la solicitud fija de cada estudiante y su demanda máxima declarada."""
+    tools = [f"tool_{tool_id}" for tool_id in range(1, n_tools + 1)]
+    requests = {}
+    max_demand = {}
+    for sid in range(1, n_students + 1):
+        request = {"lab": 1}
+        for tool in rng.sample(tools, k=3):
+            request[tool] = 1
+        requests[sid] = request
+        if claim == "all":
+            max_demand[sid] = {"lab": 1, **{tool: 1 for tool in tools}}
+        else:
+            max_demand[sid] = dict(request)
+    return requests, max_demand
+
+def run(n_students: int, claim: str = "declared", n_tools: int = 50, n_labs: int = 20,
+        n_ops: int = 3000, incremental: bool = True, seed: int = 0):
+    """Ejecuta una secuencia de solicitudes/liberaciones y devuelve el tiempo medio (µs) por solicitud."""
+    rng = random.Random(seed)
+    requests, max_demand = build_claims(n_students, n_tools, claim, rng)
+    total_resources = {"lab": n_labs, **{f"tool_{tool_id}": 1 for tool_id in range(1, n_tools + 1)}}
+    banker = Banker(total_resources, max_demand, incremental=incremental)
+
+    holders = []
+    elapsed = 0.0
+    calls = 0
+    for _ in range(n_ops):
+        if holders and rng.random() < 0.3:
+            banker.release_resources(holders.pop(rng.randrange(len(holders))))
+            continue
+        sid = rng.randint(1, n_students)
+        if sid in holders:
+            continue
+        start = perf_counter()
+        granted = banker.request_resources(sid, requests[sid])
+        elapsed += perf_counter() - start
+        calls += 1
+        if granted:
+            holders.append(sid)
+    return elapsed / max(1, calls) * 1e6, banker
+
+def main():
+    for claim in ("all", "declared"):
+        print(f"\nDemanda máxima: {claim}")
+        print(f"{'students':>9} {'full (µs)':>10} {'incremental (µs)':>17} {'speedup':>8} "
+              f"{'fast':>6} {'cached':>7} {'full':>6}")
+        for n_students in (100, 250, 500, 1000, 2000):
+            full, _ = run(n_students, claim, incremental=False)
+            incremental, banker = run(n_students, claim, incremental=True)
+            print(f"{n_students:>9} {full:>10.1f} {incremental:>17.1f} {full / incremental:>7.1f}x "
+                  f"{banker.fast_path_hits:>6} {banker.cached_sequence_hits:>7} {banker.full_checks:>6}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Compara estrategias de reserva sin interfaz gráfica, repartiendo las ejecuciones entre procesos.
+
+No importa Tk ni matplotlib, así que puede correr en servidores sin pantalla. Por cada estrategia y
+cantidad de alumnos informa throughput, percentiles p50/p95/p99 de la latencia de aprobación, tasa de
+rechazo y tiempo de pared, y opcionalmente los guarda en JSON o CSV.
+
+Uso:
+    python -m benchmarks.compare_strategies --strategies University UniversityOrdered \\
+        --students 50 200 --iterations 4 --seeds 1 2 --labs 8 --tools 20 --json resultados.json
+"""
+import argparse
+import csv
+import json
+import random
+from collections import Counter
+
+from controllers.comparison_runner import ComparisonRunner
+from controllers.replay import requests_from_trace
+from controllers.workload import ARRIVALS, Workload
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+from models.university import University
+from models.concurrence_control.university_mutex_abroad import UniversityMutexAbroad
+from models.concurrence_control.university_mutex import UniversityMutex
+from models.concurrence_control.university_release import UniversityRelease
+from models.concurrence_control.university_prevention import UniversityPrevention
+from models.concurrence_control.university_banker import UniversityBanker
+from models.concurrence_control.university_ordered import UniversityOrdered
+from models.concurrence_control.university_async import UniversityAsync
+from models.concurrence_control.university_detection import UniversityDetection
+
+STRATEGIES = {
+    cls.__name__: cls for cls in (
+        University, UniversityMutexAbroad, UniversityMutex,
+        UniversityRelease, UniversityPrevention, UniversityBanker,
+        UniversityOrdered, UniversityAsync, UniversityDetection,
+    )
+}
+
+# Columnas de la salida, en orden
+FIELDS = ["strategy", "students", "runs", "throughput", "p50_approval_latency", "p95_approval_latency",
+          "p99_approval_latency", "rejection_rate", "wall_time", "substitution_rate"]
+
+def default_topology(capacity: int = 1):
+    """Laboratories and tools of main.py, with `capacity` units of each tool."""
+    tools = [
+        LaboratoryTool("Oscilloscope", 1, capacity),
+        LaboratoryTool("Opticskit", 2, capacity),
+        LaboratoryTool("Calorimeter", 3, capacity),
+        LaboratoryTool("PressureSensors", 4, capacity),
+        LaboratoryTool("Multimeter", 5, capacity),
+    ]
+    labs = [
+        Laboratory("Instrumentation", 1, [1, 4, 5]),
+        Laboratory("Thermodynamics Calorimetry", 2, [3, 4, 5]),
+        Laboratory("Optics", 3, [2, 4]),
+        Laboratory("GeneralPhysics", 4, [2, 3, 4, 5]),
+    ]
+    return labs, tools
+
+def build_topology(n_labs: int, n_tools: int, seed: int = 0, capacity: int = 1):
+    """Generated topology with `n_labs` laboratories and `n_tools` tools of `capacity` units
+    (up to 4 tools per laboratory)."""
+    rng = random.Random(seed)
+    tools = [LaboratoryTool(f"Tool_{i+1}", i+1, capacity) for i in range(n_tools)]
+    labs = [Laboratory(f"Laboratory_{i+1}", i+1, sorted(rng.sample(range(1, n_tools + 1), k=min(4, n_tools))))
+            for i in range(n_labs)]
+    return labs, tools
+
+def run_benchmark(strategies: list[str], student_counts: list[int], iterations: int, seeds=None,
+                  n_labs: int | None = None, n_tools: int | None = None, workers: int | None = None,
+                  processes: int | None = None, requests=None, workload: dict | None = None, capacity: int = 1):
+    """Runs the comparison for every student count and returns one row per strategy and count.
+    With `requests` every strategy replays that request stream instead (one row per strategy).
+    With `workload` (arguments of controllers.workload.Workload) the requests of each student count
+    are generated lazily from those distributions, one stream per seed. Every tool has `capacity` units.
+    UniversityBanker declares as maximum claim the most units of a tool that a request asks."""
+    if n_labs or n_tools:
+        labs, tools = build_topology(n_labs or 4, n_tools or 5, capacity=capacity)
+    else:
+        labs, tools = default_topology(capacity)
+    runner = ComparisonRunner(processes)
+    # Demanda máxima del banquero: las unidades de una herramienta que pide como mucho una solicitud
+    if workload is not None:
+        max_tool_units = max(workload.get("tool_units") or {1: 1.0})
+    elif requests is not None:
+        max_tool_units = max((max(Counter(tool_ids).values(), default=1) for _, _, _, tool_ids in requests), default=1)
+    else:
+        max_tool_units = 1
+    options = {UniversityBanker: {"max_tool_units": max_tool_units}}
+    rows = []
+    if requests is not None:
+        student_counts = [len(requests)]
+    for n_students in student_counts:
+        stream = requests
+        if workload is not None:
+            student_ids = range(1, n_students + 1)
+            stream = lambda seed: Workload(labs, tools, student_ids, seed=seed, **workload)
+        results = runner.run([STRATEGIES[name] for name in strategies], labs, tools,
+                             n_students, iterations, seeds, workers, requests=stream, strategy_options=options)
+        for name, result in results.items():
+            rows.append({"strategy": name, "students": n_students, **result["summary"]})
+    return rows
+
+def write_json(rows: list[dict], path: str):
+    with open(path, "w") as file:
+        json.dump(rows, file, indent=2)
+
+def write_csv(rows: list[dict], path: str):
+    with open(path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+def print_table(rows: list[dict]):
+    print(f"{'strategy':<22} {'students':>8} {'runs':>4} {'bookings/s':>10} {'p50 (s)':>8} {'p95 (s)':>8} "
+          f"{'p99 (s)':>8} {'rejected':>8} {'wall (s)':>8}")
+    for row in rows:
+        print(f"{row['strategy']:<22} {row['students']:>8} {row['runs']:>4} {row['throughput']:>10.2f} "
+              f"{row['p50_approval_latency']:>8.3f} {row['p95_approval_latency']:>8.3f} "
+              f"{row['p99_approval_latency']:>8.3f} {row['rejection_rate']:>8.1%} {row['wall_time']:>8.2f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara estrategias de reserva de laboratorios sin interfaz gráfica.")
+    parser.add_argument("--strategies", nargs="+", choices=sorted(STRATEGIES), default=sorted(STRATEGIES))
+    parser.add_argument("--students", type=int, nargs="+", default=[20], help="cantidades de alumnos a probar")
+    parser.add_argument("--iterations", type=int, default=1, help="iteraciones por estrategia y semilla")
+    parser.add_argument("--seeds", type=int, nargs="*", default=None, help="semillas de las solicitudes aleatorias")
+    parser.add_argument("--labs", type=int, default=None, help="número de laboratorios (por defecto, los de main.py)")
+    parser.add_argument("--tools", type=int, default=None, help="número de herramientas (por defecto, las de main.py)")
+    parser.add_argument("--capacity", type=int, default=1, help="unidades de cada herramienta")
+    parser.add_argument("--workers", type=int, default=None, help="hilos por ejecución (por defecto, uno por alumno)")
+    parser.add_argument("--processes", type=int, default=None, help="procesos en paralelo (por defecto, uno por núcleo)")
+    parser.add_argument("--replay", default=None, help="traza binaria cuyas solicitudes se repiten en cada estrategia")
+    parser.add_argument("--requests", type=int, default=None,
+                        help="solicitudes generadas por ejecución con las distribuciones siguientes (por defecto, una por alumno)")
+    # Distribuciones de la carga: solo valen con --requests (None: no se indicó, se usa el valor por defecto)
+    parser.add_argument("--arrivals", choices=ARRIVALS, default=None, help="proceso de llegada de las solicitudes (instant)")
+    parser.add_argument("--rate", type=float, default=None, help="solicitudes por segundo (llegadas poisson y bursty; 100)")
+    parser.add_argument("--tool-skew", type=float, default=None, help="exponente Zipf de la popularidad de las herramientas (0)")
+    parser.add_argument("--repeat", type=float, default=None, help="probabilidad de que una solicitud repita una reserva reciente (0)")
+    parser.add_argument("--units", type=int, default=None, help="máximo de unidades de cada herramienta por solicitud (1)")
+    parser.add_argument("--any-lab", type=float, default=None,
+                        help="probabilidad de que una solicitud acepte cualquier laboratorio con sus herramientas (0)")
+    parser.add_argument("--json", default=None, help="archivo JSON de salida")
+    parser.add_argument("--csv", default=None, help="archivo CSV de salida")
+    args = parser.parse_args(argv)
+
+    if any(n < 1 for n in args.students) or args.iterations < 1 or args.capacity < 1 or (args.units or 1) < 1:
+        parser.error("--students, --iterations, --capacity y --units deben ser positivos")
+    # Combinaciones que se ignorarían en silencio
+    workload_flags = {"--arrivals": args.arrivals, "--rate": args.rate, "--tool-skew": args.tool_skew,
+                      "--repeat": args.repeat, "--units": args.units, "--any-lab": args.any_lab}
+    given = [flag for flag, value in workload_flags.items() if value is not None]
+    if args.replay and args.requests is not None:
+        parser.error("--replay y --requests no se pueden combinar: la traza ya fija las solicitudes")
+    if given and args.requests is None:
+        parser.error(f"{', '.join(given)} solo se aplican a la carga generada con --requests")
+    if args.replay and args.seeds and len(args.seeds) > 1:
+        parser.error("--replay repite la misma traza: varias --seeds darían las mismas ejecuciones")
+
+    requests = requests_from_trace(args.replay) if args.replay else None
+    workload = None
+    if args.requests is not None:
+        workload = {"requests": args.requests, "arrivals": args.arrivals or "instant",
+                    "rate": args.rate if args.rate is not None else 100.0,
+                    "tool_skew": args.tool_skew or 0.0, "repeat_probability": args.repeat or 0.0,
+                    "tool_units": {units: 1.0 for units in range(1, (args.units or 1) + 1)},
+                    "any_laboratory_probability": args.any_lab or 0.0}
+    rows = run_benchmark(args.strategies, args.students, args.iterations, args.seeds, args.labs, args.tools,
+                         args.workers, args.processes, requests, workload, args.capacity)
+    print_table(rows)
+    if args.json:
+        write_json(rows, args.json)
+    if args.csv:
+        write_csv(rows, args.csv)
+    return rows
+
+if __name__ == "__main__":
+    main()
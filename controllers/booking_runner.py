@@ -0,0 +1,74 @@
+import asyncio
+import threading
+from queue import Queue
+from time import perf_counter
+
+# ---------------------------------------------------------------
+# Concurrent execution of random bookings. This module does not import the
+# views (Tk, matplotlib) so it can be used from worker processes and scripts.
+# ---------------------------------------------------------------
+
+def random_bookings(university, studens_ids, workers: int | None = None):
+    """Books laboratories concurrently for a list of students and returns the throughput of the run.
+    Asyncio strategies run one coroutine per student; otherwise, with `workers` the requests go
+    through a queue served by that many threads, and without it one thread is created per student."""
+    if asyncio.iscoroutinefunction(university.to_book):
+        return asyncio.run(async_random_bookings(university, studens_ids))
+    if workers:
+        return pooled_random_bookings(university, studens_ids, workers)
+    return threaded_random_bookings(university, studens_ids)
+
+def threaded_random_bookings(university, studens_ids):
+    """Creates one thread per student to book laboratories concurrently."""
+    start = perf_counter()
+    threads = []
+
+    for student_id in studens_ids:
+        t = threading.Thread(target=university.random_booking, args=(student_id,))
+        threads.append(t)
+        t.start()
+
+    for t in threads:
+        t.join()
+
+    return throughput(len(threads), len(threads), perf_counter() - start)
+
+def pooled_random_bookings(university, studens_ids, workers: int):
+    """Books laboratories for a list of students with a fixed pool of worker threads fed by a request queue."""
+    requests: Queue = Queue()
+    for student_id in studens_ids:
+        requests.put(student_id)
+    n_requests = requests.qsize()
+    workers = max(1, min(workers, n_requests))
+    for _ in range(workers):
+        requests.put(None)  # Una marca de fin por trabajador
+
+    def worker():
+        while (student_id := requests.get()) is not None:
+            university.random_booking(student_id)
+
+    start = perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(workers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    return throughput(n_requests, workers, perf_counter() - start)
+
+async def async_random_bookings(university, studens_ids):
+    """Books laboratories concurrently with one coroutine per student on the running event loop.
+    Requires an asyncio strategy (UniversityAsync)."""
+    studens_ids = list(studens_ids)
+    start = perf_counter()
+    await asyncio.gather(*(university.random_booking(student_id) for student_id in studens_ids))
+    return throughput(len(studens_ids), 1, perf_counter() - start)
+
+def throughput(requests: int, workers: int, wall_time: float):
+    """Summary of a concurrent run: requests, workers, wall time and throughput (bookings/s)."""
+    return {
+        "requests": requests,
+        "workers": workers,
+        "wall_time": wall_time,
+        "throughput": requests / wall_time if wall_time > 0 else 0.0,
+    }
@@ -0,0 +1,195 @@
+import copy
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from controllers import replay
+from controllers.workload import Workload
+from models.booking import StatusBooking
+from models.student import Student
+from models.university import University
+
+# ---------------------------------------------------------------
+# Comparison of strategies. Every (strategy, iteration, seed) run is
+# independent, so the runs are spread over a pool of processes and their
+# get_booking_stats() dictionaries are merged per strategy. Runs with the
+# same seed and iteration replay the same request stream on every strategy.
+# ---------------------------------------------------------------
+
+# Estados de una reserva que ya fue aprobada
+APPROVED_STATUSES = (StatusBooking.APPROVED, StatusBooking.IN_USE, StatusBooking.FINISHED)
+
+def approval_latencies(university):
+    """Approval times of the approved bookings, read from the columns of the booking store."""
+    columns = university.bookings.columns()
+    approved = np.isin(columns["status"], [status.value for status in APPROVED_STATUSES])
+    return columns["approved_time"][approved].tolist()
+
+def run_comparison_job(job: dict):
+    """Runs one comparison job in the current process and returns its statistics.
+    It is a module-level function so the process pool can pickle it."""
+    # Cada ejecución trabaja sobre su propia copia de laboratorios y herramientas
+    laboratories = copy.deepcopy(job["laboratories"])
+    laboratory_tools = copy.deepcopy(job["laboratory_tools"])
+    requests = job["requests"]
+    # Una carga perezosa conoce sus estudiantes sin generar las solicitudes
+    student_ids = requests.student_ids if isinstance(requests, Workload) else sorted({request[0] for request in requests})
+    students = [Student(f"Student_{i}", i) for i in student_ids]
+    university = job["university_class"](laboratories, laboratory_tools, students, **job.get("options", {}))
+    if job.get("contention"):
+        university.enable_contention_metrics()
+
+    run = replay.replay(university, requests, job["workers"], job.get("time_scale", 1.0))
+    stats = university.get_booking_stats()
+    stats["Throughput (bookings/s)"] = run["throughput"]
+    stats["Wall time"] = run["wall_time"]
+
+    result = {
+        "strategy": job["university_class"].__name__,
+        "iteration": job["iteration"],
+        "seed": job["seed"],
+        "stats": stats,
+        # Latencias de aprobación de cada reserva aprobada, para calcular percentiles entre ejecuciones
+        "approval_latencies": approval_latencies(university),
+        # Contadores de contención por laboratorio, herramienta y lock de la estrategia (vacío si no se piden)
+        "contention": university.get_contention_stats(),
+    }
+    if job["keep_university"]:
+        result["university"] = snapshot_university(university)
+    return result
+
+def snapshot_university(university):
+    """Returns a plain University with the final bookings of `university`.
+    Strategies keep locks, semaphores or event-loop conditions that cannot be sent between
+    processes; the snapshot only keeps what the graph and the statistics views need."""
+    snapshot = University(university.laboratories, university.laboratory_tools, university.students)
+    # El almacén de reservas es de datos planos: se comparte tal cual
+    snapshot.bookings = university.bookings
+    snapshot.booking_stats = university.booking_stats
+    snapshot.substitution_stats = university.substitution_stats
+    return snapshot
+
+def merge_stats(stats_list: list[dict]):
+    """Merges the statistics of several runs: numeric values are averaged, the rest keep the first value."""
+    merged = {}
+    for key in stats_list[0] if stats_list else []:
+        values = [stats[key] for stats in stats_list if key in stats]
+        if all(isinstance(value, (int, float)) for value in values):
+            merged[key] = sum(values) / len(values)
+        else:
+            merged[key] = values[0]
+    return merged
+
+def merge_contention(contention_list: list[dict]):
+    """Merges the contention counters of several runs, averaging them per resource or lock."""
+    merged = {}
+    for name in dict.fromkeys(name for contention in contention_list for name in contention):
+        merged[name] = merge_stats([contention[name] for contention in contention_list if name in contention])
+    return merged
+
+def summarize_runs(runs: list[dict]):
+    """Summary of the runs of one strategy: mean throughput and wall time, approval latency
+    percentiles over every approved booking, rejection rate over every booking and substitution rate
+    over the requests that accepted any compatible laboratory."""
+    latencies = [latency for run in runs for latency in run["approval_latencies"]]
+    total = sum(run["stats"]["total_bookings"] for run in runs)
+    rejected = sum(run["stats"]["rejected"] for run in runs)
+    any_laboratory = sum(run["stats"].get("Any-laboratory requests", 0) for run in runs)
+    substituted = sum(run["stats"].get("Substitutions", 0) for run in runs)
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) if latencies else (0.0, 0.0, 0.0)
+    return {
+        "runs": len(runs),
+        "throughput": sum(run["stats"]["Throughput (bookings/s)"] for run in runs) / max(1, len(runs)),
+        "p50_approval_latency": float(p50),
+        "p95_approval_latency": float(p95),
+        "p99_approval_latency": float(p99),
+        "rejection_rate": rejected / total if total else 0.0,
+        "wall_time": sum(run["stats"]["Wall time"] for run in runs) / max(1, len(runs)),
+        "substitution_rate": substituted / any_laboratory if any_laboratory else 0.0,
+    }
+
+class ComparisonRunner:
+    """Runs every (strategy, iteration, seed) combination on a pool of processes and merges the results."""
+    def __init__(self, processes: int | None = None):
+        # Número de procesos (por defecto, uno por núcleo); 1 ejecuta todo en este proceso
+        self.processes = processes or os.cpu_count() or 1
+
+    def build_jobs(self, university_classes, laboratories, laboratory_tools, n_students: int,
+                   iterations: int, seeds: list[int | None] | None = None, workers: int | None = None,
+                   keep_last: bool = False, contention: bool = False, requests=None, time_scale: float = 1.0,
+                   strategy_options: dict | None = None):
+        """Builds one job per strategy, seed and iteration. Every strategy gets the same request stream for
+        a given seed and iteration: `requests` if it is given (a list, a Workload that every job
+        generates again lazily, or a function that returns the stream of each seed), otherwise one request per student generated
+        from the seed (a random one when the seed is None). With `contention` every run records the lock
+        contention of its resources. `strategy_options` maps a strategy class to the keyword arguments
+        of its constructor."""
+        seeds = seeds or [None]
+        streams = {}
+        for seed in seeds:
+            for iteration in range(iterations):
+                if callable(requests):
+                    streams[seed, iteration] = requests(seed)
+                elif isinstance(requests, Workload):
+                    streams[seed, iteration] = requests
+                elif requests is not None:
+                    streams[seed, iteration] = list(requests)
+                else:
+                    stream_seed = seed if seed is not None else random.randrange(2**32)
+                    streams[seed, iteration] = replay.generate_requests(
+                        laboratories, laboratory_tools, range(1, n_students + 1), stream_seed)
+        jobs = []
+        for university_class in university_classes:
+            for seed in seeds:
+                for iteration in range(iterations):
+                    jobs.append({
+                        "university_class": university_class,
+                        "laboratories": laboratories,
+                        "laboratory_tools": laboratory_tools,
+                        "requests": streams[seed, iteration],
+                        "time_scale": time_scale,
+                        "iteration": iteration,
+                        "seed": seed,
+                        "workers": workers,
+                        "keep_university": False,
+                        "contention": contention,
+                        "options": (strategy_options or {}).get(university_class, {}),
+                    })
+        if keep_last and jobs:
+            jobs[-1]["keep_university"] = True
+        return jobs
+
+    def run_jobs(self, jobs: list[dict]):
+        """Runs the jobs and returns their results in the same order."""
+        if self.processes == 1 or len(jobs) == 1:
+            return [run_comparison_job(job) for job in jobs]
+        # "spawn": los procesos hijos no heredan los hilos ni la interfaz gráfica del padre
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(self.processes, len(jobs)), mp_context=context) as executor:
+            return list(executor.map(run_comparison_job, jobs))
+
+    def run(self, university_classes, laboratories, laboratory_tools, n_students: int, iterations: int,
+            seeds: list[int | None] | None = None, workers: int | None = None, keep_last: bool = False,
+            contention: bool = False, requests=None, time_scale: float = 1.0, strategy_options: dict | None = None):
+        """Compares the strategies and returns, per strategy name, the statistics of every run
+        ("runs"), their merge ("merged"), a summary with latency percentiles ("summary"), the
+        averaged lock contention per resource ("contention", with `contention`) and, with
+        `keep_last`, a snapshot of the last university. `requests` replays a fixed request stream
+        (see controllers.replay), or the stream returned for each seed, instead of generating one per seed."""
+        jobs = self.build_jobs(university_classes, laboratories, laboratory_tools, n_students,
+                               iterations, seeds, workers, keep_last, contention, requests, time_scale,
+                               strategy_options)
+        results = {}
+        for result in self.run_jobs(jobs):
+            entry = results.setdefault(result["strategy"], {"runs": [], "merged": {}, "university": None})
+            entry["runs"].append(result)
+            if "university" in result:
+                entry["university"] = result["university"]
+        for entry in results.values():
+            entry["merged"] = merge_stats([run["stats"] for run in entry["runs"]])
+            entry["summary"] = summarize_runs(entry["runs"])
+            entry["contention"] = merge_contention([run["contention"] for run in entry["runs"]])
+        return results
@@ -0,0 +1,141 @@
+import asyncio
+import random
+import threading
+from queue import Queue
+from time import perf_counter, sleep
+
+import numpy as np
+
+from controllers.booking_runner import throughput
+from models.registry import ANY_LABORATORY
+from models.trace import CREATE, LABORATORY, REQUEST, TOOL, read_trace
+
+# ---------------------------------------------------------------
+# Deterministic replay of a request stream. A request is the tuple
+# (student_id, arrival, room_id, tool_ids) used by the discrete-event
+# simulation; arrival is the offset in seconds from the start of the run.
+# A room_id of ANY_LABORATORY asks for any laboratory offering the tools.
+# The same stream can be driven through every strategy, so the differences
+# between runs come from the strategy and not from the workload.
+# ---------------------------------------------------------------
+
+def generate_requests(laboratories, laboratory_tools, student_ids, seed: int | None = None):
+    """One request per student drawn like University.random_booking (random laboratory and 3 random tools),
+    all arriving at t=0, with a private random generator: the same seed gives the same stream."""
+    rng = random.Random(seed)
+    room_ids = [laboratory.id for laboratory in laboratories]
+    tool_ids = [tool.id for tool in laboratory_tools]
+    if not tool_ids:
+        raise ValueError("No available tools to book")
+    return [(student_id, 0.0, rng.choice(room_ids), tuple(rng.sample(tool_ids, k=min(3, len(tool_ids)))))
+            for student_id in student_ids]
+
+def requests_from_trace(path: str):
+    """Rebuilds the request stream recorded in a binary trace (University.enable_trace): one request per
+    create event, with its student, requested laboratory and tools and its offset from the first one."""
+    events = read_trace(path)
+    creates = events[events["event"] == CREATE]
+    if len(creates) == 0:
+        return []
+    start = creates["timestamp"].min()
+    requested = events[events["event"] == REQUEST]
+    rooms, tools = {}, {}
+    for booking_id, kind, resource_id in zip(requested["booking_id"].tolist(), requested["resource_kind"].tolist(),
+                                             requested["resource_id"].tolist()):
+        if kind == LABORATORY:
+            rooms[booking_id] = resource_id
+        elif kind == TOOL:
+            tools.setdefault(booking_id, []).append(resource_id)
+    order = np.argsort(creates["booking_id"], kind="stable")
+    return [(student_id, (timestamp - start) / 1e9, rooms.get(booking_id, 0), tuple(tools.get(booking_id, [])))
+            for booking_id, student_id, timestamp in zip(creates["booking_id"][order].tolist(),
+                                                          creates["resource_id"][order].tolist(),
+                                                          creates["timestamp"][order].tolist())]
+
+def book(university, student_id: int, room_id: int, tool_ids):
+    """Sends one request to the university: to_book, or to_book_any for an ANY_LABORATORY request."""
+    if room_id == ANY_LABORATORY:
+        return university.to_book_any(student_id, list(tool_ids))
+    return university.to_book(student_id, room_id, list(tool_ids))
+
+def replay(university, requests, workers: int | None = None, time_scale: float = 1.0):
+    """Sends every request to `university` at its arrival offset (multiplied by `time_scale`; 0 sends them all
+    at once) and returns the throughput of the run. Without `workers` each request gets its own thread;
+    with it, that many threads serve the requests in arrival order. Asyncio strategies use one coroutine per request.
+    A list is sorted by arrival first; any other iterable (a Workload, a generator) must already be in
+    arrival order and is consumed lazily, so it is never held in memory."""
+    if isinstance(requests, list):
+        requests = sorted(requests, key=lambda request: request[1])
+    if asyncio.iscoroutinefunction(university.to_book):
+        return asyncio.run(async_replay(university, requests, time_scale))
+
+    start = perf_counter()
+
+    def wait_arrival(arrival):
+        # Esperar hasta el instante de llegada de la solicitud
+        delay = start + arrival * time_scale - perf_counter()
+        if delay > 0:
+            sleep(delay)
+
+    def send(student_id, arrival, room_id, tool_ids):
+        wait_arrival(arrival)
+        book(university, student_id, room_id, tool_ids)
+
+    sent = 0
+    if workers:
+        if isinstance(requests, list):
+            workers = max(1, min(workers, len(requests)))
+        # Cola acotada: los trabajadores consumen la secuencia a medida que se genera
+        queue: Queue = Queue(maxsize=4 * workers)
+
+        def worker():
+            while (request := queue.get()) is not None:
+                send(*request)
+
+        threads = [threading.Thread(target=worker) for _ in range(workers)]
+        for t in threads:
+            t.start()
+        for request in requests:
+            queue.put(request)
+            sent += 1
+        for _ in threads:
+            queue.put(None)  # Una marca de fin por trabajador
+    else:
+        # Cada hilo se crea al llegar su solicitud; los hilos terminados no se conservan
+        threads = []
+        for request in requests:
+            wait_arrival(request[1])
+            t = threading.Thread(target=book, args=(university, request[0], request[2], request[3]))
+            t.start()
+            threads.append(t)
+            sent += 1
+            if sent % 1024 == 0:
+                threads = [t for t in threads if t.is_alive()]
+        workers = sent
+
+    for t in threads:
+        t.join()
+    return throughput(sent, workers, perf_counter() - start)
+
+async def async_replay(university, requests, time_scale: float = 1.0):
+    """Replays the requests with one coroutine per request on the running event loop (UniversityAsync).
+    Each coroutine is created when its request arrives."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    begin = perf_counter()
+    pending = set()
+    sent = 0
+    for student_id, arrival, room_id, tool_ids in requests:
+        delay = start + arrival * time_scale - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        task = asyncio.ensure_future(book(university, student_id, room_id, tool_ids))
+        pending.add(task)
+        task.add_done_callback(pending.discard)
+        sent += 1
+        # Cede el turno para que las reservas avancen mientras se generan las solicitudes
+        if sent % 1024 == 0:
+            await asyncio.sleep(0)
+    if pending:
+        await asyncio.gather(*pending)
+    return throughput(sent, 1, perf_counter() - begin)
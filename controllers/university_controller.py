@@ -1,23 +1,48 @@
 from views.university_view import show_booking_result
 from views.pending_bookings_graph import PendingBookingsGraph
 from views.booking_stats_table import BookingStatsTable
-import threading
 from models.university import University
+from controllers import booking_runner, replay
+from models.simulation.discrete_event import DiscreteEventSimulation
 
 class UniversityController:
     """Controller for managing university lab bookings."""
     def __init__(self, university):
         self.university = university
+        # Rendimiento de la última ejecución concurrente
+        self.last_run: dict | None = None
+        # Grafo de reservas pendientes: se actualiza en cada llamada en lugar de reconstruirse
+        self.pending_graph: PendingBookingsGraph | None = None
 
     def change_university(self, university):
         """Changes the university instance."""
+        if self.pending_graph is not None:
+            # El grafo anterior deja de observar las reservas de la universidad anterior
+            self.university.bookings.observer = None
         self.university = university
+        self.pending_graph = None
 
     def book_lab(self, student_id, room_id, tool_ids):
         """Books a laboratory room and tools for a student."""
         id = self.university.to_book(student_id, room_id, tool_ids)
         show_booking_result(f"Reserva realizada con id {id}")
 
+    def book_slot(self, student_id, room_id, tool_ids, start, end):
+        """Books a laboratory room and tools for a student in the slot [start, end)."""
+        id = self.university.book_slot(student_id, room_id, tool_ids, start, end)
+        show_booking_result(f"Reserva realizada con id {id}")
+        return id
+
+    def book_any_laboratory(self, student_id, tool_ids, preferred_room_id=None):
+        """Books the tools for a student in any laboratory that offers them."""
+        id = self.university.to_book_any(student_id, tool_ids, preferred_room_id)
+        show_booking_result(f"Reserva realizada con id {id}")
+        return id
+
+    def first_free_slot(self, room_id, tool_ids, duration, after=None):
+        """Returns the start of the first free slot of the room and tools with the given duration."""
+        return self.university.first_free_slot(room_id, tool_ids, duration, after)
+
     def use_booking(self, id_booking):
         """Marks a booking as in use."""
         self.university.use_booking(id_booking)
@@ -36,14 +61,19 @@ class UniversityController:
         
     def show_pending_bookings_graph(self):
         """Displays a graph of pending bookings and their requested resources."""
-        pending_bookings = self.university.get_pending_bookings()
-        graph = PendingBookingsGraph(
-            pending_bookings,
-            self.university.laboratories,
-            self.university.laboratory_tools
-        )
-        graph.build_graph()
-        graph.draw()
+        if self.pending_graph is None:
+            self.pending_graph = PendingBookingsGraph(
+                [],
+                self.university.laboratories,
+                self.university.laboratory_tools
+            )
+            # Se observa el almacén antes de recorrerlo: un cambio durante el recorrido se aplica en el siguiente dibujo
+            self.pending_graph.watch(self.university.bookings)
+            self.pending_graph.sync(self.university.get_pending_bookings())
+        else:
+            # Solo se actualizan las reservas que cambiaron desde el último dibujo; la disposición se reutiliza
+            self.pending_graph.apply_changes()
+        self.pending_graph.draw()
 
     def show_booking_stats(self):
         """Displays booking statistics in a table format."""
@@ -54,17 +84,63 @@ class UniversityController:
 
     def get_statistics(self):
         """Returns the booking statistics."""
-        show_booking_result(self.university.get_booking_stats())
-        return self.university.get_booking_stats()
+        stats = self.university.get_booking_stats()
+        show_booking_result(stats)
+        return stats
+
+    def enable_contention_metrics(self):
+        """Starts recording the lock contention of every laboratory, tool and strategy lock."""
+        return self.university.enable_contention_metrics()
+
+    def get_contention_stats(self):
+        """Returns the lock contention counters per resource (empty if they are not enabled)."""
+        return self.university.get_contention_stats()
+
+    def enable_trace(self, path: str):
+        """Starts recording every booking transition in a binary trace file."""
+        return self.university.enable_trace(path)
+
+    def close_trace(self):
+        """Flushes and closes the trace of the bookings."""
+        self.university.close_trace()
+
+    def concurrent_ramdom_bookings(self, studens_ids, workers: int | None = None):
+        """Books laboratories concurrently for a list of students and returns the throughput of the run.
+        With `workers` the requests go through a queue served by that many threads;
+        without it one thread is created per student."""
+        self.last_run = booking_runner.random_bookings(self.university, studens_ids, workers)
+        return self.last_run
+
+    def pooled_random_bookings(self, studens_ids, workers: int):
+        """Books laboratories for a list of students with a fixed pool of worker threads fed by a request queue."""
+        self.last_run = booking_runner.pooled_random_bookings(self.university, studens_ids, workers)
+        return self.last_run
+
+    def run_workload(self, workload, workers: int | None = None, time_scale: float = 1.0):
+        """Sends the requests of a workload (controllers.workload.Workload or any request stream
+        in arrival order) to the university as they are generated and returns the throughput."""
+        self.last_run = replay.replay(self.university, workload, workers, time_scale)
+        return self.last_run
+
+    async def async_random_bookings(self, studens_ids):
+        """Books laboratories concurrently with one coroutine per student on the running event loop.
+        Requires an asyncio strategy (UniversityAsync)."""
+        self.last_run = await booking_runner.async_random_bookings(self.university, studens_ids)
+        return self.last_run
 
-    def concurrent_ramdom_bookings(self, studens_ids):
-        """Creates multiple threads to book laboratories concurrently for a list of students."""
-        threads = []
+    def get_throughput(self):
+        """Returns the throughput of the last concurrent run."""
+        show_booking_result(self.last_run)
+        return self.last_run
 
-        for student_id in studens_ids:
-            t = threading.Thread(target=self.random_book, args=(student_id,))
-            threads.append(t)
-            t.start()
+    def simulate_random_bookings(self, studens_ids, seed=None):
+        """Simulates one random booking per student in virtual time (discrete events, no threads)."""
+        simulation = DiscreteEventSimulation(self.university, seed)
+        simulation.run(simulation.random_requests(studens_ids))
+        return simulation
 
-        for t in threads:
-            t.join()
+    def simulate_workload(self, workload):
+        """Simulates the requests of a workload in virtual time (discrete events, no threads)."""
+        simulation = DiscreteEventSimulation(self.university)
+        simulation.run(workload)
+        return simulation
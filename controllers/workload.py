@@ -0,0 +1,179 @@
+import random
+from bisect import bisect_right
+from collections import deque
+from itertools import accumulate, count
+
+from models.registry import ANY_LABORATORY
+
+# ---------------------------------------------------------------
+# Configurable workloads. A Workload yields requests lazily in arrival order
+# as the (student_id, arrival, room_id, tool_ids) tuples of controllers.replay
+# and the discrete-event simulation, so millions of requests can be fed to a
+# university without building them in memory. Every aspect of the stream
+# (arrivals, students, laboratories, tools, sizes, units, repeats, any-laboratory
+# requests) draws from its own
+# generator seeded from the workload seed: changing one distribution does not
+# change the others, and iterating the workload again gives the same stream.
+# ---------------------------------------------------------------
+
+ARRIVALS = ("instant", "poisson", "bursty")
+STREAMS = ("arrival", "student", "laboratory", "tool", "size", "repeat", "units", "any")
+
+def zipf_weights(n: int, skew: float):
+    """Weights 1/rank^skew of n items ranked 1..n; skew 0 is uniform."""
+    return [1.0 / rank ** skew for rank in range(1, n + 1)]
+
+class Workload:
+    """Lazy request stream for the laboratories and tools of a university.
+
+    - requests: number of requests (None: endless stream).
+    - arrivals: "instant" (all at t=0, like random_booking), "poisson" (exponential gaps at `rate`
+      requests per second) or "bursty" (bursts of `burst_size` requests on average, separated by
+      exponential gaps so the mean rate is still `rate`, with `burst_gap` seconds between the
+      requests of a burst).
+    - tool_skew: Zipf exponent of the tool popularity, in the order of `laboratory_tools` (0: uniform).
+    - laboratory_weights: popularity of each laboratory, by ID (default: uniform).
+    - request_sizes: weight of each number of distinct tools per request (default: always 3, like random_booking).
+    - tool_units: weight of each number of units asked of every tool, capped by its capacity (default: one
+      unit). A tool asked k units appears k times in tool_ids.
+    - any_laboratory_probability: chance that a request accepts any laboratory offering its tools
+      (room_id ANY_LABORATORY). Its tools are drawn uniformly among those of the drawn laboratory,
+      so at least that one is compatible.
+    - repeat_probability: chance that a request is a repeat booking: one of the last `repeat_window`
+      requests is booked again by the same student, with the same laboratory and tools.
+    """
+    def __init__(self, laboratories, laboratory_tools, student_ids, requests: int | None = None,
+                 seed: int | None = None, arrivals: str = "instant", rate: float = 100.0,
+                 burst_size: float = 10.0, burst_gap: float = 0.001, tool_skew: float = 0.0,
+                 laboratory_weights: dict[int, float] | None = None, request_sizes: dict[int, float] | None = None,
+                 repeat_probability: float = 0.0, repeat_window: int = 1000,
+                 tool_units: dict[int, float] | None = None, any_laboratory_probability: float = 0.0):
+        if arrivals not in ARRIVALS:
+            raise ValueError(f"Unknown arrival process {arrivals!r}")
+        if rate <= 0 or burst_size < 1 or burst_gap < 0:
+            raise ValueError("rate must be positive, burst_size at least 1 and burst_gap non-negative")
+        if not 0.0 <= repeat_probability <= 1.0 or not 0.0 <= any_laboratory_probability <= 1.0:
+            raise ValueError("repeat_probability and any_laboratory_probability must be between 0 and 1")
+        self.room_ids = [laboratory.id for laboratory in laboratories]
+        self.tool_ids = [tool.id for tool in laboratory_tools]
+        self.tool_capacities = {tool.id: tool.capacity for tool in laboratory_tools}
+        # Herramientas existentes de cada laboratorio, para las solicitudes de cualquier laboratorio
+        self.room_tools = {laboratory.id: [tool_id for tool_id in laboratory.tools if tool_id in self.tool_capacities]
+                           for laboratory in laboratories}
+        self.student_ids = list(student_ids)
+        if not self.room_ids or not self.student_ids:
+            raise ValueError("A workload needs laboratories and students")
+        if not self.tool_ids:
+            raise ValueError("No available tools to book")
+        self.requests = requests
+        # Sin semilla se elige una al crear la carga: cada recorrido repite la misma secuencia
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.arrivals = arrivals
+        self.rate = rate
+        self.burst_size = burst_size
+        self.burst_gap = burst_gap
+        self.tool_skew = tool_skew
+        # Pesos acumulados para elegir con bisect en lugar de recorrer los pesos en cada solicitud
+        laboratory_weights = laboratory_weights or {}
+        self.room_weights = list(accumulate(laboratory_weights.get(room_id, 1.0) for room_id in self.room_ids))
+        self.tool_weights = list(accumulate(zipf_weights(len(self.tool_ids), tool_skew)))
+        request_sizes = request_sizes or {3: 1.0}
+        self.sizes = [min(size, len(self.tool_ids)) for size in request_sizes]
+        self.size_weights = list(accumulate(request_sizes.values()))
+        if min(self.sizes) < 1:
+            raise ValueError("Requests need at least one tool")
+        tool_units = tool_units or {1: 1.0}
+        self.units = list(tool_units)
+        self.unit_weights = list(accumulate(tool_units.values()))
+        if min(self.units) < 1:
+            raise ValueError("Requests need at least one unit of each tool")
+        self.any_laboratory_probability = any_laboratory_probability
+        self.repeat_probability = repeat_probability
+        self.repeat_window = repeat_window
+
+    def __iter__(self):
+        return self.generate()
+
+    def __len__(self):
+        if self.requests is None:
+            raise TypeError("An endless workload has no length")
+        return self.requests
+
+    def stream(self, name: str):
+        """Random generator of one aspect of the workload. Seeding with a string is deterministic
+        across processes, unlike hash() of a tuple."""
+        return random.Random(f"{self.seed}:{name}")
+
+    def generate(self):
+        """Yields the requests in arrival order."""
+        rng = {name: self.stream(name) for name in STREAMS}
+        arrivals = self.arrival_times(rng["arrival"])
+        # Solicitudes recientes que se pueden repetir
+        recent: deque = deque(maxlen=self.repeat_window)
+        for _ in range(self.requests) if self.requests is not None else count():
+            arrival = next(arrivals)
+            if recent and rng["repeat"].random() < self.repeat_probability:
+                student_id, room_id, tool_ids = recent[rng["repeat"].randrange(len(recent))]
+            else:
+                student_id = rng["student"].choice(self.student_ids)
+                room_id = self.room_ids[self.pick(rng["laboratory"], self.room_weights)]
+                size = self.sizes[self.pick(rng["size"], self.size_weights)]
+                if (self.any_laboratory_probability and self.room_tools[room_id]
+                        and rng["any"].random() < self.any_laboratory_probability):
+                    room_tools = self.room_tools[room_id]
+                    tool_ids = tuple(rng["tool"].sample(room_tools, k=min(size, len(room_tools))))
+                    room_id = ANY_LABORATORY
+                else:
+                    tool_ids = self.sample_tools(rng["tool"], size)
+                if self.units != [1]:
+                    tool_ids = self.with_units(rng["units"], tool_ids)
+                if self.repeat_probability:
+                    recent.append((student_id, room_id, tool_ids))
+            yield student_id, arrival, room_id, tool_ids
+
+    def arrival_times(self, rng: random.Random):
+        """Endless sequence of arrival times of the configured arrival process."""
+        arrival = 0.0
+        if self.arrivals == "instant":
+            while True:
+                yield arrival
+        if self.arrivals == "poisson":
+            while True:
+                yield arrival
+                arrival += rng.expovariate(self.rate)
+        # Ráfagas: el tamaño es geométrico con media burst_size y los inicios se separan para mantener la tasa media
+        burst_rate = self.rate / self.burst_size
+        while True:
+            size = 1
+            while rng.random() > 1.0 / self.burst_size:
+                size += 1
+            for i in range(size):
+                yield arrival + i * self.burst_gap
+            arrival += (size - 1) * self.burst_gap + rng.expovariate(burst_rate)
+
+    @staticmethod
+    def pick(rng: random.Random, cumulative_weights: list[float]):
+        """Index drawn with the given cumulative weights."""
+        return bisect_right(cumulative_weights, rng.random() * cumulative_weights[-1])
+
+    def with_units(self, rng: random.Random, tool_ids: tuple):
+        """Repeats every tool as many times as the units drawn for it, up to its capacity."""
+        return tuple(tool_id for tool_id in tool_ids
+                     for _ in range(min(self.units[self.pick(rng, self.unit_weights)], self.tool_capacities[tool_id])))
+
+    def sample_tools(self, rng: random.Random, size: int):
+        """`size` distinct tools drawn by popularity. Repeated draws are discarded; when the
+        popular tools make that slow, the rest are drawn among the tools not chosen yet."""
+        if self.tool_skew == 0:
+            return tuple(rng.sample(self.tool_ids, k=size))
+        chosen = {}
+        for _ in range(4 * size):
+            chosen[self.tool_ids[self.pick(rng, self.tool_weights)]] = None
+            if len(chosen) == size:
+                return tuple(chosen)
+        remaining = [i for i, tool_id in enumerate(self.tool_ids) if tool_id not in chosen]
+        weights = zipf_weights(len(self.tool_ids), self.tool_skew)
+        while len(chosen) < size:
+            cumulative = list(accumulate(weights[i] for i in remaining))
+            chosen[self.tool_ids[remaining.pop(self.pick(rng, cumulative))]] = None
+        return tuple(chosen)
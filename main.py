@@ -4,6 +4,9 @@ from models.concurrence_control.university_mutex import UniversityMutex
 from models.concurrence_control.university_release import UniversityRelease
 from models.concurrence_control.university_prevention import UniversityPrevention
 from models.concurrence_control.university_banker import UniversityBanker
+from models.concurrence_control.university_ordered import UniversityOrdered
+from models.concurrence_control.university_async import UniversityAsync
+from models.concurrence_control.university_detection import UniversityDetection
 
 from models.laboratory import Laboratory
 from models.laboratory_tool import LaboratoryTool
@@ -84,7 +87,8 @@ def main():
 
     university_classes = [
         University, UniversityMutexAbroad, UniversityMutex,
-        UniversityRelease, UniversityPrevention, UniversityBanker
+        UniversityRelease, UniversityPrevention, UniversityBanker,
+        UniversityOrdered, UniversityAsync, UniversityDetection
     ]
     controller = UniversityController(university)
     gui = SimulationGUI(controller, university_classes)
@@ -1,6 +1,13 @@
+from array import array
 from enum import Enum, auto
+from itertools import count
+from threading import Lock
 from time import time
 
+import numpy as np
+
+from .trace import APPROVE, CANCEL, CREATE, FINISH, IN_USE, LABORATORY, REJECT, REQUEST, ROOM_ACQUIRED, STUDENT, TOOL, TOOL_ACQUIRED
+
 class StatusBooking(Enum):
     "Enumeration of possible booking statuses"
     PENDING = auto()
@@ -10,87 +17,562 @@ class StatusBooking(Enum):
     IN_USE = auto()
     FINISHED = auto()
 
+# Estado por código (el código es el valor del Enum)
+STATUS_BY_CODE = {status.value: status for status in StatusBooking}
+# Byte de estado: los 3 bits bajos son el código del estado, el bit 3 indica laboratorio asignado
+STATUS_BITS = 0b0111
+ROOM_ASSIGNED = 0b1000
+# Estados finales (por código): las herramientas de la reserva ya no cambian y se compactan
+FINAL_CODES = frozenset(status.value for status in (StatusBooking.REJECTED, StatusBooking.CANCELLED, StatusBooking.FINISHED))
+# Las herramientas con ID en [0, 64) se guardan como bits de un entero de 64 bits
+MASK_BITS = 64
+# Evento de la traza de cada cambio de estado, por código de estado (0: sin evento)
+STATUS_EVENTS = [0] * (max(STATUS_BY_CODE) + 1)
+for status, event in ((StatusBooking.APPROVED, APPROVE), (StatusBooking.REJECTED, REJECT),
+                      (StatusBooking.CANCELLED, CANCEL), (StatusBooking.IN_USE, IN_USE),
+                      (StatusBooking.FINISHED, FINISH)):
+    STATUS_EVENTS[status.value] = event
+
+class BookingShard:
+    """Struct-of-arrays block of bookings: one typed column per field instead of one Python object per
+    booking, with its own lock. Booking objects are thin views (shard, row) over it. Row r of shard s
+    holds the booking with ID first_id + r * stride + s."""
+    def __init__(self, index: int, stride: int, first_id: int, clock=time, stats=None):
+        # Protege el alta de filas: todas las columnas crecen juntas
+        self.lock = Lock()
+        # Posición del fragmento y número de fragmentos: determinan los IDs de sus filas
+        self.index = index
+        self.stride = stride
+        self.first_id = first_id
+        # Reloj usado para los tiempos (reloj real o reloj virtual de la simulación)
+        self.clock = clock
+        # Estadísticas que se actualizan en cada cambio de estado (None si no se registran)
+        self.stats = stats
+        # Traza binaria de las transiciones (None si no se registra)
+        self.trace = None
+        # Función que recibe el ID de cada reserva creada o modificada (None si nadie observa)
+        self.observer = None
+        # Filas ocupadas (puede haber huecos de IDs ya asignados que aún no se escribieron)
+        self.count = 0
+        # Índice estudiante -> filas de sus reservas, en orden de alta
+        self.user_rows: dict[int, array] = {}
+
+        # Columnas (una posición por reserva)
+        self.user_ids = array("i")          # int32
+        self.room_ids = array("i")          # int32: solicitado o asignado según ROOM_ASSIGNED
+        self.statuses = array("b")          # int8: código de estado | ROOM_ASSIGNED (0: fila vacía)
+        self.reference_times = array("d")   # float64: momento de creación
+        self.end_times = array("d")         # float64: relativo a reference_time
+        self.approved_times = array("d")    # float64: relativo a reference_time
+        # Franja [inicio, fin) de las reservas a futuro (0, 0: reserva inmediata, sin franja)
+        self.slot_starts = array("d")       # float64
+        self.slot_ends = array("d")         # float64
+        # Herramientas asignadas y solicitadas de las reservas compactadas, como máscaras de bits
+        self.tool_masks = array("Q")
+        self.solicited_masks = array("Q")
+        # Listas de herramientas de las reservas activas (y de las que no caben en una máscara):
+        # fila -> (asignadas, solicitadas). Se guardan las mismas listas recibidas
+        self.tool_lists: dict[int, tuple[list[int], list[int]]] = {}
+
+    def put(self, row: int, user_id: int, room_id: int, tool_ids: list[int], slot: tuple[float, float] | None = None):
+        """Writes a pending booking in a row, growing the columns if needed."""
+        slot_start, slot_end = slot or (0.0, 0.0)
+        with self.lock:
+            size = len(self.statuses)
+            if row >= size:
+                if row > size:
+                    # Otro hilo con un ID menor de este fragmento escribirá después: dejar su fila vacía
+                    self.pad(row - size)
+                self.user_ids.append(user_id)
+                self.room_ids.append(room_id)
+                self.statuses.append(StatusBooking.PENDING.value)
+                self.reference_times.append(self.clock())
+                self.end_times.append(0.0)
+                self.approved_times.append(0.0)
+                self.slot_starts.append(slot_start)
+                self.slot_ends.append(slot_end)
+                self.tool_masks.append(0)
+                self.solicited_masks.append(0)
+            else:
+                self.user_ids[row] = user_id
+                self.room_ids[row] = room_id
+                self.statuses[row] = StatusBooking.PENDING.value
+                self.reference_times[row] = self.clock()
+                self.slot_starts[row] = slot_start
+                self.slot_ends[row] = slot_end
+            self.tool_lists[row] = ([], tool_ids)
+            self.count += 1
+            rows = self.user_rows.get(user_id)
+            if rows is None:
+                rows = self.user_rows[user_id] = array("q")
+            rows.append(row)
+
+    def pad(self, rows: int):
+        """Adds empty rows (status 0) at the end of the columns."""
+        for column in (self.user_ids, self.room_ids, self.statuses, self.tool_masks, self.solicited_masks):
+            column.extend([0] * rows)
+        for column in (self.reference_times, self.end_times, self.approved_times, self.slot_starts, self.slot_ends):
+            column.extend([0.0] * rows)
+
+    def booking_id(self, row: int):
+        return self.first_id + row * self.stride + self.index
+
+    def rows_by_user(self, user_id: int):
+        """Returns the occupied rows of a user from the user index, without scanning the shard."""
+        with self.lock:
+            rows = self.user_rows.get(user_id)
+            return rows.tolist() if rows is not None else []
+
+    def columns(self):
+        """Returns a copy of the occupied rows as NumPy arrays."""
+        with self.lock:
+            statuses = np.array(self.statuses, dtype=np.int8)
+            occupied = statuses != 0
+            rows = np.arange(len(statuses), dtype=np.int64)
+            return {
+                "booking_id": (self.first_id + rows * self.stride + self.index)[occupied],
+                "user_id": np.array(self.user_ids, dtype=np.int32)[occupied],
+                "room_id": np.array(self.room_ids, dtype=np.int32)[occupied],
+                "room_assigned": ((statuses & ROOM_ASSIGNED) != 0)[occupied],
+                "status": (statuses & STATUS_BITS)[occupied],
+                "reference_time": np.array(self.reference_times, dtype=np.float64)[occupied],
+                "end_time": np.array(self.end_times, dtype=np.float64)[occupied],
+                "approved_time": np.array(self.approved_times, dtype=np.float64)[occupied],
+                "slot_start": np.array(self.slot_starts, dtype=np.float64)[occupied],
+                "slot_end": np.array(self.slot_ends, dtype=np.float64)[occupied],
+            }
+
+    # ---------------------------------------------------------------
+    # Herramientas: listas mientras la reserva está activa, máscaras de bits al terminar
+    # ---------------------------------------------------------------
+
+    def tools(self, row: int):
+        """Returns the (assigned, solicited) tool lists of a row, unpacking them if they were compacted."""
+        lists = self.tool_lists.get(row)
+        if lists is None:
+            lists = (mask_to_ids(self.tool_masks[row]), mask_to_ids(self.solicited_masks[row]))
+        return lists
+
+    def editable_tools(self, row: int):
+        """Returns the tool lists of a row as lists kept by the shard, so they can be modified."""
+        lists = self.tool_lists.get(row)
+        if lists is None:
+            lists = self.tools(row)
+            self.tool_lists[row] = lists
+        return lists
+
+    def compact(self, row: int):
+        """Packs the tool lists of a finished row into bit masks when every ID fits."""
+        lists = self.tool_lists.get(row)
+        if lists is None:
+            return
+        tool_mask = ids_to_mask(lists[0])
+        solicited_mask = ids_to_mask(lists[1])
+        if tool_mask is not None and solicited_mask is not None:
+            self.tool_masks[row] = tool_mask
+            self.solicited_masks[row] = solicited_mask
+            del self.tool_lists[row]
+
+    def __getstate__(self):
+        """Copies and pickles the shard without the lock (a new one is created), the trace nor the observer."""
+        state = self.__dict__.copy()
+        del state["lock"]
+        state["trace"] = None
+        state["observer"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = Lock()
+
+class BookingStore:
+    """Booking log split in shards, each one with its own lock, so threads creating bookings at the
+    same time rarely wait for each other. IDs come from an atomic counter and are consecutive from
+    `first_id`; each ID maps to a fixed shard and row, so lookups by ID need no index."""
+    # Número de fragmentos por defecto
+    SHARDS = 16
+
+    def __init__(self, clock=time, stats=None, first_id: int = 1, shards: int | None = None):
+        self.first_id = first_id
+        # Estadísticas que se actualizan en cada cambio de estado (None si no se registran)
+        self.stats = stats
+        n_shards = shards or self.SHARDS
+        self.shards = [BookingShard(index, n_shards, first_id, clock, stats) for index in range(n_shards)]
+        # Asignador atómico de IDs: next() de itertools.count es una sola operación en C, no la
+        # interrumpe otro hilo (threading usa el mismo recurso para numerar sus hilos)
+        self.next_id = count(first_id).__next__
+        self._clock = clock
+        self._trace = None
+        self._observer = None
+
+    @property
+    def clock(self):
+        """Clock used for the booking times (real clock or the virtual clock of the simulation)."""
+        return self._clock
+
+    @clock.setter
+    def clock(self, clock):
+        self._clock = clock
+        for shard in self.shards:
+            shard.clock = clock
+
+    @property
+    def trace(self):
+        """Trace recorder of the booking transitions (None if they are not traced)."""
+        return self._trace
+
+    @trace.setter
+    def trace(self, trace):
+        self._trace = trace
+        for shard in self.shards:
+            shard.trace = trace
+
+    @property
+    def observer(self):
+        """Function called with the ID of every booking created or changed (None if nobody observes them).
+        It runs in the thread that made the change."""
+        return self._observer
+
+    @observer.setter
+    def observer(self, observer):
+        self._observer = observer
+        for shard in self.shards:
+            shard.observer = observer
+
+    def locate(self, booking_id: int):
+        """Returns the (shard, row) of a booking ID."""
+        row, index = divmod(booking_id - self.first_id, len(self.shards))
+        return self.shards[index], row
+
+    def create(self, user_id: int, room_id: int, tool_ids: list[int], slot: tuple[float, float] | None = None):
+        """Creates a pending booking with the next ID and returns its Booking view.
+        `slot` is the [start, end) of a booking for later. Only the lock of its shard is taken."""
+        booking_id = self.next_id()
+        shard, row = self.locate(booking_id)
+        shard.put(row, user_id, room_id, tool_ids, slot)
+        booking = Booking.view(shard, row)
+        if self.stats is not None:
+            self.stats.add(booking)
+        if self._trace is not None:
+            # La solicitud completa queda en la traza: estudiante, laboratorio y herramientas
+            record = self._trace.record
+            record(CREATE, booking_id, STUDENT, user_id)
+            record(REQUEST, booking_id, LABORATORY, room_id)
+            for tool_id in tool_ids:
+                record(REQUEST, booking_id, TOOL, tool_id)
+        if self._observer is not None:
+            self._observer(booking_id)
+        return booking
+
+    def find(self, booking_id: int):
+        """Returns the booking with the given ID or None if it does not exist."""
+        if booking_id < self.first_id:
+            return None
+        shard, row = self.locate(booking_id)
+        if row < len(shard.statuses) and shard.statuses[row] != 0:
+            return Booking.view(shard, row)
+        return None
+
+    def find_by_user(self, user_id: int):
+        """Returns the bookings of a user, in ID order. The rows come from the index of each shard,
+        so the cost depends on the bookings of the user and not on the size of the store."""
+        bookings = [Booking.view(shard, row) for shard in self.shards for row in shard.rows_by_user(user_id)]
+        bookings.sort(key=lambda booking: booking.booking_id)
+        return bookings
+
+    def last_id(self):
+        """Returns the highest ID written so far (first_id - 1 if there are no bookings)."""
+        last = self.first_id - 1
+        for shard in self.shards:
+            if shard.statuses:
+                last = max(last, shard.booking_id(len(shard.statuses) - 1))
+        return last
+
+    def rows(self):
+        """Yields the (shard, row) of every booking in ID order. IDs taken by a thread that has not
+        written them yet are skipped, also when their shard has not grown to that row."""
+        shards = self.shards
+        n_shards = len(shards)
+        for offset in range(self.last_id() - self.first_id + 1):
+            row, index = divmod(offset, n_shards)
+            shard = shards[index]
+            if row < len(shard.statuses) and shard.statuses[row] != 0:
+                yield shard, row
+
+    def columns(self):
+        """Returns a copy of the numeric columns of every booking as NumPy arrays, in ID order."""
+        parts = [shard.columns() for shard in self.shards]
+        columns = {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+        order = np.argsort(columns["booking_id"], kind="stable")
+        return {key: values[order] for key, values in columns.items()}
+
+    def __len__(self):
+        return sum(shard.count for shard in self.shards)
+
+    def __getitem__(self, position: int):
+        """Returns the booking at a position of the ID order (as in a list)."""
+        booking = self.find(self.first_id + position if position >= 0 else self.last_id() + 1 + position)
+        if booking is None:
+            raise IndexError("booking index out of range")
+        return booking
+
+    def __iter__(self):
+        for shard, row in self.rows():
+            yield Booking.view(shard, row)
+
+    def __getstate__(self):
+        """Pickles the store without the trace recorder (it writes to an open file) nor the observer."""
+        state = self.__dict__.copy()
+        state["_trace"] = None
+        state["_observer"] = None
+        return state
+
+def ids_to_mask(tool_ids: list[int]):
+    """Packs tool IDs into a bit mask. Returns None if an ID is out of range or repeated."""
+    mask = 0
+    for tool_id in tool_ids:
+        if not 0 <= tool_id < MASK_BITS:
+            return None
+        bit = 1 << tool_id
+        if mask & bit:
+            return None
+        mask |= bit
+    return mask
+
+def mask_to_ids(mask: int):
+    """Unpacks a bit mask into the list of tool IDs, in ascending order."""
+    tool_ids = []
+    while mask:
+        lowest = mask & -mask
+        tool_ids.append(lowest.bit_length() - 1)
+        mask ^= lowest
+    return tool_ids
+
 class Booking:
     "Represents a booking for a room and tools in a laboratory"
-    def __init__(self, booking_id: int, user_id: int, room_id_solicited , tool_ids_solicited):
+    # Vista sobre una fila de un BookingShard: no guarda datos propios
+    __slots__ = ("shard", "row")
+
+    def __init__(self, booking_id: int, user_id: int, room_id_solicited , tool_ids_solicited, clock=time, stats=None):
+        # Reserva suelta: su propio almacén de un fragmento
+        booking = BookingStore(clock=clock, stats=stats, first_id=booking_id, shards=1).create(
+            user_id, room_id_solicited, tool_ids_solicited)
+        self.shard = booking.shard
+        self.row = booking.row
+
+    @classmethod
+    def view(cls, shard: BookingShard, row: int):
+        """Returns a Booking over an existing row of a shard."""
+        booking = cls.__new__(cls)
+        booking.shard = shard
+        booking.row = row
+        return booking
+
+    # ---------------------------------------------------------------
+    # Campos de la reserva, leídos de las columnas del almacén
+    # ---------------------------------------------------------------
+
+    @property
+    def booking_id(self):
         # Identificador único de la reserva
-        self.booking_id = booking_id
+        return self.shard.booking_id(self.row)
+
+    @property
+    def user_id(self):
         # Identificador del usuario que realiza la reserva
-        self.user_id = user_id
+        return self.shard.user_ids[self.row]
+
+    @property
+    def room_id(self):
         # ID del laboratorio asignado (0 si aún no se ha asignado)
-        self.room_id = 0
-        # ID del laboratorio solicitado
-        self.room_id_solicited = room_id_solicited
+        return self.shard.room_ids[self.row] if self.shard.statuses[self.row] & ROOM_ASSIGNED else 0
+
+    @property
+    def room_id_solicited(self):
+        # ID del laboratorio solicitado (0 una vez asignado)
+        return 0 if self.shard.statuses[self.row] & ROOM_ASSIGNED else self.shard.room_ids[self.row]
+
+    @property
+    def tool_ids(self) -> list[int]:
         # Lista de herramientas asignadas
-        self.tool_ids: list[int] = []
+        return self.shard.tools(self.row)[0]
+
+    @property
+    def tool_ids_solicited(self) -> list[int]:
         # Lista de herramientas solicitadas eliminadas a medida que se van reservando
-        self.tool_ids_solicited: list[int] = tool_ids_solicited
+        return self.shard.tools(self.row)[1]
+
+    @property
+    def status(self):
         # Estado actual de la reserva
-        self.status = StatusBooking.PENDING
+        return STATUS_BY_CODE[self.shard.statuses[self.row] & STATUS_BITS]
+
+    @status.setter
+    def status(self, status: StatusBooking):
+        self.change_status(status)
+
+    @property
+    def clock(self):
+        # Reloj usado para los tiempos (reloj real o reloj virtual de la simulación)
+        return self.shard.clock
+
+    @property
+    def stats(self):
+        # Estadísticas que se actualizan en cada cambio de estado
+        return self.shard.stats
+
+    @property
+    def reference_time(self):
         # Tiempo de referencia (momento de creación de la reserva)
-        self.reference_time  = time() 
+        return self.shard.reference_times[self.row]
+
+    @property
+    def end_time(self):
         # Tiempo en que finaliza la reserva (relativo a reference_time)
-        self.end_time = 0
+        return self.shard.end_times[self.row]
+
+    @end_time.setter
+    def end_time(self, value: float):
+        self.shard.end_times[self.row] = value
+
+    @property
+    def approved_time(self):
         # Tiempo en que la reserva fue aprobada (relativo a reference_time)
-        self.approved_time = 0 
+        return self.shard.approved_times[self.row]
+
+    @approved_time.setter
+    def approved_time(self, value: float):
+        self.shard.approved_times[self.row] = value
+
+    @property
+    def slot(self):
+        # Franja (inicio, fin) reservada, o None si es una reserva inmediata
+        start, end = self.shard.slot_starts[self.row], self.shard.slot_ends[self.row]
+        return (start, end) if end > start else None
+
+    @slot.setter
+    def slot(self, slot: tuple[float, float]):
+        self.shard.slot_starts[self.row], self.shard.slot_ends[self.row] = slot
+
+    # ---------------------------------------------------------------
 
     def add_room(self, room_id: int):
         """Asigna un laboratorio a la reserva y limpia el solicitado."""
-        self.room_id = room_id
-        self.room_id_solicited = 0
+        self.shard.room_ids[self.row] = room_id
+        self.shard.statuses[self.row] |= ROOM_ASSIGNED
+        if self.shard.trace is not None:
+            self.shard.trace.record(ROOM_ACQUIRED, self.booking_id, LABORATORY, room_id)
+        if self.shard.observer is not None:
+            self.shard.observer(self.booking_id)
 
     def add_tool(self, tool_id: int):
-        """Agrega una herramienta a la reserva si no está incluida y la elimina de las solicitadas."""
-        if tool_id not in self.tool_ids:
-            self.tool_ids.append(tool_id)
-            self.remove_tool_solicited(tool_id)
+        """Agrega una unidad de la herramienta a la reserva si quedaba solicitada y la elimina de las solicitadas.
+        Una herramienta pedida k veces son k unidades."""
+        tool_ids, solicited = self.shard.editable_tools(self.row)
+        if tool_id in solicited:
+            tool_ids.append(tool_id)
+            solicited.remove(tool_id)
+            if self.shard.trace is not None:
+                self.shard.trace.record(TOOL_ACQUIRED, self.booking_id, TOOL, tool_id)
+            if self.shard.observer is not None:
+                self.shard.observer(self.booking_id)
+        self.compact_if_final()
 
     def remove_tool(self, tool_id: int):
         """Elimina una herramienta de la reserva si está incluida."""
-        if tool_id in self.tool_ids:
-            self.tool_ids.remove(tool_id)
+        tool_ids, _ = self.shard.editable_tools(self.row)
+        if tool_id in tool_ids:
+            tool_ids.remove(tool_id)
+            if self.shard.observer is not None:
+                self.shard.observer(self.booking_id)
+        self.compact_if_final()
 
     def remove_tool_solicited(self, tool_id: int):
         """Elimina una herramienta de la lista de solicitadas."""
-        self.tool_ids_solicited.remove(tool_id)
+        self.shard.editable_tools(self.row)[1].remove(tool_id)
+        if self.shard.observer is not None:
+            self.shard.observer(self.booking_id)
+        self.compact_if_final()
 
     def approve(self):
         """Cambia el estado a APROBADA y registra el tiempo de aprobación."""
-        self.status = StatusBooking.APPROVED
-        self.approved_time = (time() - self.reference_time) 
+        self.approved_time = (self.clock() - self.reference_time)
+        self.change_status(StatusBooking.APPROVED)
 
     def reject(self):
         """Cambia el estado a RECHAZADA y registra el tiempo de finalización."""
-        self.status = StatusBooking.REJECTED
-        self.end_time = (time() - self.reference_time)
+        self.set_end_time()
+        self.change_status(StatusBooking.REJECTED)
         #print(f"[DEBUG] Booking {self.booking_id} rejected at {self.end_time}, total time: {self.end_time - self.reference_time:.2f} seconds")
 
     def cancel(self):
         """Cambia el estado a CANCELADA."""
-        self.status = StatusBooking.CANCELLED
+        self.change_status(StatusBooking.CANCELLED)
 
     def finish(self):
         """Cambia el estado a FINALIZADA y registra el tiempo de finalización."""
-        self.status = StatusBooking.FINISHED
-        self.end_time = (time() - self.reference_time)  
+        self.set_end_time()
+        self.change_status(StatusBooking.FINISHED)
 
     def in_use(self):
         """Cambia el estado a EN USO."""
-        self.status = StatusBooking.IN_USE
+        self.change_status(StatusBooking.IN_USE)
+
+    def change_status(self, status: StatusBooking):
+        """Cambia el estado y actualiza las estadísticas."""
+        shard, row = self.shard, self.row
+        code = shard.statuses[row]
+        previous = STATUS_BY_CODE[code & STATUS_BITS]
+        # _value_ evita el descriptor de Enum.value (esto se ejecuta en cada transición)
+        shard.statuses[row] = (code & ROOM_ASSIGNED) | status._value_
+        if shard.stats is not None:
+            shard.stats.status_changed(self, previous, status)
+        if shard.trace is not None and STATUS_EVENTS[status._value_]:
+            shard.trace.record(STATUS_EVENTS[status._value_], self.booking_id)
+        if status._value_ in FINAL_CODES:
+            shard.compact(row)
+        if shard.observer is not None:
+            shard.observer(self.booking_id)
+
+    def compact_if_final(self):
+        """Compacta las herramientas de la reserva si ya terminó."""
+        if self.shard.statuses[self.row] & STATUS_BITS in FINAL_CODES:
+            self.shard.compact(self.row)
+
+    def set_end_time(self):
+        """Registra el tiempo de finalización y actualiza las estadísticas."""
+        shard, row = self.shard, self.row
+        previous = shard.end_times[row]
+        end_time = shard.clock() - shard.reference_times[row]
+        shard.end_times[row] = end_time
+        if shard.stats is not None:
+            shard.stats.end_time_changed(previous, end_time)
 
     def is_active(self):
         """Verifica si la reserva está activa (no cancelada ni finalizada)."""
         return self.status not in {StatusBooking.CANCELLED, StatusBooking.FINISHED}
-    
+
     def get_status(self):
         """Devuelve el estado actual de la reserva como string."""
         return self.status.name
-    
+
+    def __eq__(self, other):
+        # Dos vistas son la misma reserva si apuntan a la misma fila del mismo fragmento
+        return isinstance(other, Booking) and self.shard is other.shard and self.row == other.row
+
+    def __hash__(self):
+        return hash((id(self.shard), self.row))
+
+    def __getstate__(self):
+        return (self.shard, self.row)
+
+    def __setstate__(self, state):
+        self.shard, self.row = state
 
     def __str__(self):
         # Representación legible de la reserva
         return f"Booking ID: {self.booking_id}, User ID: {self.user_id}, Room ID: {self.room_id}, Tools: {self.tool_ids}, Status: {self.status.name}"
-    
+
     def __repr__(self):
         # Representación resumida para depuración
-        return f"Booking({self.booking_id}, {self.user_id}, {self.status.name})"
\ No newline at end of file
+        return f"Booking({self.booking_id}, {self.user_id}, {self.status.name})"
@@ -0,0 +1,135 @@
+from threading import Lock
+from .booking import StatusBooking
+
+# Códigos de estado usados en cada cambio de estado (evitan el hash de Enum)
+FINISHED = StatusBooking.FINISHED.value
+
+class BookingStats:
+    """Booking statistics kept up to date on every status change of the bookings, so reading
+    them is O(1) and can be done while the bookings are still running."""
+    def __init__(self):
+        # Las reservas cambian de estado desde muchos hilos a la vez
+        self.lock = Lock()
+        # Reservas registradas y cantidad por código de estado
+        self.total = 0
+        self.counts = [0] * (max(status.value for status in StatusBooking) + 1)
+        # Tiempos de aprobación de las reservas finalizadas
+        self.finished_approved_sum = 0.0
+        self.finished_approved_min: float | None = None
+        self.finished_approved_max: float | None = None
+        # Tiempos de fin ya registrados (distintos de 0)
+        self.end_time_sum = 0.0
+        self.ended = 0
+        self.end_time_min: float | None = None
+        self.end_time_max: float | None = None
+
+    def add(self, booking):
+        """Registers a new booking."""
+        with self.lock:
+            self.total += 1
+            self.counts[booking.status._value_] += 1
+
+    def status_changed(self, booking, previous: StatusBooking, status: StatusBooking):
+        """Moves a booking from one status counter to another."""
+        previous, status = previous._value_, status._value_
+        with self.lock:
+            self.counts[previous] -= 1
+            self.counts[status] += 1
+            if status == FINISHED and previous != FINISHED:
+                approved_time = booking.approved_time
+                self.finished_approved_sum += approved_time
+                if self.finished_approved_min is None or approved_time < self.finished_approved_min:
+                    self.finished_approved_min = approved_time
+                if self.finished_approved_max is None or approved_time > self.finished_approved_max:
+                    self.finished_approved_max = approved_time
+            elif previous == FINISHED and status != FINISHED:
+                # El mínimo y el máximo no se recalculan: una reserva finalizada no cambia de estado
+                self.finished_approved_sum -= booking.approved_time
+
+    def end_time_changed(self, previous: float, end_time: float):
+        """Updates the end time statistics when a booking gets (or changes) its end time."""
+        with self.lock:
+            self.end_time_sum += end_time - previous
+            # Un tiempo de fin 0 equivale a no tenerlo: cuenta igual para el mínimo
+            if previous == 0 and end_time != 0:
+                self.ended += 1
+            elif previous != 0 and end_time == 0:
+                self.ended -= 1
+            if end_time != 0:
+                if self.end_time_min is None or end_time < self.end_time_min:
+                    self.end_time_min = end_time
+                if self.end_time_max is None or end_time > self.end_time_max:
+                    self.end_time_max = end_time
+
+    def as_dict(self):
+        """Returns the statistics with the keys of University.get_booking_stats."""
+        with self.lock:
+            finished = self.counts[FINISHED]
+            # Las reservas sin tiempo de fin cuentan con 0
+            min_end = self.end_time_min if self.ended == self.total and self.end_time_min is not None else 0
+            max_end = max(self.end_time_max, 0) if self.end_time_max is not None else 0
+            return {
+                "total_bookings": self.total,
+                "pending": self.counts[StatusBooking.PENDING.value],
+                "approved": self.counts[StatusBooking.APPROVED.value],
+                "rejected": self.counts[StatusBooking.REJECTED.value],
+                "cancelled": self.counts[StatusBooking.CANCELLED.value],
+                "in_use": self.counts[StatusBooking.IN_USE.value],
+                "finished": finished,
+                "Average Approved time": self.finished_approved_sum / max(1, finished),
+                "Average End time": self.end_time_sum / max(1, self.total),
+                "Min Approved time": self.finished_approved_min if finished and self.finished_approved_min is not None else 0,
+                "Max Approved time": self.finished_approved_max if finished and self.finished_approved_max is not None else 0,
+                "Min End time": min_end if self.total else 0,
+                "Max End time": max_end,
+            }
+
+    def __getstate__(self):
+        """Copies and pickles the statistics without the lock; a new one is created."""
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = Lock()
+
+class SubstitutionStats:
+    """Counters of the requests that accept any laboratory offering their tools: how many got the
+    preferred laboratory, how many were sent to another free compatible one (a substitution) and
+    how many found every compatible laboratory busy or none at all."""
+    def __init__(self):
+        self.lock = Lock()
+        self.requests = 0
+        self.preferred = 0
+        self.substituted = 0
+        self.all_busy = 0
+        self.incompatible = 0
+
+    def record(self, outcome: str):
+        """Counts one request with outcome "preferred", "substituted", "all_busy" or "incompatible"."""
+        with self.lock:
+            self.requests += 1
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def as_dict(self):
+        """Returns the counters with the keys added to University.get_booking_stats."""
+        with self.lock:
+            return {
+                "Any-laboratory requests": self.requests,
+                "Preferred laboratory free": self.preferred,
+                "Substitutions": self.substituted,
+                "Substitution rate": self.substituted / max(1, self.requests),
+                "All compatible laboratories busy": self.all_busy,
+                "No compatible laboratory": self.incompatible,
+            }
+
+    def __getstate__(self):
+        """Copies and pickles the counters without the lock; a new one is created."""
+        state = self.__dict__.copy()
+        del state["lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = Lock()
@@ -1,93 +1,233 @@
 import numpy as np
-from threading import Lock
+from bisect import insort
+from itertools import count
+from threading import Condition, Lock
+from time import monotonic
+
+class BankerWaiter:
+    """Solicitud bloqueada a la espera de que el banquero la pueda conceder de forma segura."""
+    def __init__(self, sid, request, priority: int, order: int, lock: Lock):
+        self.sid = sid
+        self.request = request
+        # Menor prioridad = se atiende antes; a igual prioridad, por orden de llegada (FIFO)
+        self.priority = priority
+        self.order = order
+        self.granted = False
+        # Cada espera tiene su propia condición: release_resources despierta solo a quien concede
+        self.condition = Condition(lock)
+
+    def __lt__(self, other):
+        return (self.priority, self.order) < (other.priority, other.order)
 
 class Banker:
-    def __init__(self, total_resources: dict, max_demand: dict):
+    def __init__(self, total_resources: dict, max_demand: dict, incremental: bool = True):
         self.lock = Lock()
         self.total_resources = total_resources  # {'lab': 3, 'tool_1': 2, 'tool_2': 3, ...}
-        #print(f"[DEBUG][BANK] Total resources: {self.total_resources}")
-        self.available = total_resources.copy()
         self.max_demand = max_demand  # {student_id: {'lab': 1, 'tool_1': 1, 'tool_2': 2}}
-        #print(f"[DEBUG][BANK] Max demand: {self.max_demand}")
-        # crea una estructura inicial vacía que representa como se asignan los recursos
-        # a cada estudiante (sid) para cada recurso (r)
-        # {'sid1': {'lab': 0, 'tool_1': 0, 'tool_2': 0, ...}, 'sid2': {...}, ...}
-        self.allocation = {sid: {r: 0 for r in total_resources} for sid in max_demand}
-        #representa lo que cada usuario aún puede pedir de cada recurso. Al inicio, es igual a 
-        # la demanda máxima, y se va reduciendo a medida que se asignan recursos.
-        self.need = {
-            sid: {r: max_demand[sid][r] for r in max_demand[sid]}
-            for sid in max_demand
-        }
+
+        # Cada recurso ocupa una columna y cada estudiante (sid) una fila
+        self.resource_index = {r: j for j, r in enumerate(total_resources)}
+        self.process_index = {sid: i for i, sid in enumerate(max_demand)}
+
+        # Vector de recursos disponibles: [lab, tool_1, tool_2, ...]
+        self.available = np.array([total_resources[r] for r in total_resources], dtype=np.int64)
+        # Matriz de demanda máxima (n estudiantes x m recursos)
+        self.maximum = np.zeros((len(max_demand), len(total_resources)), dtype=np.int64)
+        for sid, demand in max_demand.items():
+            self.maximum[self.process_index[sid]] = self.to_vector(demand)
+        # Matriz de asignación: lo que cada estudiante tiene asignado de cada recurso
+        self.allocation = np.zeros_like(self.maximum)
+        # Matriz de necesidad: lo que cada estudiante aún puede pedir de cada recurso. Al inicio
+        # es igual a la demanda máxima, y se va reduciendo a medida que se asignan recursos.
+        self.need = self.maximum.copy()
+        # Mayor demanda máxima de cada recurso: una columna con al menos esto disponible nunca bloquea a nadie
+        self.maximum_peak = self.maximum.max(axis=0) if len(max_demand) else np.zeros_like(self.available)
+        # Si toda demanda máxima cabe en el total, un proceso sin asignación siempre puede terminar el último
+        self.claims_fit = bool(np.all(self.maximum <= self.available))
+        # Filas de los procesos que tienen algún recurso asignado
+        self.holders: set[int] = set()
+
+        # Si es True se usan la admisión rápida y la revalidación de la última secuencia segura
+        self.incremental = incremental
+        # Última secuencia segura demostrada (orden de filas), reutilizada como candidata
+        self.safe_order = None
+        # Contadores de cómo se resolvió cada verificación de seguridad
+        self.fast_path_hits = 0
+        self.cached_sequence_hits = 0
+        self.full_checks = 0
+        self.safety_checks = 0
+
+        # Cola de solicitudes bloqueadas, ordenada por (prioridad, llegada)
+        self.waiters: list[BankerWaiter] = []
+        self.arrivals = count()
+        # Contadores de contención de la admisión (None: instrumentación desactivada)
+        self.contention = None
+
+    def to_vector(self, request: dict):
+        """Convierte una solicitud {'lab': 1, 'tool_1': 1} en un vector alineado con los recursos."""
+        vector = np.zeros(len(self.resource_index), dtype=np.int64)
+        for r, amount in request.items():
+            vector[self.resource_index[r]] = amount
+        return vector
 
     def is_safe(self, sid, request):
         """
         Simula el préstamo temporal de recursos y verifica si el sistema se mantiene en un estado seguro.
         """
+        i = self.process_index[sid]
+        request = self.to_vector(request) if isinstance(request, dict) else request
+        self.safety_checks += 1
+
         # Paso 1: Comprobar que la solicitud no excede lo que necesita
-        for r in request:
-            if request[r] > self.need[sid][r]:
-                return False
-            
+        if np.any(request > self.need[i]):
+            return False
+
         # Paso 2: Comprobar que los recursos están disponibles
-        for r in request:
-            if request[r] > self.available[r]:
-                return False
+        if np.any(request > self.available):
+            return False
+
+        # Paso 3: Simular asignación temporal sobre la fila del proceso (sin copiar las matrices)
+        self.allocation[i] += request
+        self.need[i] -= request
+        try:
+            return self.is_safe_state(self.available - request, i)
+        finally:
+            # Deshacer la asignación simulada
+            self.allocation[i] -= request
+            self.need[i] += request
+
+    def is_safe_state(self, work, requester):
+        """Decide si el estado actual (con `work` disponible) es seguro, usando primero los atajos baratos."""
+        if not self.incremental:
+            self.full_checks += 1
+            return self.safe_sequence(work, self.need, self.allocation) is not None
+        if not self.claims_fit:
+            return False
+
+        # Los procesos sin recursos asignados no devuelven nada y su necesidad cabe en el total,
+        # así que pueden terminar al final: basta con ordenar a los que tienen algo asignado
+        rows = self.holders | {requester}
+        # Solo importan los recursos escasos: en las demás columnas `work` cubre cualquier necesidad
+        scarce = np.flatnonzero(work < self.maximum_peak)
+        if scarce.size == 0:
+            self.fast_path_hits += 1
+            return True
+        order = [r for r in self.safe_order if r in rows] if self.safe_order is not None else []
+        order += sorted(rows.difference(order))
+        order = np.array(order, dtype=np.intp)
+        work = work[scarce]
+        need = self.need[np.ix_(order, scarce)]
+
+        # Admisión rápida: si la mayor necesidad pendiente de cada recurso cabe en `work`,
+        # cualquier proceso puede terminar por sí solo y el estado es seguro
+        if np.all(need.max(axis=0) <= work):
+            self.fast_path_hits += 1
+            return True
+
+        allocation = self.allocation[np.ix_(order, scarce)]
+        # Revalidar la última secuencia segura: el proceso k-ésimo dispone de `work` más
+        # lo que devuelven los k-1 procesos que terminan antes que él
+        if self.safe_order is not None:
+            returned = np.cumsum(allocation, axis=0) - allocation
+            if np.all(need <= work + returned):
+                self.cached_sequence_hits += 1
+                self.safe_order = order.tolist()
+                return True
+
+        self.full_checks += 1
+        sequence = self.safe_sequence(work, need, allocation)
+        if sequence is None:
+            return False
+        self.safe_order = order[sequence].tolist()
+        return True
+
+    def safe_sequence(self, work, need, allocation):
+        """
+        Ejecuta el algoritmo de seguridad vectorizado. En cada ronda terminan a la vez todos
+        los procesos cuya necesidad cabe en `work`; devuelve el orden encontrado o None si no es seguro.
+        """
+        work = work.copy()
+        finish = np.zeros(len(need), dtype=bool)
+        sequence = []
+        while not finish.all():
+            # Procesos pendientes cuya necesidad cabe completa en los recursos simulados
+            runnable = ~finish & np.all(need <= work, axis=1)
+            if not runnable.any():
+                return None
+            # Al terminar devuelven todo lo que tienen asignado
+            work += allocation[runnable].sum(axis=0)
+            finish |= runnable
+            sequence.extend(np.flatnonzero(runnable).tolist())
+        return sequence
 
-        # Paso 3: Simular asignación temporal
-        work = self.available.copy()
-        temp_allocation = {k: v.copy() for k, v in self.allocation.items()}
-        #print(f"[DEBUG][BANK] temp_allocation: {temp_allocation}")
-        temp_need = {k: v.copy() for k, v in self.need.items()}
-        #print(f"[DEBUG][BANK] temp_need: {temp_need}")
-
-        for r in request:
-            #Resta la cantidad solicitada de ese recurso a los recursos disponibles simulados
-            work[r] -= request[r]
-            #print(f"[DEBUG][BANK] Work after request {r}: {work}")
-            #Simula que el proceso tiene ahora esos recursos asignados.
-            temp_allocation[sid][r] += request[r]
-            #print(f"[DEBUG][BANK] Temp allocation after request {r}: {temp_allocation[sid]}")
-            #Simula que el proceso necesita menos recursos porque ya se le asignaron algunos.
-            temp_need[sid][r] -= request[r]
-            #print(f"[DEBUG][BANK] Temp need after request {r}: {temp_need[sid]}")
-
-        finish = {k: False for k in self.allocation}
-        #print(f"[DEBUG][BANK] Initial finish state: {finish}")
-
-        while True:
-            found = False
-            for pid in finish:
-                # Recorre todos los recursos, Para cada recurso, compara la necesidad pendiente 
-                # de ese proceso (temp_need[pid][r]) con la cantidad de ese recurso disponible 
-                # en el sistema simulado (work[r]).
-                if not finish[pid] and all(temp_need[pid][r] <= work[r] for r in work):
-                    
-                    for r in work:
-                        work[r] += temp_allocation[pid][r]
-                    finish[pid] = True
-                    found = True
-            if not found:
-                break
-        #print(f"[DEBUG][BANK] Final finish state: {finish}")        
-        return all(finish.values())
-
-    def request_resources(self, sid, request):
-        """Aplica el algoritmo del banquero de forma segura con lock."""
+    def request_resources(self, sid, request, blocking: bool = False, timeout: float | None = None,
+                          priority: int = 0):
+        """
+        Aplica el algoritmo del banquero de forma segura con lock.
+        Con blocking=True espera (hasta `timeout` segundos, o indefinidamente si es None) a que la
+        solicitud sea segura; las esperas se atienden por prioridad y, a igual prioridad, en orden FIFO.
+        """
+        request = self.to_vector(request)
         with self.lock:
-            if not self.is_safe(sid, request):
+            i = self.process_index[sid]
+            # Una solicitud que excede lo declarado nunca podrá concederse
+            if np.any(request > self.need[i]):
+                return False
+            # Los contadores se actualizan con el lock del banquero tomado
+            contention = self.contention
+            # Sin esperas pendientes se intenta de inmediato; si hay cola no se adelanta a nadie
+            if not (blocking and self.waiters) and self.is_safe(sid, request):
+                self.grant(i, request)
+                if contention is not None:
+                    contention.attempt(True, hold=False)
+                return True
+            if contention is not None:
+                contention.attempt(False, hold=False)
+            if not blocking:
                 return False  # Estado no seguro
-            # 2. Si es seguro, asigna los recursos solicitados al proceso.
-            for r in request:
-                self.available[r] -= request[r]         # Resta los recursos disponibles.
-                self.allocation[sid][r] += request[r]   # Suma los recursos asignados al proceso.
-                self.need[sid][r] -= request[r]         # Disminuye la necesidad pendiente del proceso.
+
+            waiter = BankerWaiter(sid, request, priority, next(self.arrivals), self.lock)
+            insort(self.waiters, waiter)
+            start = contention.clock() if contention is not None else 0.0
+            deadline = None if timeout is None else monotonic() + timeout
+            while not waiter.granted:
+                remaining = None if deadline is None else deadline - monotonic()
+                if remaining is not None and remaining <= 0:
+                    self.waiters.remove(waiter)
+                    if contention is not None:
+                        contention.waited(start)
+                    return False
+                waiter.condition.wait(remaining)
+            if contention is not None:
+                contention.waited(start)
             return True
 
+    def grant(self, i, request):
+        """Asigna los recursos solicitados al proceso de la fila i (el estado ya se verificó seguro)."""
+        self.available -= request         # Resta los recursos disponibles.
+        self.allocation[i] += request     # Suma los recursos asignados al proceso.
+        self.need[i] -= request           # Disminuye la necesidad pendiente del proceso.
+        if request.any():
+            self.holders.add(i)
+
+    def grant_waiters(self):
+        """Reevalúa las esperas en orden y concede, despertándolas, las que ahora son seguras."""
+        for waiter in list(self.waiters):
+            if self.is_safe(waiter.sid, waiter.request):
+                self.grant(self.process_index[waiter.sid], waiter.request)
+                self.waiters.remove(waiter)
+                waiter.granted = True
+                waiter.condition.notify()
+
     def release_resources(self, sid):
         """Libera todos los recursos del proceso (cuando termina la reserva)."""
         with self.lock:
-            for r in self.total_resources:
-                self.available[r] += self.allocation[sid][r]
-                self.allocation[sid][r] = 0
-                self.need[sid][r] = self.max_demand[sid][r]
\ No newline at end of file
+            i = self.process_index[sid]
+            released = self.allocation[i].any()
+            self.available += self.allocation[i]
+            self.allocation[i] = 0
+            self.need[i] = self.maximum[i]
+            self.holders.discard(i)
+            # Solo se reevalúan las esperas si `available` cambió realmente
+            if released and self.waiters:
+                self.grant_waiters()
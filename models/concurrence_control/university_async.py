@@ -0,0 +1,122 @@
+import asyncio
+import random
+from models.university import University
+from models.laboratory_tool import LaboratoryTool
+from models.laboratory import Laboratory
+from models.student import Student
+
+class UniversityAsync(University):
+    """University Class for asyncio: every student is a coroutine instead of a thread, so one event loop runs many thousands of students. The room and the tools are reserved all at once (like UniversityRelease) and bookings wait on asyncio conditions, one per resource."""
+    # Sin política de eventos discretos: la estrategia ya corre sin hilos
+    SIMULATION_POLICY = None
+
+    def __init__(self, laboratories: list[Laboratory],
+                 laboratory_tools: list[LaboratoryTool], students: list[Student]):
+        super().__init__(laboratories, laboratory_tools, students)
+        # Una condición asyncio por recurso: al liberarlo solo se despierta a quien lo espera
+        self.conditions = {resource: asyncio.Condition() for resource in [*laboratories, *laboratory_tools]}
+
+    async def to_book(self, student_id: int, room_id: int, tool_ids: list[int]):
+        """Creates a booking for a student with the specified room and tools."""
+        booking = self.create_booking(student_id, room_id, tool_ids)
+
+        requested = self.requested_units(room_id, tool_ids)
+        if requested is None:
+            booking.reject()
+            return booking.booking_id
+
+        if not await self.acquire_all_async(requested, self.BOOKING_TIMEOUT):  # Timeout
+            booking.reject()
+            return booking.booking_id
+
+        booking.add_room(room_id)
+        for tool, units in requested[1:]:
+            for _ in range(units):
+                booking.add_tool(tool.id)
+        booking.approve()
+        await self.use_booking(booking.booking_id)
+        return booking.booking_id
+
+    async def acquire_all_async(self, requested: list, timeout: float):
+        """Reserves the units of every (resource, units) pair in one step, or none of them, waiting on
+        the condition of a busy one. Returns False if the timeout expires first."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            # Un solo hilo: comprobar y reservar sin ceder el control es atómico
+            busy, busy_units = next(((resource, units) for resource, units in requested
+                                     if not resource.is_available(units)), (None, 0))
+            if busy is None:
+                for resource, units in requested:
+                    resource.try_book(units)
+                return True
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return False
+            # Un solo hilo: los contadores de contención se actualizan sin lock
+            contention = busy.contention
+            if contention is not None:
+                contention.attempt(False)
+                start = contention.clock()
+            condition = self.conditions[busy]
+            async with condition:
+                try:
+                    # Como wait_until_available(units=...): despierta solo cuando hay unidades suficientes
+                    await asyncio.wait_for(condition.wait_for(lambda: busy.is_available(busy_units)), remaining)
+                except asyncio.TimeoutError:
+                    if contention is not None:
+                        contention.waited(start)
+                    # Pudo haber recibido el aviso justo al vencer: pasarlo al siguiente
+                    if busy.is_available(busy_units):
+                        condition.notify(1)
+                    return False
+                if contention is not None:
+                    contention.waited(start)
+                # Si no puede reservar todo, el recurso que lo despertó sigue libre para el siguiente
+                if any(not resource.is_available(units) for resource, units in requested) and busy.is_available(busy_units):
+                    condition.notify(1)
+
+    async def use_booking(self, booking_id: int):
+        """Marks the booking as in use, uses each tool without blocking the event loop and releases it."""
+        booking = self.get_booking_by_id(booking_id)
+        if booking.is_active():
+            booking.in_use()
+            laboratory = self.registry.find_laboratory(booking.room_id)
+            if laboratory is not None:
+                laboratory.try_use()
+
+            for tool in self.registry.find_tools(booking.tool_ids):
+                tool.try_use()
+                await asyncio.sleep(self.TOOL_USE_TIME)
+            booking.finish()
+            await self.release_booking(booking_id)
+            return True
+        return False
+
+    async def release_booking(self, booking_id: int):
+        """Releases the booking resources and wakes one waiter of each released single-unit resource.
+        Every waiter of a multi-unit resource is woken: the first one may need more units than are free."""
+        booking = self.get_booking_by_id(booking_id)
+        # Liberar los recursos (sin esperas) y luego avisar a sus colas
+        if not super().release_booking(booking_id):
+            return False
+        resources = [self.registry.find_laboratory(booking.room_id), *self.registry.find_tools(booking.tool_ids)]
+        for resource in resources:
+            if resource is None:
+                continue
+            condition = self.conditions[resource]
+            async with condition:
+                if resource.capacity > 1:
+                    condition.notify_all()
+                else:
+                    condition.notify(1)
+        return True
+
+    async def random_booking(self, student_id: int):
+        """Creates a random booking for a student with a random laboratory and tools."""
+        room_id = random.choice(self.laboratories).id
+        tool_ids = [tool.id for tool in self.laboratory_tools]
+        if not tool_ids:
+            raise ValueError("No available tools to book")
+        return await self.to_book(student_id, room_id, random.sample(tool_ids, k=min(3, len(tool_ids))))
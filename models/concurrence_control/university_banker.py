@@ -1,48 +1,65 @@
+from collections import Counter
 from models.booking import Booking
 from models.concurrence_control.banker import Banker
 from models.university import University
-from time import sleep
+from threading import Semaphore
+from time import time
 
 class UniversityBanker(University):
+    SIMULATION_POLICY = "banker"
+    # Unidades de cada herramienta que pide como máximo una solicitud, por defecto (como random_booking)
+    MAX_TOOL_UNITS = 1
 
-    def __init__(self, laboratories, laboratory_tools, students):
-        self.laboratories = laboratories
-        self.laboratory_tools = laboratory_tools
-        self.students = students
-        self.bookings = []
-        self.booking_id_counter = 0
+    def __init__(self, laboratories, laboratory_tools, students, max_tool_units: int | None = None):
+        super().__init__(laboratories, laboratory_tools, students)
+        self.max_tool_units = max_tool_units or self.MAX_TOOL_UNITS
+        if self.max_tool_units < 1:
+            raise ValueError("max_tool_units must be at least 1")
 
-        #lab almacena el número de laboratorios disponibles
-        total_resources = {"lab": len(self.laboratories)}
-        # tool_id almacena la disponibilidad de cada herramienta
+        #lab almacena el número de puestos de laboratorio (la suma de sus capacidades)
+        total_resources = {"lab": sum(laboratory.capacity for laboratory in self.laboratories)}
+        # tool_id almacena las unidades de cada herramienta
         for tool in self.laboratory_tools:
-            total_resources[f"tool_{tool.id}"] = 1
+            total_resources[f"tool_{tool.id}"] = tool.capacity
 
         max_demand = {}
-        # Cada estudiante puede solicitar maximo 1 laboratorio y 1 de cada herramienta
-        # Realmente, cada  estudiante puede reservar menos herramientas
+        # Cada estudiante puede solicitar maximo 1 laboratorio y, de cada herramienta, las unidades de una
+        # solicitud (max_tool_units, sin superar la capacidad). Con demandas menores que el inventario
+        # varios estudiantes pueden tener unidades de la misma herramienta a la vez
         for student in self.students:
             max_demand[student.code] = {"lab": 1}
             for tool in self.laboratory_tools:
-                max_demand[student.code][f"tool_{tool.id}"] = 1
+                max_demand[student.code][f"tool_{tool.id}"] = min(tool.capacity, self.max_tool_units)
         # Inicializar el banquero con los recursos totales y la demanda máxima por estudiante
         self.banker = Banker(total_resources, max_demand)
+        # El banquero tiene una fila por estudiante: cada estudiante tiene a lo sumo una reserva admitida
+        # a la vez y las demás esperan su turno hasta que esa se libere
+        self.student_turns = {student.code: Semaphore(1) for student in self.students}
+        # Reservas admitidas por el banquero que aún no devolvieron sus recursos (reserva -> estudiante)
+        self.admitted: dict[int, int] = {}
 
-    def to_book(self, student_id: int, room_id: int, tool_ids: list[int]):
-        self.booking_id_counter += 1
-        booking = Booking(user_id=student_id, booking_id=self.booking_id_counter,
-                          room_id_solicited=room_id, tool_ids_solicited=tool_ids)
-        self.bookings.append(booking)
+    def instrument_locks(self, monitor):
+        """Records the admissions of the Banker: immediate grants, waits and their duration."""
+        self.banker.contention = monitor.counters("Banker admission")
 
-        # Construir solicitud
-        request = {"lab": 1}
-        # Añadir herramientas que se solicitan
-        for tool_id in tool_ids:
-            request[f"tool_{tool_id}"] = 1
+    def to_book(self, student_id: int, room_id: int, tool_ids: list[int]):
+        booking = self.create_booking(student_id, room_id, tool_ids)
+        turn = self.student_turns.get(student_id)
+        request = self.admission_request(room_id, tool_ids)
+        if turn is None or request is None:
+            # Estudiante sin demanda declarada, recurso inexistente o más unidades que las declaradas:
+            # el banquero nunca podría concederla
+            booking.reject()
+            return booking.booking_id
 
-        # Paso 1: Esperar hasta que el sistema esté en estado seguro
-        while not self.banker.request_resources(student_id, request):
-            continue  # Reintentar hasta que se pueda reservar
+        # Paso 1: Esperar a que termine otra reserva del mismo estudiante y bloquear (en orden de llegada)
+        # hasta que el banquero pueda conceder la solicitud de forma segura
+        turn.acquire()
+        if not self.banker.request_resources(student_id, request, blocking=True):
+            turn.release()
+            booking.reject()
+            return booking.booking_id
+        self.admitted[booking.booking_id] = student_id
 
         # Paso 2: Esperar hasta que el laboratorio esté disponible
         booked_lab = 0
@@ -54,19 +71,16 @@ class UniversityBanker(University):
         booking.add_room(booked_lab)
 
         # Paso 3: Esperar hasta que todas las herramientas estén disponibles
-        remaining_tools = set(tool_ids)
+        remaining_tools = list(tool_ids)
         while remaining_tools:
             for tool_id in list(remaining_tools):
-                for tool in self.laboratory_tools:
-                    if tool.id == tool_id and tool.is_available():
-                        try:
-                            tool.to_book()
-                            booking.add_tool(tool_id)
-                            remaining_tools.remove(tool_id)
-                        except ValueError:
-                            continue
+                tool = self.registry.find_tool(tool_id)
+                if tool is not None and tool.try_book():
+                    booking.add_tool(tool_id)
+                    remaining_tools.remove(tool_id)
             if remaining_tools:
-                continue  # Espera si aún hay herramientas pendientes
+                # Espera en la cola de una herramienta pendiente hasta que se libere
+                self.wait_for_tools(list(remaining_tools), time())
 
         # Paso 4: Aprobar y usar reserva
         booking.approve()
@@ -74,18 +88,33 @@ class UniversityBanker(University):
 
         return booking.booking_id
 
+    def admission_request(self, room_id: int, tool_ids: list[int]):
+        """Banker request {"lab": 1, "tool_<id>": units} of a booking, or None if a resource does not
+        exist or it asks more units of a tool than every student declares (max_tool_units)."""
+        if self.requested_units(room_id, tool_ids) is None:
+            return None
+        request = {"lab": 1}
+        for tool_id, units in Counter(tool_ids).items():
+            if units > self.max_tool_units:
+                return None
+            request[f"tool_{tool_id}"] = units
+        return request
+
     def release_booking(self, booking_id: int):
         booking = self.get_booking_by_id(booking_id)
         if booking.get_status() == "FINISHED":
-            for lab in self.laboratories:
-                if lab.id == booking.room_id:
-                    lab.release()
+            lab = self.registry.find_laboratory(booking.room_id)
+            if lab is not None:
+                lab.release(in_use=True)
+                self.trace_release(booking_id, lab)
 
-            for tool_id in booking.tool_ids:
-                for tool in self.laboratory_tools:
-                    if tool.id == tool_id:
-                        tool.release()
+            for tool in self.registry.find_tools(booking.tool_ids):
+                tool.release(in_use=True)
+                self.trace_release(booking_id, tool)
 
-            self.banker.release_resources(booking.user_id)
+            # Solo la primera liberación devuelve la fila del estudiante y su turno
+            if self.admitted.pop(booking_id, None) is not None:
+                self.banker.release_resources(booking.user_id)
+                self.student_turns[booking.user_id].release()
             return True
         return False
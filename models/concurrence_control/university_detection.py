@@ -0,0 +1,214 @@
+import threading
+from time import perf_counter, time
+from models.booking import StatusBooking
+from models.university import University
+from models.laboratory_tool import LaboratoryTool
+from models.laboratory import Laboratory
+from models.student import Student
+
+# ---------------------------------------------------------------
+# Victim selection policies. Each one receives the bookings of the deadlock
+# (the first one is the booking whose request closed it) and the resources
+# held by every booking, and returns the booking to abort.
+# ---------------------------------------------------------------
+
+def youngest_victim(cycle: list[int], held: dict[int, list]):
+    """The most recent booking (highest ID): the one that has waited the least."""
+    return max(cycle)
+
+def oldest_victim(cycle: list[int], held: dict[int, list]):
+    """The oldest booking (lowest ID)."""
+    return min(cycle)
+
+def fewest_resources_victim(cycle: list[int], held: dict[int, list]):
+    """The booking holding the fewest resources (the least work lost); ties go to the youngest."""
+    return min(cycle, key=lambda booking_id: (len(held.get(booking_id, [])), -booking_id))
+
+def requester_victim(cycle: list[int], held: dict[int, list]):
+    """The booking whose request closed the cycle: it is aborted without waking any other thread."""
+    return cycle[0]
+
+VICTIM_POLICIES = {
+    "youngest": youngest_victim,
+    "oldest": oldest_victim,
+    "fewest_resources": fewest_resources_victim,
+    "requester": requester_victim,
+}
+
+class UniversityDetection(University):
+    """University Class that allows hold-and-wait (like University) but keeps a wait-for graph of holders and waiters. When a request closes a cycle the deadlock is detected at once and a victim chosen by the victim policy is aborted: its booking is rejected and its resources released, instead of waiting for the timeout."""
+    # Sin política de eventos discretos: la detección depende de las esperas reales entre hilos
+    SIMULATION_POLICY = None
+    # Política de selección de la víctima por defecto
+    VICTIM_POLICY = "youngest"
+
+    def __init__(self, laboratories: list[Laboratory],
+                 laboratory_tools: list[LaboratoryTool], students: list[Student],
+                 victim_policy: str | None = None):
+        super().__init__(laboratories, laboratory_tools, students)
+        victim_policy = victim_policy or self.VICTIM_POLICY
+        if victim_policy not in VICTIM_POLICIES:
+            raise ValueError(f"Unknown victim policy {victim_policy!r}")
+        self.victim_policy = victim_policy
+        self.choose_victim = VICTIM_POLICIES[victim_policy]
+        # Protege el grafo de espera; siempre se toma antes que el lock de un recurso
+        self.graph_lock = threading.Lock()
+        # Grafo de espera: recurso -> reservas que tienen unidades suyas (con cuántas), reserva -> recurso que espera.
+        # Cada reserva espera por un solo recurso; con recursos de una unidad cada uno tiene un solo dueño
+        # y de cada reserva sale a lo sumo una arista, así que un ciclo se recorre en O(largo del ciclo)
+        self.holders: dict = {}
+        self.waiting: dict = {}
+        # Recursos que tiene cada reserva, en orden de reserva
+        self.held: dict[int, list] = {}
+        # Víctimas elegidas que aún no liberaron sus recursos, con el instante en que se eligieron
+        self.aborted: dict[int, float] = {}
+        # Métricas de detección
+        self.deadlocks = 0
+        self.cycle_length_sum = 0
+        self.detection_latency_sum = 0.0
+        self.detection_latency_max = 0.0
+        self.recoveries = 0
+        self.recovery_time_sum = 0.0
+        self.recovery_time_max = 0.0
+
+    def instrument_locks(self, monitor):
+        """Records the contention of the wait-for graph lock."""
+        self.graph_lock = monitor.instrument_lock(self.graph_lock, "Wait-for graph lock")
+
+    def to_book(self, student_id: int, room_id: int, tool_ids: list[int]):
+        """Creates a booking for a student, reserving the room and then each tool in the requested order."""
+        start_time = time()
+        booking = self.create_booking(student_id, room_id, tool_ids)
+        booking_id = booking.booking_id
+
+        room = self.registry.find_laboratory(room_id)
+        if self.requested_units(room_id, tool_ids) is None:
+            booking.reject()
+            return booking_id
+        # Una unidad por vez, en el orden pedido: una herramienta pedida k veces aparece k veces
+        tools = self.registry.find_tools(tool_ids)
+
+        for resource in [room] + tools:
+            if not self.acquire(booking_id, resource, start_time):
+                # Víctima de un interbloqueo o tiempo agotado: se liberan también los recursos ya tomados
+                booking.reject()
+                self.release_held(booking_id)
+                return booking_id
+            if resource is room:
+                booking.add_room(room.id)
+            else:
+                booking.add_tool(resource.id)
+
+        booking.approve()
+        self.use_booking(booking_id)
+        return booking_id
+
+    def acquire(self, booking_id: int, resource, start_time: float):
+        """Reserves `resource` for the booking, waiting on its queue while it is busy.
+        Returns False if the booking is aborted as a deadlock victim or times out."""
+        while True:
+            request_time = perf_counter()
+            with self.graph_lock:
+                if booking_id in self.aborted:
+                    return False
+                if resource.try_book():
+                    holders = self.holders.setdefault(resource, {})
+                    holders[booking_id] = holders.get(booking_id, 0) + 1
+                    self.held.setdefault(booking_id, []).append(resource)
+                    return True
+                # Nuevas aristas reserva -> dueños del recurso: se busca el interbloqueo en el momento en que se forma
+                self.waiting[booking_id] = resource
+                self.detect_deadlock(booking_id, request_time)
+                if booking_id in self.aborted:
+                    return False
+
+            remaining = self.BOOKING_TIMEOUT - (time() - start_time)
+            woken = remaining > 0 and resource.wait_until_available(remaining, lambda: booking_id in self.aborted)
+            with self.graph_lock:
+                self.waiting.pop(booking_id, None)
+            if not woken:  # Timeout
+                return False
+
+    def detect_deadlock(self, booking_id: int, request_time: float):
+        """Follows the wait-for edges from `booking_id` to the holders of the resource it waits for,
+        and on from theirs. If every booking reached is waiting too (with single-unit resources: the
+        edges lead back to `booking_id`), none of them can release a unit and a victim is aborted.
+        Must be called with the graph lock held."""
+        cycle = [booking_id]
+        seen = {booking_id}
+        for current in cycle:
+            for holder in self.holders.get(self.waiting[current], ()):
+                if holder in seen:
+                    continue
+                # Un dueño que no espera (o cuyo recurso ya tiene una unidad libre) puede avanzar;
+                # uno que ya es víctima se está resolviendo
+                if holder not in self.waiting or holder in self.aborted or self.waiting[holder].free_units > 0:
+                    return None
+                seen.add(holder)
+                cycle.append(holder)
+        if len(cycle) == 1 and booking_id not in self.holders.get(self.waiting[booking_id], ()):
+            return None
+
+        victim = self.choose_victim(cycle, self.held)
+        self.aborted[victim] = perf_counter()
+        if victim != booking_id:
+            # Despertar a la víctima de la cola en la que espera
+            resource = self.waiting[victim]
+            with resource.condition:
+                resource.condition.notify_all()
+
+        latency = perf_counter() - request_time
+        self.deadlocks += 1
+        self.cycle_length_sum += len(cycle)
+        self.detection_latency_sum += latency
+        self.detection_latency_max = max(self.detection_latency_max, latency)
+        return victim
+
+    def release_held(self, booking_id: int, in_use: bool = False):
+        """Releases every resource held by the booking, whatever its status, and wakes their waiters.
+        `in_use` tells whether the booking was using them or had only reserved them."""
+        with self.graph_lock:
+            for resource in self.held.pop(booking_id, []):
+                holders = self.holders.get(resource, {})
+                if holders.get(booking_id, 0) > 1:
+                    holders[booking_id] -= 1
+                else:
+                    holders.pop(booking_id, None)
+                resource.release(in_use=in_use)
+                self.trace_release(booking_id, resource)
+            self.waiting.pop(booking_id, None)
+            aborted_at = self.aborted.pop(booking_id, None)
+            if aborted_at is not None:
+                recovery_time = perf_counter() - aborted_at
+                self.recoveries += 1
+                self.recovery_time_sum += recovery_time
+                self.recovery_time_max = max(self.recovery_time_max, recovery_time)
+
+    def release_booking(self, booking_id: int):
+        """Releases the resources of a finished booking."""
+        booking = self.get_booking_by_id(booking_id)
+        if booking.status == StatusBooking.FINISHED:
+            self.release_held(booking_id, in_use=True)
+            return True
+        return False
+
+    def get_detection_stats(self):
+        """Returns the deadlock detection metrics: deadlocks found, cycle length, detection latency
+        (from the request that closed the cycle to the victim being signalled) and recovery time
+        (from then until the victim released its resources)."""
+        with self.graph_lock:
+            return {
+                "Victim policy": self.victim_policy,
+                "Deadlocks detected": self.deadlocks,
+                "Average deadlock cycle length": self.cycle_length_sum / max(1, self.deadlocks),
+                "Average detection latency": self.detection_latency_sum / max(1, self.deadlocks),
+                "Max detection latency": self.detection_latency_max,
+                "Average deadlock recovery time": self.recovery_time_sum / max(1, self.recoveries),
+                "Max deadlock recovery time": self.recovery_time_max,
+            }
+
+    def get_booking_stats(self):
+        """Booking statistics plus the deadlock detection metrics."""
+        stats = super().get_booking_stats()
+        stats.update(self.get_detection_stats())
+        return stats
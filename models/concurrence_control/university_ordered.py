@@ -0,0 +1,103 @@
+from models.university import University
+import threading
+from collections import Counter
+from models.laboratory_tool import LaboratoryTool
+from models.laboratory import Laboratory
+from models.student import Student
+from time import time
+
+class CountedSemaphore:
+    """Semaphore with `capacity` permits that takes or returns several permits in one atomic step.
+    Taking them one by one could leave two bookings each holding part of the units they need."""
+    def __init__(self, capacity: int = 1):
+        self.permits = capacity
+        self.condition = threading.Condition(threading.Lock())
+
+    def acquire(self, blocking: bool = True, timeout: float = -1, units: int = 1):
+        with self.condition:
+            if not blocking:
+                if self.permits < units:
+                    return False
+            elif not self.condition.wait_for(lambda: self.permits >= units, None if timeout < 0 else timeout):
+                return False
+            self.permits -= units
+            return True
+
+    def release(self, units: int = 1):
+        with self.condition:
+            self.permits += units
+            self.condition.notify_all()
+
+class UniversityOrdered(University):
+    """University Class that locks every laboratory and tool separately, always in the same global order (laboratories first, then tools, by ID), so bookings with disjoint resources run in parallel without deadlock."""
+    SIMULATION_POLICY = "ordered"
+
+    def __init__(self, laboratories: list[Laboratory],
+                 laboratory_tools: list[LaboratoryTool], students: list[Student]):
+        super().__init__(laboratories, laboratory_tools, students)
+        # Un semáforo contado por recurso (tantos permisos como unidades) en lugar de un lock global
+        self.laboratory_locks = {laboratory.id: CountedSemaphore(laboratory.capacity) for laboratory in laboratories}
+        self.tool_locks = {tool.id: CountedSemaphore(tool.capacity) for tool in laboratory_tools}
+        # Semáforos (y unidades) que mantiene cada reserva hasta que se libera
+        self.held_locks: dict[int, list[tuple[CountedSemaphore, int]]] = {}
+
+    def instrument_locks(self, monitor):
+        """Records the contention of the lock of every laboratory and tool."""
+        self.laboratory_locks = {laboratory_id: monitor.instrument_lock(lock, f"Lock Laboratory {laboratory_id}")
+                                 for laboratory_id, lock in self.laboratory_locks.items()}
+        self.tool_locks = {tool_id: monitor.instrument_lock(lock, f"Lock Tool {tool_id}")
+                           for tool_id, lock in self.tool_locks.items()}
+
+    def ordered_locks(self, room_id: int, tool_ids: list[int]):
+        """Returns the (semaphore, units) of the requested room and tools in the global canonical order."""
+        locks = []
+        if room_id in self.laboratory_locks:
+            locks.append((self.laboratory_locks[room_id], 1))
+        for tool_id, units in sorted(Counter(tool_ids).items()):
+            if tool_id in self.tool_locks:
+                locks.append((self.tool_locks[tool_id], units))
+        return locks
+
+    def to_book(self, student_id: int, room_id: int, tool_ids: list[int]):
+        """Creates a booking for a student with the specified room and tools."""
+        start_time = time()
+        booking = self.create_booking(student_id, room_id, tool_ids)
+
+        requested = self.requested_units(room_id, tool_ids)
+        if requested is None:
+            #print(f"[DEBUG] Booking {booking.booking_id} rejected: unknown room or tool")
+            booking.reject()
+            return booking.booking_id
+
+        # Adquirir los semáforos siempre en el mismo orden, todas las unidades de cada recurso de una vez:
+        # nunca se forma un ciclo de espera
+        acquired = []
+        for lock, units in self.ordered_locks(room_id, tool_ids):
+            remaining = self.BOOKING_TIMEOUT - (time() - start_time)
+            if remaining <= 0 or not lock.acquire(timeout=remaining, units=units):  # Timeout
+                for held, held_units in reversed(acquired):
+                    held.release(held_units)
+                booking.reject()
+                return booking.booking_id
+            acquired.append((lock, units))
+
+        # Con todos los permisos tomados las unidades están libres para esta reserva
+        for resource, units in requested:
+            resource.try_book(units)
+        booking.add_room(room_id)
+        for tool, units in requested[1:]:
+            for _ in range(units):
+                booking.add_tool(tool.id)
+
+        self.held_locks[booking.booking_id] = acquired
+        booking.approve()
+        self.use_booking(booking.booking_id)
+        return booking.booking_id
+
+    def release_booking(self, booking_id: int):
+        """Releases the booking resources and then the locks it was holding."""
+        released = super().release_booking(booking_id)
+        if released:
+            for lock, units in reversed(self.held_locks.pop(booking_id, [])):
+                lock.release(units)
+        return released
@@ -1,100 +1,9 @@
-import random
-from models.booking import Booking
 from models.university import University
 
 class UniversityPrevention(University):
-    """University Class that releases resources if any resource is not available."""
+    """University Class that prevents hold-and-wait: the room and all tools are reserved together or not at all."""
+    SIMULATION_POLICY = "all_or_nothing"
 
     def to_book(self, student_id: int, room_id: int, tool_ids: list[int]):
-        """Creates a booking for a student with the specified room and tools."""
-        self.booking_id_counter += 1
-        booking = Booking(user_id=student_id, booking_id=self.booking_id_counter, room_id_solicited=room_id, tool_ids_solicited=tool_ids)
-
-        self.bookings.append(booking)
-        #print(f"[DEBUG] Creating booking {booking.booking_id} for student {student_id}")
-
-        while True:
-            if(self.valitate_sources_availability(room_id, tool_ids)):
-                break
-
-        room_id = self.book_room(room_id)
-        if room_id == 0:
-            print(f"[DEBUG] Booking {booking.booking_id} rejected: room unavailable")
-            booking.reject()
-            return booking.booking_id
-        
-        booking.add_room(room_id)
-        laboratory = self.get_laboratory_by_id(room_id)
-        #print(f"[DEBUG] Room {room_id} added to booking {booking.booking_id}")
-
-        tools = [t for t in self.laboratory_tools if t.id in tool_ids]
-        
-        tool_reserver = []
-
-        while len(tool_reserver) < len(tool_ids):
-            for tool in tools:
-                if tool.is_available():
-                    #print(f"[DEBUG] Booking tool {tool.id} for booking {booking.booking_id}")
-                    try:
-                        tool.to_book()
-                        tool_reserver.append(tool)
-                    except ValueError as e:
-                        #print(f"[DEBUG] Error booking tool {tool.id}: {e}")
-                        continue    
-                else:
-                    for tool in tool_reserver:
-                        #print(f"[DEBUG] Releasing tool {tool.id} for booking {booking.booking_id}")
-                        tool.release()
-                    laboratory.release()
-                    self.book_room(room_id)
-                    tool_reserver.clear()
-                    break             
-
-        booking.tool_ids = [tool.id for tool in tool_reserver]
-
-        if len(booking.tool_ids) == len(tool_ids):
-            print(f"[DEBUG] Booking {booking.booking_id} approved")
-            booking.approve()
-            self.use_booking(booking.booking_id)
-
-        if booking.get_status() == "PENDING":
-            print(f"[DEBUG] Booking {booking.booking_id} pending, no tools available")
-            booking.reject()
-        
-        return booking.booking_id
-
-    def book_room(self, room_id: int):
-        """Attempts to book a room by its ID, returning the room ID if successful or 0 if not."""
-        room = None
-        
-        for laboratory in self.laboratories:
-            if laboratory.id == room_id:
-                room = laboratory 
-
-        if room is not None:
-            while True:
-                #print(f"[DEBUG] Checking room {room.id} status: {room.status}")
-                #print(f"[DEBUG)] Room {room.id} available: {room.is_available()}")
-                if room.is_available():
-                    #print(f"[DEBUG] Booking room {room.id}")
-                    try:
-                        room.to_book()
-                    except ValueError as e:
-                        #print(f"[DEBUG] Error booking room {room.id}: {e}")
-                        continue
-                    return room.id                         
-        #print(f"[DEBUG] Room {room_id} not found")
-        return 0
-                
-    def valitate_sources_availability(self, room_id: int, tool_ids: list[int]):
-        """Validates if the requested room and tools are available for booking."""
-        room = self.get_laboratory_by_id(room_id)
-        if not room or not room.is_available():
-            return False
-        
-        for tool_id in tool_ids:
-            tool = next((t for t in self.laboratory_tools if t.id == tool_id), None)
-            if not tool or not tool.is_available():
-                return False
-        
-        return True
\ No newline at end of file
+        """Creates a booking for a student with the specified room and tools (see University.to_book_all_or_nothing)."""
+        return self.to_book_all_or_nothing(student_id, room_id, tool_ids)
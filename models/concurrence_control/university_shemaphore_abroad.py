@@ -6,22 +6,25 @@ from models.laboratory import Laboratory
 from models.student import Student
 
 class UniversityShemaphoreAbroad(University):
+    SIMULATION_POLICY = "serialized"
 
     def __init__(self, laboratories: list[Laboratory], 
                  laboratory_tools: list[LaboratoryTool], students: list[Student]):
-        self.laboratories = laboratories
-        self.laboratory_tools = laboratory_tools
-        self.bookings: list[Booking] = []
-        self.booking_id_counter = 0
-        self.students = students
+        super().__init__(laboratories, laboratory_tools, students)
         self.lock = threading.Lock()  # Mutex for concurrency control
 
+    def instrument_locks(self, monitor):
+        """Records the contention of the global lock of the strategy."""
+        self.lock = monitor.instrument_lock(self.lock, "Global lock")
+
     def to_book(self, student_id: int, room_id: int, tool_ids: list[int]):
         """Creates a booking for a student with the specified room and tools."""
-        self.booking_id_counter += 1
-        booking = Booking(user_id=student_id, booking_id=self.booking_id_counter, room_id_solicited=room_id, tool_ids_solicited=tool_ids)
-        self.bookings.append(booking)
+        booking = self.create_booking(student_id, room_id, tool_ids)
         #print(f"[DEBUG] Creating booking {booking.booking_id} for student {student_id}")
+        if self.requested_units(room_id, tool_ids) is None:
+            # Recurso inexistente o más unidades que las que tiene: nunca se podría conceder
+            booking.reject()
+            return booking.booking_id
 
         with self.lock:
             room_id = self.book_room(room_id)
@@ -33,53 +36,37 @@ class UniversityShemaphoreAbroad(University):
             booking.add_room(room_id)
             #print(f"[DEBUG] Room {room_id} added to booking {booking.booking_id}")
             
-            while tool_ids:
-                tool_ids_copy = tool_ids[:]
-                for tool_id in tool_ids_copy:
-                        for tool in self.laboratory_tools:
-                            if tool.id == tool_id:
-                                #print(f"[DEBUG] Checking tool {tool.id} status: {tool.status}")
-                                if tool.is_available():
-                                    #print(f"[DEBUG] Booking tool {tool.id} for booking {booking.booking_id}")
-                                    try:
-                                        tool.to_book()
-                                    except ValueError as e:
-                                        #print(f"[DEBUG] Error booking tool {tool.id}: {e}")
-                                        continue    
-                                    booking.add_tool(tool_id)
-                                    tool_ids_copy.remove(tool_id)              
+            pending = list(tool_ids)
+            while pending:
+                for tool_id in pending[:]:
+                    tool = self.registry.find_tool(tool_id)
+                    #print(f"[DEBUG] Checking tool {tool.id} status: {tool.status}")
+                    if tool.try_book():
+                        #print(f"[DEBUG] Booking tool {tool.id} for booking {booking.booking_id}")
+                        booking.add_tool(tool_id)
+                        pending.remove(tool_id)
+                # Bloquear en la cola de la primera herramienta pendiente hasta que se libere
+                if pending:
+                    self.registry.find_tool(pending[0]).wait_until_available()
 
-        if not tool_ids:
-            #print(f"[DEBUG] Booking {booking.booking_id} approved")
-            booking.approve()
-            self.use_booking(booking.booking_id)
-            return booking.booking_id
-        
-        if booking.status == StatusBooking.PENDING:
-            #print(f"[DEBUG] Booking {booking.booking_id} pending, no tools available")
-            booking.reject()
-            return booking.booking_id
+        #print(f"[DEBUG] Booking {booking.booking_id} approved")
+        booking.approve()
+        self.use_booking(booking.booking_id)
+        return booking.booking_id
 
     def book_room(self, room_id: int):
         """Attempts to book a room by its ID, returning the room ID if successful or 0 if not."""
-        room = None
-
         # Entrada a la sección crítica
-        for laboratory in self.laboratories:
-            if laboratory.id == room_id:
-                room = laboratory 
+        room = self.registry.find_laboratory(room_id)
 
         if room is not None:
             while True:
                 #print(f"[DEBUG] Checking room {room.id} status: {room.status}")
                 #print(f"[DEBUG)] Room {room.id} available: {room.is_available()}")
-                if room.is_available():
+                if room.try_book():
                     #print(f"[DEBUG] Booking room {room.id}")
-                    try:
-                        room.to_book()
-                    except ValueError as e:
-                        #print(f"[DEBUG] Error booking room {room.id}: {e}")
-                        continue
-                    return room.id                          
+                    return room.id
+                # Bloquear en la cola del laboratorio hasta que se libere
+                room.wait_until_available()
         #print(f"[DEBUG] Room {room_id} not found")
         return 0
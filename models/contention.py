@@ -0,0 +1,167 @@
+from functools import partial
+from threading import Lock, get_ident
+from time import perf_counter
+
+# ---------------------------------------------------------------
+# Lock contention instrumentation. Disabled by default: laboratories and
+# tools keep `contention = None` and only pay one attribute check per
+# operation. When it is enabled every resource (and every lock of the
+# strategy) gets its own counters.
+# ---------------------------------------------------------------
+
+class ResourceContention:
+    """Contention counters of one laboratory, tool or strategy lock.
+    The counters of a laboratory or tool are updated while holding its own lock."""
+    __slots__ = ("name", "clock", "attempts", "failures", "waits", "wait_time", "holds", "hold_time", "acquired_at")
+
+    def __init__(self, name: str, clock=perf_counter):
+        self.name = name
+        self.clock = clock
+        # Intentos de reserva y cuántos fallaron (vueltas de espera activa o reintentos)
+        self.attempts = 0
+        self.failures = 0
+        # Esperas bloqueantes y tiempo total esperado
+        self.waits = 0
+        self.wait_time = 0.0
+        # Reservas liberadas y tiempo total que estuvo tomado
+        self.holds = 0
+        self.hold_time = 0.0
+        self.acquired_at: float | None = None
+
+    def attempt(self, available: bool, hold: bool = True):
+        """Records a reservation attempt; with `hold`, an available resource becomes held from now."""
+        self.attempts += 1
+        if available:
+            if hold:
+                self.acquired_at = self.clock()
+        else:
+            self.failures += 1
+
+    def released(self):
+        """Records the end of a hold."""
+        if self.acquired_at is not None:
+            self.held(self.acquired_at)
+            self.acquired_at = None
+
+    def held(self, start: float):
+        """Records a hold that started at `start` and ends now."""
+        self.holds += 1
+        self.hold_time += self.clock() - start
+
+    def waited(self, start: float):
+        """Records a blocking wait that started at `start`."""
+        self.waits += 1
+        self.wait_time += self.clock() - start
+
+    def wait(self, condition, predicate, timeout: float | None = None):
+        """Condition.wait_for that records the wait when the predicate is not already true."""
+        if predicate():
+            return True
+        start = self.clock()
+        result = condition.wait_for(predicate, timeout)
+        self.waited(start)
+        return result
+
+    def as_dict(self):
+        return {
+            "attempts": self.attempts,
+            "failures": self.failures,
+            "waits": self.waits,
+            "wait_time": self.wait_time,
+            "avg_wait_time": self.wait_time / self.waits if self.waits else 0.0,
+            "holds": self.holds,
+            "hold_time": self.hold_time,
+            "avg_hold_time": self.hold_time / self.holds if self.holds else 0.0,
+        }
+
+class InstrumentedLock:
+    """Lock or semaphore of a strategy that records its contention. Same interface as threading.Lock;
+    `units` is passed on to counted semaphores (UniversityOrdered). A semaphore can have several
+    holders at once: each one's hold is timed from its own acquisition to its release."""
+    def __init__(self, lock, contention: ResourceContention):
+        self.lock = lock
+        self.contention = contention
+        # Protege los contadores: con semáforos varios hilos tienen el recurso a la vez
+        self.stats_lock = Lock()
+        # Inicios de las tenencias de cada hilo (pila: un hilo puede tomar un semáforo varias veces)
+        self.acquired_at: dict[int, list[float]] = {}
+
+    def acquire(self, blocking: bool = True, timeout: float = -1, units: int = 1):
+        contention = self.contention
+        acquire = self.lock.acquire if units == 1 else partial(self.lock.acquire, units=units)
+        if acquire(False):
+            self.acquired(contention.clock(), waited_since=None)
+            return True
+        if not blocking:
+            with self.stats_lock:
+                contention.attempt(False)
+            return False
+        start = contention.clock()
+        if acquire(True, timeout):
+            self.acquired(contention.clock(), waited_since=start)
+            return True
+        with self.stats_lock:
+            contention.attempt(False)
+            contention.waited(start)
+        return False
+
+    def acquired(self, now: float, waited_since: float | None):
+        """Records a successful acquisition by this thread (after a failed try if it waited)."""
+        contention = self.contention
+        with self.stats_lock:
+            contention.attempt(True, hold=False)
+            if waited_since is not None:
+                contention.failures += 1
+                contention.waited(waited_since)
+            self.acquired_at.setdefault(get_ident(), []).append(now)
+
+    def release(self, units: int = 1):
+        with self.stats_lock:
+            starts = self.acquired_at.get(get_ident())
+            if starts:
+                self.contention.held(starts.pop())
+                if not starts:
+                    del self.acquired_at[get_ident()]
+        if units == 1:
+            self.lock.release()
+        else:
+            self.lock.release(units)
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, *args):
+        self.release()
+
+class ContentionMonitor:
+    """Collects the contention counters of the resources and locks of one university."""
+    def __init__(self, clock=perf_counter):
+        self.clock = clock
+        self.resources: dict[str, ResourceContention] = {}
+
+    def counters(self, name: str):
+        """Counters registered under `name` (created on first use)."""
+        if name not in self.resources:
+            self.resources[name] = ResourceContention(name, self.clock)
+        return self.resources[name]
+
+    def watch(self, resource, name: str):
+        """Starts recording the contention of a laboratory or tool."""
+        resource.contention = self.counters(name)
+        return resource.contention
+
+    def instrument_lock(self, lock, name: str):
+        """Returns `lock` wrapped so its acquisitions are recorded under `name`."""
+        return InstrumentedLock(lock, self.counters(name))
+
+    def as_dict(self):
+        """Counters of every resource and lock, by name."""
+        return {name: contention.as_dict() for name, contention in self.resources.items()}
+
+    def totals(self):
+        """Counters added over every resource and lock."""
+        totals = {"attempts": 0, "failures": 0, "waits": 0, "wait_time": 0.0, "holds": 0, "hold_time": 0.0}
+        for contention in self.resources.values():
+            for key in totals:
+                totals[key] += getattr(contention, key)
+        return totals
@@ -0,0 +1,44 @@
+from .laboratory import Laboratory
+from .laboratory_tool import LaboratoryTool
+
+# ID de laboratorio de una solicitud que acepta cualquier laboratorio con las herramientas pedidas
+# (los IDs de laboratorio empiezan en 1)
+ANY_LABORATORY = 0
+
+class ResourceRegistry:
+    """Hash indexes over laboratories and tools for O(1) lookups. Bookings are looked up in the BookingStore."""
+    def __init__(self, laboratories: list[Laboratory], laboratory_tools: list[LaboratoryTool]):
+        # Índice id -> laboratorio
+        self.laboratories: dict[int, Laboratory] = {lab.id: lab for lab in laboratories}
+        # Índice id -> herramienta
+        self.laboratory_tools: dict[int, LaboratoryTool] = {tool.id: tool for tool in laboratory_tools}
+        # Índice de capacidades: herramienta -> IDs de los laboratorios que la ofrecen
+        self.laboratories_by_tool: dict[int, set[int]] = {}
+        for lab in laboratories:
+            for tool_id in lab.tools:
+                self.laboratories_by_tool.setdefault(tool_id, set()).add(lab.id)
+        # Laboratorios compatibles ya calculados por conjunto de herramientas (los laboratorios no cambian)
+        self.compatible: dict[frozenset, tuple[Laboratory, ...]] = {}
+
+    def find_laboratory(self, laboratory_id: int):
+        """Returns the laboratory with the given ID or None if it does not exist."""
+        return self.laboratories.get(laboratory_id)
+
+    def find_tool(self, tool_id: int):
+        """Returns the tool with the given ID or None if it does not exist."""
+        return self.laboratory_tools.get(tool_id)
+
+    def find_tools(self, tool_ids: list[int]):
+        """Returns the existing tools for the given IDs, preserving the requested order."""
+        return [self.laboratory_tools[tool_id] for tool_id in tool_ids if tool_id in self.laboratory_tools]
+
+    def compatible_laboratories(self, tool_ids: list[int]):
+        """Laboratories that offer every requested tool, in ID order. Computed once per set of tools
+        by intersecting the capability index, starting from the rarest tool."""
+        key = frozenset(tool_ids)
+        compatible = self.compatible.get(key)
+        if compatible is None:
+            lab_ids = sorted((self.laboratories_by_tool.get(tool_id, set()) for tool_id in key), key=len)
+            lab_ids = set.intersection(*lab_ids) if lab_ids else set(self.laboratories)
+            compatible = self.compatible[key] = tuple(self.laboratories[lab_id] for lab_id in sorted(lab_ids))
+        return compatible
@@ -0,0 +1,113 @@
+from .status_source import Status
+from threading import Condition, RLock
+from .slot_calendar import PoolCalendar
+
+class ResourcePool:
+    """Counted pool of `capacity` identical units of a laboratory or tool, with its own lock and wait queue.
+    Each unit is free, reserved or in use."""
+    def __init__(self, capacity: int = 1):
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+        self.status: Status = Status.AVAILABLE
+        # Lock propio del recurso: protege las transiciones de estado
+        self.lock = RLock()
+        # Cola de espera propia del recurso: release() solo despierta
+        # a los hilos que esperan por este recurso
+        self.condition = Condition(self.lock)
+        # Unidades del recurso: semáforo contado sobre la condición del recurso.
+        # El estado es AVAILABLE con todas las unidades libres, IN_USE si alguna está en uso y RESERVERD si no
+        self.capacity = capacity
+        self.free_units = capacity
+        self.reserved_units = 0
+        self.units_in_use = 0
+        # Franjas [inicio, fin) reservadas a futuro; se consultan y modifican con el lock del recurso
+        self.calendar = PoolCalendar(capacity)
+
+    # Contadores de contención del recurso (None: instrumentación desactivada)
+    contention = None
+
+    def try_book(self, units: int = 1):
+        """Atomically reserves `units` units if that many are free. Returns True on success."""
+        with self.lock:
+            available = self.free_units >= units
+            if self.contention is not None:
+                # Se mide el tiempo ocupado: desde que se toma la primera unidad hasta que se liberan todas
+                self.contention.attempt(available, hold=self.free_units == self.capacity)
+            if not available:
+                return False
+            self.free_units -= units
+            self.reserved_units += units
+            self.update_status()
+            return True
+
+    def try_use(self, units: int = 1):
+        """Atomically changes `units` reserved units to IN_USE. Returns True on success."""
+        with self.lock:
+            if self.reserved_units < units:
+                return False
+            self.reserved_units -= units
+            self.units_in_use += units
+            self.update_status()
+            return True
+
+    def to_use(self):
+        """Changes one unit to IN_USE, reserving it first if needed."""
+        with self.lock:
+            if not self.try_use() and self.try_book():
+                self.try_use()
+
+    def release(self, units: int = 1, in_use: bool = False):
+        """Frees `units` units that are in use (`in_use`) or only reserved, and wakes up the waiters.
+        If fewer units are in that state, the rest are freed from the other one. Returns True if any unit was taken."""
+        with self.condition:
+            taken = self.capacity - self.free_units
+            units = min(units, taken)
+            if in_use:
+                from_use = min(units, self.units_in_use)
+                from_reserved = units - from_use
+            else:
+                from_reserved = min(units, self.reserved_units)
+                from_use = units - from_reserved
+            self.reserved_units -= from_reserved
+            self.units_in_use -= from_use
+            self.free_units += units
+            if self.free_units == self.capacity and taken and self.contention is not None:
+                self.contention.released()
+            self.update_status()
+            self.condition.notify_all()
+            return taken > 0
+
+    def update_status(self):
+        """Derives the status from the unit counters. Must be called with the lock held."""
+        if self.free_units == self.capacity:
+            self.status = Status.AVAILABLE
+        elif self.units_in_use:
+            self.status = Status.IN_USE
+        else:
+            self.status = Status.RESERVERD
+
+    def is_available(self, units: int = 1):
+        """Checks if `units` units are free."""
+        return self.free_units >= units
+
+    def wait_until_available(self, timeout: float | None = None, cancelled=None, units: int = 1):
+        """Blocks until `units` units are free, `cancelled()` returns True (woken with notify_all)
+        or the timeout expires. Returns True if they are available or the wait was cancelled."""
+        predicate = lambda: self.is_available(units)
+        if cancelled is not None:
+            predicate = lambda: self.is_available(units) or cancelled()
+        with self.condition:
+            if self.contention is not None:
+                return self.contention.wait(self.condition, predicate, timeout)
+            return self.condition.wait_for(predicate, timeout)
+
+    def __getstate__(self):
+        """Copies and pickles the state without the lock (it cannot be copied); a new one is created."""
+        state = self.__dict__.copy()
+        del state["lock"], state["condition"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lock = RLock()
+        self.condition = Condition(self.lock)
@@ -0,0 +1,285 @@
+import gc
+import random
+from collections import Counter, deque
+
+from models.registry import ANY_LABORATORY
+from models.simulation.engine import Simulator, Suspend, Timeout, VirtualLock, Wait
+
+# ---------------------------------------------------------------
+# Acquisition policies. Each one reproduces, in virtual time, the way a
+# strategy of models/concurrence_control acquires the room and the tools.
+# They are generator processes: they yield Timeout/Wait commands to the engine.
+# ---------------------------------------------------------------
+
+def acquire(resource, deadline: float | None, simulation, units: int = 1):
+    """Reserves `units` units of `resource`, waiting on its queue until they are free or the deadline passes."""
+    while not resource.try_book(units):
+        remaining = None if deadline is None else deadline - simulation.simulator.now
+        if remaining is not None and remaining <= 0:
+            return False
+        yield Wait(resource, remaining)
+    return True
+
+def acquire_tools(tools, booking, deadline: float | None, simulation):
+    """Reserves the tools as they become free (holding the ones already taken), like University.to_book.
+    A tool appears once per requested unit."""
+    pending = list(tools)
+    while pending:
+        for tool in pending[:]:
+            if tool.try_book():
+                booking.add_tool(tool.id)
+                pending.remove(tool)
+        if pending:
+            remaining = None if deadline is None else deadline - simulation.simulator.now
+            if remaining is not None and remaining <= 0:
+                return False
+            yield Wait(pending[0], remaining)
+    return True
+
+def requested_units(room, tools, booking):
+    """(resource, units) pairs of the booking like University.requested_units, from the room and the
+    tools found (one per requested unit). None if a resource does not exist or lacks the units."""
+    units = Counter(tools)
+    if room is None or len(tools) != len(booking.tool_ids_solicited):
+        return None
+    requested = [(room, 1)] + [(tool, units[tool]) for tool in sorted(units, key=lambda tool: tool.id)]
+    if any(n > resource.capacity for resource, n in requested):
+        return None
+    return requested
+
+def use_and_release(university, booking, room, tools, simulation):
+    """Approves, uses (TOOL_USE_TIME per tool) and releases the booking, like University.use_booking."""
+    booking.approve()
+    booking.in_use()
+    room.try_use()
+    for tool in tools:
+        tool.try_use()
+        yield Timeout(university.TOOL_USE_TIME)
+    booking.finish()
+    university.release_booking(booking.booking_id)
+    simulation.notify_released(room, tools)
+
+def hold_and_wait(university, booking, room, tools, simulation):
+    """University, UniversityMutex, UniversityShemaphore: room first, then tools one by one, 5 s timeout.
+    As in those strategies, a rejected booking keeps what it had reserved (release_booking only frees FINISHED bookings)."""
+    deadline = simulation.simulator.now + university.BOOKING_TIMEOUT
+    if room is None or not (yield from acquire(room, deadline, simulation)):
+        booking.reject()
+        return
+    booking.add_room(room.id)
+    if len(tools) != len(booking.tool_ids_solicited):
+        # Herramienta inexistente: la estrategia reintenta hasta agotar el tiempo
+        yield Timeout(max(0.0, deadline - simulation.simulator.now))
+        booking.reject()
+        return
+    if not (yield from acquire_tools(tools, booking, deadline, simulation)):
+        booking.reject()
+        return
+    yield from use_and_release(university, booking, room, tools, simulation)
+
+def serialized(university, booking, room, tools, simulation):
+    """UniversityMutexAbroad, UniversityShemaphoreAbroad: one global lock held while acquiring room and tools.
+    A request that could never be granted is rejected before taking the lock."""
+    if requested_units(room, tools, booking) is None:
+        booking.reject()
+        return
+    lock = simulation.global_lock
+    while not lock.try_acquire():
+        yield Wait(lock)
+    try:
+        yield from acquire(room, None, simulation)
+        booking.add_room(room.id)
+        yield from acquire_tools(tools, booking, None, simulation)
+    finally:
+        lock.release()
+        simulation.simulator.notify(lock)
+    yield from use_and_release(university, booking, room, tools, simulation)
+
+class AllOrNothingGate:
+    """Waiters of the all-or-nothing policy grouped by requested resource set (FIFO inside each group).
+    On every release only the head of each group is checked, so the cost does not grow with the
+    number of waiting students."""
+    def __init__(self, simulator: Simulator):
+        self.simulator = simulator
+        self.groups: dict[tuple, deque] = {}
+        self.arrivals = 0
+
+    def wait(self, requested, process, deadline: float):
+        """Queues a process that needs the units of all the (resource, units) pairs at once, until `deadline`."""
+        key = tuple((id(resource), units) for resource, units in requested)
+        self.groups.setdefault(key, deque()).append((self.arrivals, requested, process, deadline))
+        self.arrivals += 1
+
+    def grant_waiters(self):
+        """Reserves resources for the oldest satisfiable waiters and resumes them. Waiters whose deadline
+        passed (their process was resumed by the timeout) are dropped."""
+        while True:
+            oldest = None
+            for key, queue in list(self.groups.items()):
+                while queue and queue[0][3] <= self.simulator.now:
+                    queue.popleft()
+                if not queue:
+                    del self.groups[key]
+                    continue
+                order, requested, _, _ = queue[0]
+                if (oldest is None or order < oldest[0]) and all(resource.is_available(units) for resource, units in requested):
+                    oldest = (order, key)
+            if oldest is None:
+                return
+            queue = self.groups[oldest[1]]
+            _, requested, process, _ = queue.popleft()
+            if not queue:
+                del self.groups[oldest[1]]
+            for resource, units in requested:
+                resource.try_book(units)
+            self.simulator.resume(process)
+
+def all_or_nothing(university, booking, room, tools, simulation):
+    """UniversityRelease, UniversityPrevention: room and tools are reserved together, like University.acquire_all,
+    with a 5 s timeout (nothing is held while waiting)."""
+    requested = requested_units(room, tools, booking)
+    if requested is None:
+        booking.reject()
+        return
+    if all(resource.is_available(units) for resource, units in requested):
+        for resource, units in requested:
+            resource.try_book(units)
+    else:
+        # La compuerta reserva todos los recursos antes de reanudar el proceso (True) o vence el timeout (False)
+        deadline = simulation.simulator.now + university.BOOKING_TIMEOUT
+        register = lambda process: simulation.all_or_nothing_gate.wait(requested, process, deadline)
+        if not (yield Suspend(register, university.BOOKING_TIMEOUT)):
+            booking.reject()
+            return
+    booking.add_room(room.id)
+    for tool in tools:
+        booking.add_tool(tool.id)
+    yield from use_and_release(university, booking, room, tools, simulation)
+
+def ordered(university, booking, room, tools, simulation):
+    """UniversityOrdered: resources acquired in canonical order (room, then tools by ID), all the units of
+    each one at once, with a 5 s timeout."""
+    requested = requested_units(room, tools, booking)
+    if requested is None:
+        booking.reject()
+        return
+    deadline = simulation.simulator.now + university.BOOKING_TIMEOUT
+    acquired = []
+    for resource, units in requested:
+        if not (yield from acquire(resource, deadline, simulation, units)):
+            for held, held_units in acquired:
+                held.release(held_units)
+            simulation.notify_released(None, [held for held, _ in acquired])
+            booking.reject()
+            return
+        acquired.append((resource, units))
+    booking.add_room(room.id)
+    for tool in tools:
+        booking.add_tool(tool.id)
+    yield from use_and_release(university, booking, room, tools, simulation)
+
+def banker(university, booking, room, tools, simulation):
+    """UniversityBanker: admission by the Banker (waiters woken in FIFO order), then room and tools.
+    A second booking of a student is refused while the first holds its row and retries when it is released."""
+    request = university.admission_request(booking.room_id_solicited, booking.tool_ids_solicited)
+    if booking.user_id not in university.banker.process_index or request is None:
+        booking.reject()
+        return
+    while not university.banker.request_resources(booking.user_id, request):
+        yield Wait(university.banker)
+    # Como UniversityBanker.to_book: release_booking devuelve la fila del estudiante solo si fue admitida
+    university.admitted[booking.booking_id] = booking.user_id
+    yield from acquire(room, None, simulation)
+    booking.add_room(room.id)
+    yield from acquire_tools(tools, booking, None, simulation)
+    yield from use_and_release(university, booking, room, tools, simulation)
+
+POLICIES = {
+    "hold_and_wait": hold_and_wait,
+    "serialized": serialized,
+    "all_or_nothing": all_or_nothing,
+    "ordered": ordered,
+    "banker": banker,
+}
+
+def simulation_policy(university_class):
+    """Policy of a strategy class: the SIMULATION_POLICY declared by the class that defines its to_book.
+    Raises ValueError if that class declares none, so a strategy that replaces the acquisition of its
+    parent is never simulated with the policy of the parent."""
+    owner = next(cls for cls in university_class.__mro__ if "to_book" in vars(cls))
+    name = vars(owner).get("SIMULATION_POLICY")
+    if name not in POLICIES:
+        raise ValueError(f"{university_class.__name__} has no discrete-event simulation policy")
+    return POLICIES[name]
+
+class DiscreteEventSimulation:
+    """Runs the bookings of a university strategy in virtual time, with an event heap instead of threads.
+    Results are deterministic for a given seed and are read with university.get_booking_stats()."""
+    def __init__(self, university, seed: int | None = None):
+        self.university = university
+        self.simulator = Simulator()
+        self.random = random.Random(seed)
+        self.policy = simulation_policy(type(university))
+        # Lock global de las estrategias que serializan todas las reservas
+        self.global_lock = VirtualLock()
+        # Esperas de las estrategias que reservan todo o nada
+        self.all_or_nothing_gate = AllOrNothingGate(self.simulator)
+        # Las reservas toman sus tiempos del reloj virtual
+        university.clock = self.simulator.clock
+
+    def random_requests(self, student_ids):
+        """Yields one request per student, drawn like University.random_booking, all arriving at t=0."""
+        room_ids = [laboratory.id for laboratory in self.university.laboratories]
+        tool_ids = [tool.id for tool in self.university.laboratory_tools]
+        for student_id in student_ids:
+            room_id = self.random.choice(room_ids)
+            yield student_id, 0.0, room_id, self.random.sample(tool_ids, k=min(3, len(tool_ids)))
+
+    def booking_process(self, student_id: int, room_id: int, tool_ids: list[int]):
+        """Process of a single booking: creates it at its arrival time and runs the strategy policy.
+        An ANY_LABORATORY request gets its laboratory from University.choose_laboratory at that time."""
+        if room_id == ANY_LABORATORY:
+            room_id = self.university.choose_laboratory(tool_ids)
+        booking = self.university.create_booking(student_id, room_id, list(tool_ids))
+        room = self.university.registry.find_laboratory(room_id)
+        # Una herramienta por unidad pedida, en orden de ID
+        tools = self.university.registry.find_tools(sorted(tool_ids))
+        yield from self.policy(self.university, booking, room, tools, self)
+
+    def notify_released(self, room, tools):
+        """Wakes the processes waiting on the released room, tools and (for the Banker) admission."""
+        if room is not None:
+            self.simulator.notify(room)
+        for tool in tools:
+            self.simulator.notify(tool)
+        banker = getattr(self.university, "banker", None)
+        if banker is not None:
+            self.simulator.notify(banker)
+        if self.all_or_nothing_gate.groups:
+            self.all_or_nothing_gate.grant_waiters()
+
+    def arrivals(self, requests):
+        """Process that starts each booking at its arrival time. The requests (in arrival order) are
+        read one at a time, so a lazy stream is never held in memory."""
+        for student_id, arrival, room_id, tool_ids in requests:
+            if arrival > self.simulator.now:
+                yield Timeout(arrival - self.simulator.now)
+            self.simulator.start(self.booking_process(student_id, room_id, tool_ids), at=self.simulator.now)
+
+    def run(self, requests, until: float | None = None):
+        """Schedules every request (student_id, arrival, room_id, tool_ids) and runs the simulation.
+        A list is scheduled at once; any other iterable is read lazily and must be in arrival order."""
+        # Con cientos de miles de procesos vivos las pasadas del recolector cíclico dominan el tiempo
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            if isinstance(requests, list):
+                for student_id, arrival, room_id, tool_ids in requests:
+                    self.simulator.start(self.booking_process(student_id, room_id, tool_ids), at=arrival)
+            else:
+                self.simulator.start(self.arrivals(requests))
+            self.simulator.run(until)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return self.university
@@ -0,0 +1,145 @@
+from collections import deque
+from heapq import heappop, heappush
+from itertools import count
+
+class Timeout:
+    """Command yielded by a process to advance `delay` virtual seconds."""
+    def __init__(self, delay: float):
+        self.delay = delay
+
+class Wait:
+    """Command yielded by a process to block on an object until it is notified or `timeout` expires.
+    The process is resumed with True when notified and with False on timeout."""
+    def __init__(self, target, timeout: float | None = None):
+        self.target = target
+        self.timeout = timeout
+
+class Suspend:
+    """Command yielded by a process to sleep until another component calls Simulator.resume on it.
+    `register` is called with the suspended process so that component can keep it. If `timeout`
+    expires first the process is resumed with False and a later resume is ignored."""
+    def __init__(self, register=None, timeout: float | None = None):
+        self.register = register
+        self.timeout = timeout
+
+class WaitRecord:
+    """A pending Wait: the process is resumed by the first of notification or timeout."""
+    def __init__(self, process, target):
+        self.process = process
+        self.target = target
+        self.active = True
+
+class VirtualLock:
+    """Non-reentrant lock for processes of the simulation (the global lock of the Abroad strategies)."""
+    def __init__(self):
+        self.held = False
+
+    def try_acquire(self):
+        if self.held:
+            return False
+        self.held = True
+        return True
+
+    def release(self):
+        self.held = False
+
+    def is_available(self):
+        return not self.held
+
+class Simulator:
+    """Discrete-event engine: a virtual clock and a heap of events that resume generator processes."""
+    def __init__(self):
+        # Reloj virtual (segundos simulados)
+        self.now = 0.0
+        # Montículo de eventos: (tiempo, secuencia, registro de espera o None, proceso, valor)
+        self.events = []
+        # La secuencia desempata eventos simultáneos en orden de llegada: ejecución determinista
+        self.sequence = count()
+        # Colas de espera FIFO por objeto (laboratorio, herramienta, lock, banquero...)
+        self.waiters: dict[int, deque[WaitRecord]] = {}
+        # Suspensiones con timeout pendientes: proceso -> registro que anula el timeout al reanudarlo
+        self.suspensions: dict = {}
+        self.processed_events = 0
+
+    def clock(self):
+        """Returns the current virtual time. Used in place of time.time()."""
+        return self.now
+
+    def start(self, process, at: float = 0.0):
+        """Schedules a generator process to start at the given virtual time."""
+        self.schedule(at, None, process, None)
+
+    def schedule(self, at: float, record, process, value):
+        heappush(self.events, (at, next(self.sequence), record, process, value))
+
+    def resume(self, process, value=True):
+        """Resumes a suspended process at the current virtual time. Returns False if its timeout already expired."""
+        record = self.suspensions.pop(process, None)
+        if record is not None:
+            if not record.active:
+                return False
+            record.active = False
+        self.schedule(self.now, None, process, value)
+        return True
+
+    def notify(self, target):
+        """Wakes the first active waiter of `target`. Further waiters are woken in cascade while
+        `target` stays available after each resumed process runs."""
+        queue = self.waiters.get(id(target))
+        while queue:
+            record = queue.popleft()
+            if record.active:
+                record.active = False
+                self.schedule(self.now, record, record.process, True)
+                return
+
+    def run(self, until: float | None = None):
+        """Processes events in time order until the heap is empty (or `until` is reached)."""
+        while self.events:
+            if until is not None and self.events[0][0] > until:
+                break
+            at, _, record, process, value = heappop(self.events)
+            if record is not None:
+                # Una espera se reanuda una sola vez: la notificación y el timeout se anulan entre sí
+                if value is False:
+                    if not record.active:
+                        continue
+                    record.active = False
+                    if record.target is None:
+                        self.suspensions.pop(process, None)
+            self.now = at
+            self.processed_events += 1
+            self.step(process, value, record.target if record is not None and value is True else None)
+
+    def step(self, process, value, notified_by=None):
+        """Resumes a process until its next command and registers that command."""
+        try:
+            command = process.send(value)
+        except StopIteration:
+            command = None
+
+        if isinstance(command, Timeout):
+            self.schedule(self.now + command.delay, None, process, None)
+        elif isinstance(command, Wait):
+            record = WaitRecord(process, command.target)
+            queue = self.waiters.setdefault(id(command.target), deque())
+            if command.target is notified_by:
+                # Despertado pero no pudo avanzar: conserva su turno al frente de la cola
+                queue.appendleft(record)
+            else:
+                queue.append(record)
+            if command.timeout is not None:
+                self.schedule(self.now + max(0.0, command.timeout), record, process, False)
+        elif isinstance(command, Suspend):
+            if command.timeout is not None:
+                record = WaitRecord(process, None)
+                self.suspensions[process] = record
+                self.schedule(self.now + max(0.0, command.timeout), record, process, False)
+            if command.register is not None:
+                command.register(process)
+
+        # Si el recurso que lo despertó sigue libre, despertar al siguiente en espera
+        if notified_by is not None and not (isinstance(command, Wait) and command.target is notified_by):
+            is_available = getattr(notified_by, "is_available", None)
+            if is_available is None or is_available():
+                self.notify(notified_by)
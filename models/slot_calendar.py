@@ -0,0 +1,112 @@
+from array import array
+from bisect import bisect_left, bisect_right
+
+class SlotCalendar:
+    """Sorted-array calendar of the [start, end) slots booked on one laboratory or tool.
+    The slots of a resource never overlap, so sorting them by start also sorts them by end
+    and every overlap query is a single binary search. Not thread-safe: the resource
+    lock must be held around every call."""
+    __slots__ = ("starts", "ends", "booking_ids")
+
+    def __init__(self):
+        # Columnas ordenadas por inicio (y, como no se solapan, también por fin)
+        self.starts = array("d")
+        self.ends = array("d")
+        self.booking_ids = array("q")
+
+    def __len__(self):
+        return len(self.starts)
+
+    def overlaps(self, start: float, end: float):
+        """True if [start, end) overlaps a booked slot. O(log n)."""
+        i = bisect_right(self.ends, start)
+        return i < len(self.starts) and self.starts[i] < end
+
+    def reserve(self, booking_id: int, start: float, end: float):
+        """Books [start, end) for the booking if it is free. Returns True on success."""
+        if not start < end:
+            raise ValueError("A slot must end after it starts")
+        i = bisect_right(self.ends, start)
+        if i < len(self.starts) and self.starts[i] < end:
+            return False
+        self.starts.insert(i, start)
+        self.ends.insert(i, end)
+        self.booking_ids.insert(i, booking_id)
+        return True
+
+    def free(self, booking_id: int, start: float):
+        """Frees the slot of the booking that starts at `start`. Returns True if it was booked."""
+        i = bisect_left(self.starts, start)
+        if i < len(self.starts) and self.starts[i] == start and self.booking_ids[i] == booking_id:
+            del self.starts[i], self.ends[i], self.booking_ids[i]
+            return True
+        return False
+
+    def next_free(self, start: float, duration: float):
+        """Earliest time t >= start such that [t, t + duration) is free. Each step is a binary
+        search plus one jump over a slot in the way."""
+        starts, ends = self.starts, self.ends
+        i = bisect_right(ends, start)
+        while i < len(starts) and starts[i] < start + duration:
+            start = max(start, ends[i])
+            i += 1
+        return start
+
+    def prune(self, before: float):
+        """Forgets the slots that ended at or before `before`. Returns how many were removed."""
+        i = bisect_right(self.ends, before)
+        del self.starts[:i], self.ends[:i], self.booking_ids[:i]
+        return i
+
+    def slots(self):
+        """List of the booked (start, end, booking_id), in time order."""
+        return list(zip(self.starts, self.ends, self.booking_ids))
+
+class PoolCalendar:
+    """Calendar of a resource with `capacity` units: one SlotCalendar per unit. A slot of k units
+    takes k units free for the whole slot, so up to `capacity` slots can overlap."""
+    __slots__ = ("units",)
+
+    def __init__(self, capacity: int = 1):
+        self.units = [SlotCalendar() for _ in range(capacity)]
+
+    def __len__(self):
+        return sum(len(unit) for unit in self.units)
+
+    def free_units(self, start: float, end: float):
+        """Calendars of the units that are free during [start, end)."""
+        return [unit for unit in self.units if not unit.overlaps(start, end)]
+
+    def overlaps(self, start: float, end: float, units: int = 1):
+        """True if fewer than `units` units are free during [start, end)."""
+        return len(self.free_units(start, end)) < units
+
+    def reserve(self, booking_id: int, start: float, end: float, units: int = 1):
+        """Books `units` units for [start, end) if that many are free. Returns True on success."""
+        free = self.free_units(start, end)
+        if len(free) < units:
+            return False
+        for unit in free[:units]:
+            unit.reserve(booking_id, start, end)
+        return True
+
+    def free(self, booking_id: int, start: float):
+        """Frees every unit the booking holds from `start`. Returns True if it held any."""
+        return sum(unit.free(booking_id, start) for unit in self.units) > 0
+
+    def next_free(self, start: float, duration: float, units: int = 1):
+        """Earliest time t >= start at which `units` units are free for [t, t + duration): the
+        candidate moves to the units-th earliest next free time of the units until it is stable."""
+        while True:
+            candidates = sorted(unit.next_free(start, duration) for unit in self.units)
+            if candidates[units - 1] == start:
+                return start
+            start = candidates[units - 1]
+
+    def prune(self, before: float):
+        """Forgets the slots that ended at or before `before`. Returns how many were removed."""
+        return sum(unit.prune(before) for unit in self.units)
+
+    def slots(self):
+        """List of the booked (start, end, booking_id) of every unit, in time order."""
+        return sorted(slot for unit in self.units for slot in unit.slots())
@@ -0,0 +1,172 @@
+import mmap
+import os
+import struct
+import threading
+import weakref
+from time import monotonic_ns
+
+import numpy as np
+
+# ---------------------------------------------------------------
+# Binary trace of booking transitions. Every event is a fixed-size record
+# written with struct.pack_into into a buffer owned by the thread that
+# produces it, so recording takes no lock. A full buffer is copied into a
+# memory-mapped file (the only step that takes a lock) and reused. When the
+# thread ends its buffer is flushed and handed to the next new thread.
+# ---------------------------------------------------------------
+
+# Eventos
+CREATE = 1
+ROOM_ACQUIRED = 2
+TOOL_ACQUIRED = 3
+APPROVE = 4
+IN_USE = 5
+FINISH = 6
+REJECT = 7
+RELEASE = 8
+CANCEL = 9
+# Laboratorio o herramienta solicitados, registrados justo después de create
+REQUEST = 10
+EVENT_NAMES = {
+    CREATE: "create", ROOM_ACQUIRED: "room_acquired", TOOL_ACQUIRED: "tool_acquired",
+    APPROVE: "approve", IN_USE: "in_use", FINISH: "finish", REJECT: "reject",
+    RELEASE: "release", CANCEL: "cancel", REQUEST: "request",
+}
+
+# Tipo del recurso de un evento
+NO_RESOURCE = 0
+LABORATORY = 1
+TOOL = 2
+# En los eventos create el recurso es el estudiante de la reserva
+STUDENT = 3
+
+# Registro: tiempo monotónico (ns), reserva, recurso, hilo, evento, tipo de recurso y 2 bytes de relleno.
+# El hilo es el mismo para todo un búfer: no se escribe en cada evento sino al vaciarlo
+RECORD = struct.Struct("<qIiIBB2x")
+EVENT = struct.Struct("<qIi4xBB2x")
+RECORD_SIZE = RECORD.size
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<i8"), ("booking_id", "<u4"), ("resource_id", "<i4"), ("thread_id", "<u4"),
+    ("event", "u1"), ("resource_kind", "u1"), ("padding", "V2"),
+])
+# Cabecera del archivo: identificador y número de registros escritos
+HEADER = struct.Struct("<8sQ")
+MAGIC = b"BKTRACE1"
+
+class ThreadBufferOwner:
+    """Token kept in the thread-local of a recorder: it is discarded when the thread ends."""
+    __slots__ = ("__weakref__",)
+
+class TraceRecorder:
+    """Records booking transitions in per-thread buffers of `buffer_records` records and
+    flushes them to a memory-mapped file at `path`. Call close() when the run ends."""
+    def __init__(self, path: str, buffer_records: int = 4096, initial_records: int = 1 << 16):
+        self.path = path
+        self.buffer_size = buffer_records * RECORD_SIZE
+        # Búfer de cada hilo vivo (datos y posición de escritura); se registran para vaciarlos al cerrar.
+        # Los búferes de los hilos terminados se vacían y se reutilizan: hay tantos como hilos vivos
+        self.local = threading.local()
+        self.buffers: dict[int, list] = {}
+        self.free_buffers: list = []
+        self.buffers_lock = threading.Lock()
+        # El archivo crece al doble cuando se llena; solo el vaciado toma este lock
+        self.file_lock = threading.Lock()
+        self.records = 0
+        self.file = open(path, "w+b")
+        self.file.truncate(HEADER.size + initial_records * RECORD_SIZE)
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        self.pack_into = EVENT.pack_into
+
+    def record(self, event: int, booking_id: int, resource_kind: int = NO_RESOURCE, resource_id: int = 0):
+        """Appends one event to the buffer of the current thread."""
+        try:
+            buffer = self.local.buffer
+        except AttributeError:
+            buffer = self.thread_buffer()
+        offset = buffer[1]
+        self.pack_into(buffer[0], offset, monotonic_ns(), booking_id, resource_id, event, resource_kind)
+        buffer[1] = offset = offset + RECORD_SIZE
+        if offset == self.buffer_size:
+            self.flush_buffer(buffer, offset)
+            buffer[1] = 0
+
+    def thread_buffer(self):
+        """Gives the current thread a buffer [data, write offset, thread id], reusing one of a finished thread.
+        It is returned when the thread ends and its thread-local values are discarded."""
+        with self.buffers_lock:
+            buffer = self.free_buffers.pop() if self.free_buffers else [bytearray(self.buffer_size), 0, 0]
+            self.buffers[id(buffer)] = buffer
+        buffer[2] = threading.get_native_id() & 0xFFFFFFFF
+        # El testigo solo vive en el thread-local: al terminar el hilo se descarta y devuelve el búfer
+        owner = ThreadBufferOwner()
+        weakref.finalize(owner, self.return_buffer, buffer).atexit = False
+        self.local.owner = owner
+        self.local.buffer = buffer
+        return buffer
+
+    def return_buffer(self, buffer):
+        """Flushes the buffer of a finished thread and keeps it for the next new thread."""
+        with self.buffers_lock:
+            if self.buffers.pop(id(buffer), None) is None:
+                return
+            if not self.map.closed:
+                self.flush_buffer(buffer, buffer[1])
+            buffer[1] = 0
+            self.free_buffers.append(buffer)
+
+    def flush_buffer(self, buffer, size: int):
+        """Copies the first `size` bytes of a thread buffer to the file."""
+        if size == 0:
+            return
+        np.frombuffer(buffer[0], dtype=RECORD_DTYPE, count=size // RECORD_SIZE)["thread_id"] = buffer[2]
+        with self.file_lock:
+            start = HEADER.size + self.records * RECORD_SIZE
+            if start + size > len(self.map):
+                new_size = max(2 * len(self.map), start + size)
+                self.file.truncate(new_size)
+                self.map.resize(new_size)
+            self.map[start:start + size] = memoryview(buffer[0])[:size]
+            self.records += size // RECORD_SIZE
+            HEADER.pack_into(self.map, 0, MAGIC, self.records)
+
+    def flush(self):
+        """Flushes the buffer of the current thread."""
+        buffer = getattr(self.local, "buffer", None)
+        if buffer is not None:
+            self.flush_buffer(buffer, buffer[1])
+            buffer[1] = 0
+
+    def close(self):
+        """Flushes the buffers of every thread (they must have finished recording) and closes the file."""
+        with self.buffers_lock:
+            if self.map.closed:
+                return
+            for buffer in self.buffers.values():
+                self.flush_buffer(buffer, buffer[1])
+                buffer[1] = 0
+            self.free_buffers.clear()
+            with self.file_lock:
+                HEADER.pack_into(self.map, 0, MAGIC, self.records)
+                self.map.flush()
+                self.map.close()
+                self.file.truncate(HEADER.size + self.records * RECORD_SIZE)
+                self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def read_trace(path: str):
+    """Reads a trace file as a numpy structured array sorted by timestamp."""
+    with open(path, "rb") as file:
+        magic, records = HEADER.unpack(file.read(HEADER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a booking trace")
+        events = np.fromfile(file, dtype=RECORD_DTYPE, count=records)
+    return events[np.argsort(events["timestamp"], kind="stable")]
+
+def trace_size(path: str):
+    """Number of records of a trace file."""
+    return (os.path.getsize(path) - HEADER.size) // RECORD_SIZE
@@ -1,49 +1,115 @@
 from .laboratory import Laboratory
 from .laboratory_tool import LaboratoryTool
 from .student import Student
-from .booking import Booking, StatusBooking
+from .booking import ROOM_ASSIGNED, STATUS_BITS, STATUS_BY_CODE, Booking, BookingStore, StatusBooking
 import random
+from collections import Counter
 from time import sleep, time
 from .status_source import Status
+from .registry import ANY_LABORATORY, ResourceRegistry
+from .booking_stats import BookingStats, SubstitutionStats
+from .contention import ContentionMonitor
+from .trace import LABORATORY, RELEASE, TOOL, TraceRecorder
 
 class University:
     """Represents a university with laboratories, tools, and student bookings."""
+    # Tiempo máximo (segundos) que una reserva espera por sus recursos
+    BOOKING_TIMEOUT = 5
+    # Tiempo (segundos) que se usa cada herramienta de una reserva
+    TOOL_USE_TIME = 0.1
+    # Política con la que la simulación de eventos discretos reproduce esta estrategia
+    SIMULATION_POLICY = "hold_and_wait"
+
     def __init__(self, laboratories: list[Laboratory], 
                  laboratory_tools: list[LaboratoryTool], students: list[Student]):
         # Lista de laboratorios disponibles en la universidad
         self.laboratories = laboratories
         # Lista de herramientas de laboratorio disponibles
         self.laboratory_tools = laboratory_tools
-        # Lista de todas las reservas realizadas
-        self.bookings: list[Booking] = []
-        # Contador para asignar IDs únicos a las reservas
-        self.booking_id_counter = 0
         # Lista de estudiantes registrados
         self.students = students
+        # Índices hash para búsquedas O(1) de laboratorios y herramientas
+        self.registry = ResourceRegistry(laboratories, laboratory_tools)
+        # Índice código -> estudiante
+        self.students_by_code = {student.code: student for student in students}
+        # Estadísticas incrementales de las reservas (lectura O(1))
+        self.booking_stats = BookingStats()
+        # Contadores de las solicitudes de cualquier laboratorio compatible
+        self.substitution_stats = SubstitutionStats()
+        # Todas las reservas realizadas, en columnas compactas repartidas en fragmentos con su propio lock;
+        # asigna IDs consecutivos desde 1 de forma atómica
+        self.bookings = BookingStore(clock=time, stats=self.booking_stats)
+        # Contadores de contención de locks (None: instrumentación desactivada)
+        self.contention: ContentionMonitor | None = None
+        # Traza binaria de las transiciones de las reservas (None: desactivada)
+        self.trace: TraceRecorder | None = None
+
+    @property
+    def clock(self):
+        """Clock of the bookings (the discrete-event simulation replaces it with a virtual one)."""
+        return self.bookings.clock
+
+    @clock.setter
+    def clock(self, clock):
+        self.bookings.clock = clock
+
+    @property
+    def booking_id_counter(self):
+        """ID of the last booking created."""
+        return self.bookings.last_id()
+
+    def enable_contention_metrics(self, clock=None):
+        """Starts recording attempts, failures, wait time and hold time of every laboratory, tool
+        and strategy lock. Must be called before the bookings start. Returns the monitor."""
+        if self.contention is None:
+            self.contention = ContentionMonitor(clock) if clock is not None else ContentionMonitor()
+            for laboratory in self.laboratories:
+                self.contention.watch(laboratory, f"Laboratory {laboratory.id}")
+            for tool in self.laboratory_tools:
+                self.contention.watch(tool, f"Tool {tool.id}")
+            self.instrument_locks(self.contention)
+        return self.contention
+
+    def instrument_locks(self, monitor: ContentionMonitor):
+        """Wraps the locks of the strategy with `monitor`. The base class has none."""
+
+    def enable_trace(self, path: str):
+        """Starts recording every booking transition in the binary trace file `path`. Returns the recorder."""
+        if self.trace is None:
+            self.trace = TraceRecorder(path)
+            self.bookings.trace = self.trace
+        return self.trace
+
+    def close_trace(self):
+        """Flushes and closes the trace once the bookings have finished."""
+        if self.trace is not None:
+            self.trace.close()
+            self.bookings.trace = None
+            self.trace = None
+
+    def trace_release(self, booking_id: int, resource):
+        """Records the release of a laboratory or tool of a booking in the trace (if enabled)."""
+        if self.trace is not None:
+            self.trace.record(RELEASE, booking_id, LABORATORY if isinstance(resource, Laboratory) else TOOL, resource.id)
+
+    def create_booking(self, student_id: int, room_id: int, tool_ids: list[int], slot: tuple[float, float] | None = None):
+        """Creates a new pending booking in the booking store, with the next free ID."""
+        return self.bookings.create(student_id, room_id, tool_ids, slot)
 
     def book_room(self, room_id: int):
         """Attempts to book a room by its ID, returning the room ID if successful or 0 if not."""
         start_time = time()
-        room = None
-        
         # Buscar el laboratorio con el ID solicitado
-        for laboratory in self.laboratories:
-            if laboratory.id == room_id:
-                room = laboratory 
+        room = self.registry.find_laboratory(room_id)
 
         if room is not None:
             while True:
                 # Si el laboratorio está disponible, intentar reservarlo
-                if room.is_available():
-                    try:
-                        room.to_book()
-                    except ValueError as e:
-                        # Si ocurre un error al reservar, intentar de nuevo
-                        continue
+                if room.try_book():
                     return room.id
-                # Si pasa más de 5 segundos, cancelar la reserva
-                elif time() - start_time > 5:  # Timeout
-                    return 0                           
+                # Esperar a que se libere; si pasan más de 5 segundos, cancelar la reserva
+                elif not self.wait_for_resource(room, start_time):  # Timeout
+                    return 0
         # Si no se encuentra el laboratorio, retornar 0
         return 0
 
@@ -51,9 +117,7 @@ class University:
         """Creates a booking for a student with the specified room and tools."""
         start_time = time()
         # Incrementar el contador de reservas y crear una nueva reserva
-        self.booking_id_counter += 1
-        booking = Booking(user_id=student_id, booking_id=self.booking_id_counter, room_id_solicited=room_id, tool_ids_solicited=tool_ids)
-        self.bookings.append(booking)
+        booking = self.create_booking(student_id, room_id, tool_ids)
 
         # Intentar reservar el laboratorio
         room_id = self.book_room(room_id)
@@ -68,17 +132,12 @@ class University:
         while tool_ids:
             tool_ids_copy = tool_ids[:]
             for tool_id in tool_ids_copy:
-                for tool in self.laboratory_tools:
-                    if tool.id == tool_id:
-                        if tool.is_available():
-                            try:
-                                tool.to_book()
-                            except ValueError as e:
-                                continue    
-                            booking.add_tool(tool_id)
-                            tool_ids_copy.remove(tool_id)
-            # Si pasa más de 5 segundos, cancelar la reserva
-            if time() - start_time > 5:  # Timeout
+                tool = self.registry.find_tool(tool_id)
+                if tool is not None and tool.try_book():
+                    booking.add_tool(tool_id)
+                    tool_ids_copy.remove(tool_id)
+            # Esperar a que se libere una herramienta pendiente; si pasan más de 5 segundos, cancelar la reserva
+            if tool_ids and not self.wait_for_tools(tool_ids, start_time):  # Timeout
                 booking.reject()
                 self.release_booking(booking_id=booking.booking_id)
                 return booking.booking_id                
@@ -94,6 +153,217 @@ class University:
             booking.reject()
             return booking.booking_id
 
+    def requested_units(self, room_id: int, tool_ids: list[int]):
+        """(resource, units) pairs of a request in canonical order: the room (one unit) and then each
+        distinct tool by ID with the number of times it was requested. Returns None if a resource
+        does not exist or more units are requested than it has."""
+        room = self.registry.find_laboratory(room_id)
+        units = Counter(tool_ids)
+        tools = self.registry.find_tools(sorted(units))
+        if room is None or len(tools) != len(units):
+            return None
+        requested = [(room, 1)] + [(tool, units[tool.id]) for tool in tools]
+        if any(n > resource.capacity for resource, n in requested):
+            return None
+        return requested
+
+    def acquire_all(self, room_id: int, tool_ids: list[int], timeout: float | None = None):
+        """Reserves the room and every requested tool unit in one atomic step, or none of them.
+        Blocks until all of them are free (or the timeout expires). Returns True on success."""
+        requested = self.requested_units(room_id, tool_ids)
+        if requested is None:
+            return False
+
+        # Orden canónico (laboratorio y luego herramientas por ID) para tomar los locks sin interbloqueo
+        deadline = None if timeout is None else time() + timeout
+        while True:
+            for resource, _ in requested:
+                resource.lock.acquire()
+            try:
+                busy = next(((resource, units) for resource, units in requested if not resource.is_available(units)), None)
+                if busy is None:
+                    # Todos libres: reservarlos mientras se mantienen todos los locks
+                    for resource, units in requested:
+                        resource.try_book(units)
+                    return True
+            finally:
+                for resource, _ in reversed(requested):
+                    resource.lock.release()
+
+            # Esperar en la cola del recurso ocupado (sin retener nada) y volver a intentarlo
+            remaining = None if deadline is None else deadline - time()
+            if remaining is not None and remaining <= 0:
+                return False
+            busy[0].wait_until_available(remaining, units=busy[1])
+
+    def to_book_all_or_nothing(self, student_id: int, room_id: int, tool_ids: list[int]):
+        """Creates a booking whose room and tools are reserved together with acquire_all, holding nothing
+        while it waits. It is rejected if a resource does not exist or the booking times out."""
+        booking = self.create_booking(student_id, room_id, tool_ids)
+
+        # Una herramienta pedida k veces son k unidades
+        requested_tool_ids = sorted(tool_ids)
+        # Reservar el laboratorio y todas las herramientas de una vez (o ninguno), esperando sin girar
+        if not self.acquire_all(room_id, requested_tool_ids, self.BOOKING_TIMEOUT):
+            booking.reject()
+            return booking.booking_id
+
+        booking.add_room(room_id)
+        for tool_id in requested_tool_ids:
+            booking.add_tool(tool_id)
+
+        booking.approve()
+        self.use_booking(booking.booking_id)
+
+        return booking.booking_id
+
+    # ---------------------------------------------------------------
+    # Solicitudes de cualquier laboratorio que ofrezca las herramientas pedidas: el laboratorio
+    # se elige con el índice de capacidades del registro y la reserva sigue la estrategia.
+    # ---------------------------------------------------------------
+
+    def choose_laboratory(self, tool_ids: list[int], preferred_room_id: int | None = None):
+        """ID of the laboratory for a request that accepts any laboratory offering `tool_ids`: the
+        preferred one (by default the first compatible) if it has a free unit, else the first free
+        compatible one, else the preferred one to wait on. Returns ANY_LABORATORY if no laboratory
+        offers all the tools, which every strategy rejects as an unknown room."""
+        compatible = self.registry.compatible_laboratories(tool_ids)
+        if not compatible:
+            self.substitution_stats.record("incompatible")
+            return ANY_LABORATORY
+        preferred = next((lab for lab in compatible if lab.id == preferred_room_id), compatible[0])
+        if preferred.is_available():
+            self.substitution_stats.record("preferred")
+            return preferred.id
+        # Lectura sin lock: si otra reserva toma el laboratorio antes, esta espera en él como con un ID fijo
+        substitute = next((lab for lab in compatible if lab.is_available()), None)
+        if substitute is not None:
+            self.substitution_stats.record("substituted")
+            return substitute.id
+        self.substitution_stats.record("all_busy")
+        return preferred.id
+
+    def to_book_any(self, student_id: int, tool_ids: list[int], preferred_room_id: int | None = None):
+        """Books the tools in any laboratory that offers them (see choose_laboratory) with the strategy's
+        to_book. Returns what to_book returns: the booking ID, or a coroutine for asyncio strategies."""
+        return self.to_book(student_id, self.choose_laboratory(tool_ids, preferred_room_id), tool_ids)
+
+    # ---------------------------------------------------------------
+    # Reservas por franja [inicio, fin): cada laboratorio y herramienta tiene un calendario
+    # ordenado, así que reservas del mismo recurso que no se solapan se aceptan a la vez.
+    # Las franjas no cambian el estado actual (RESERVED / IN_USE) de los recursos.
+    # ---------------------------------------------------------------
+
+    def book_slot(self, student_id: int, room_id: int, tool_ids: list[int], start: float, end: float):
+        """Books the room and tools for [start, end). The booking is approved if the slot is free on
+        all of them and rejected at once otherwise (it does not wait). Returns the booking ID."""
+        if not start < end:
+            raise ValueError("A slot must end after it starts")
+        booking = self.create_booking(student_id, room_id, tool_ids, (start, end))
+        requested = self.requested_units(room_id, tool_ids)
+        if requested is None:
+            booking.reject()
+            return booking.booking_id
+
+        for resource, _ in requested:
+            resource.lock.acquire()
+        try:
+            free = not any(resource.calendar.overlaps(start, end, units) for resource, units in requested)
+            if free:
+                for resource, units in requested:
+                    resource.calendar.reserve(booking.booking_id, start, end, units)
+        finally:
+            for resource, _ in reversed(requested):
+                resource.lock.release()
+
+        if free:
+            self.approve_slot(booking, requested)
+        else:
+            booking.reject()
+        return booking.booking_id
+
+    def book_first_free_slot(self, student_id: int, room_id: int, tool_ids: list[int],
+                             duration: float, after: float | None = None):
+        """Books the first slot of `duration` seconds, starting at `after` (default: now) or later,
+        that is free on the room and every tool. Returns the booking ID."""
+        booking = self.create_booking(student_id, room_id, tool_ids)
+        requested = self.requested_units(room_id, tool_ids)
+        if requested is None or not duration > 0:
+            booking.reject()
+            return booking.booking_id
+
+        for resource, _ in requested:
+            resource.lock.acquire()
+        try:
+            # Con los locks tomados nadie puede ocupar la franja entre la búsqueda y la reserva
+            start = self.common_free_slot(requested, self.clock() if after is None else after, duration)
+            for resource, units in requested:
+                resource.calendar.reserve(booking.booking_id, start, start + duration, units)
+        finally:
+            for resource, _ in reversed(requested):
+                resource.lock.release()
+
+        booking.slot = (start, start + duration)
+        self.approve_slot(booking, requested)
+        return booking.booking_id
+
+    def first_free_slot(self, room_id: int, tool_ids: list[int], duration: float, after: float | None = None):
+        """Start of the first slot of `duration` seconds, at `after` (default: now) or later, that is
+        free on the room and every tool, or None if one of them does not exist."""
+        requested = self.requested_units(room_id, tool_ids)
+        if requested is None:
+            return None
+        for resource, _ in requested:
+            resource.lock.acquire()
+        try:
+            return self.common_free_slot(requested, self.clock() if after is None else after, duration)
+        finally:
+            for resource, _ in reversed(requested):
+                resource.lock.release()
+
+    def common_free_slot(self, requested, start: float, duration: float):
+        """First start >= `start` with the requested units free on every calendar. Each resource moves
+        the candidate to its own next free time until a full pass leaves it unchanged. Requires the
+        locks of the resources."""
+        while True:
+            candidate = start
+            for resource, units in requested:
+                candidate = resource.calendar.next_free(candidate, duration, units)
+            if candidate == start:
+                return start
+            start = candidate
+
+    def approve_slot(self, booking: Booking, requested):
+        """Assigns the room and tool units of a reserved slot to the booking and approves it."""
+        booking.add_room(requested[0][0].id)
+        for tool, units in requested[1:]:
+            for _ in range(units):
+                booking.add_tool(tool.id)
+        booking.approve()
+
+    def cancel_slot(self, booking_id: int):
+        """Cancels an approved slot booking and frees its slot on the room and tools. Returns True on success."""
+        booking = self.get_booking_by_id(booking_id)
+        if booking.slot is None or booking.status != StatusBooking.APPROVED:
+            return False
+        start = booking.slot[0]
+        for resource in [self.registry.find_laboratory(booking.room_id)] + self.registry.find_tools(sorted(set(booking.tool_ids))):
+            if resource is not None:
+                with resource.lock:
+                    resource.calendar.free(booking_id, start)
+        booking.cancel()
+        return True
+
+    def prune_slots(self, before: float | None = None):
+        """Forgets the slots that ended at or before `before` (default: now) on every laboratory
+        and tool, so the calendars only keep current and future slots. Returns how many were removed."""
+        before = self.clock() if before is None else before
+        removed = 0
+        for resource in self.laboratories + self.laboratory_tools:
+            with resource.lock:
+                removed += resource.calendar.prune(before)
+        return removed
+
     def use_booking(self, booking_id: int):
         """Marks the booking as in use and updates the status of the laboratory and tools."""
         booking = self.get_booking_by_id(booking_id)
@@ -101,16 +371,14 @@ class University:
             # Cambiar el estado de la reserva a "en uso"
             booking.in_use()
             # Cambiar el estado del laboratorio a "en uso"
-            for laboratory in self.laboratories:
-                if laboratory.id == booking.room_id:
-                    laboratory.to_use()
+            laboratory = self.registry.find_laboratory(booking.room_id)
+            if laboratory is not None:
+                laboratory.try_use()
 
             # Cambiar el estado de cada herramienta a "en uso"
-            for tool_id in booking.tool_ids:
-                for tool in self.laboratory_tools:
-                    if tool.id == tool_id:
-                        tool.to_use()
-                        sleep(0.1)
+            for tool in self.registry.find_tools(booking.tool_ids):
+                tool.try_use()
+                sleep(self.TOOL_USE_TIME)
             # Finalizar la reserva y liberar los recursos
             booking.finish()
             self.release_booking(booking_id)
@@ -122,18 +390,33 @@ class University:
         booking = self.get_booking_by_id(booking_id)
         if booking.status == StatusBooking.FINISHED:
             # Liberar el laboratorio reservado
-            for laboratory in self.laboratories:
-                if laboratory.id == booking.room_id:
-                    laboratory.release()
+            laboratory = self.registry.find_laboratory(booking.room_id)
+            if laboratory is not None:
+                laboratory.release(in_use=True)
+                self.trace_release(booking_id, laboratory)
 
             # Liberar todas las herramientas reservadas
-            for tool_id in booking.tool_ids:
-                for tool in self.laboratory_tools:
-                    if tool.id == tool_id:
-                        tool.release()
+            for tool in self.registry.find_tools(booking.tool_ids):
+                tool.release(in_use=True)
+                self.trace_release(booking_id, tool)
             return True
         return False
 
+    def wait_for_resource(self, resource, start_time: float):
+        """Blocks on the wait queue of a laboratory or tool until it is released or the booking times out."""
+        remaining = self.BOOKING_TIMEOUT - (time() - start_time)
+        if remaining <= 0:
+            return False
+        return resource.wait_until_available(remaining)
+
+    def wait_for_tools(self, tool_ids: list[int], start_time: float):
+        """Blocks until one of the pending tools is released. Returns False if the booking times out."""
+        for tool in self.registry.find_tools(tool_ids):
+            if not tool.is_available():
+                return self.wait_for_resource(tool, start_time)
+        # Alguna herramienta quedó libre: reintentar sin esperar mientras no se agote el tiempo
+        return time() - start_time <= self.BOOKING_TIMEOUT
+
     def random_booking(self, student_id: int):
         """Creates a random booking for a student with a random laboratory and tools."""
         room_id = random.choice(self.laboratories).id
@@ -149,22 +432,21 @@ class University:
 
     def get_bookings_by_student(self, student_id: int):
         """Returns a list of bookings for a specific student."""
-        bookings = [booking for booking in self.bookings if booking.user_id == student_id]
-        return bookings
+        return self.bookings.find_by_user(student_id)
 
     def get_booking_by_id(self, booking_id: int):
         """Returns a booking by its ID."""
-        for booking in self.bookings:
-            if booking.booking_id == booking_id:
-                return booking
-        raise ValueError(f"Booking with ID {booking_id} not found") 
+        booking = self.bookings.find(booking_id)
+        if booking is None:
+            raise ValueError(f"Booking with ID {booking_id} not found")
+        return booking
     
     def get_tool_name_by_id(self, tool_id: int):
         """Returns the name of a tool by its ID."""
-        for tool in self.laboratory_tools:
-            if tool.id == tool_id:
-                return tool.name
-        raise ValueError(f"Tool with ID {tool_id} not found")  
+        tool = self.registry.find_tool(tool_id)
+        if tool is None:
+            raise ValueError(f"Tool with ID {tool_id} not found")
+        return tool.name
 
     def get_pending_bookings(self):
         """Returns a list of pending bookings."""
@@ -176,23 +458,23 @@ class University:
 
     def get_laboratory_status(self, laboratory_id: int):
         """Returns the status of a laboratory by its ID."""
-        for lab in self.laboratories:
-            if lab.id == laboratory_id:
-                return lab.status
+        laboratory = self.registry.find_laboratory(laboratory_id)
+        if laboratory is not None:
+            return laboratory.status
 
     def get_laboratory_by_id(self, laboratory_id: int):
         """Returns a laboratory by its ID."""
-        for laboratory in self.laboratories:
-            if laboratory.id == laboratory_id:
-                return laboratory
-        raise ValueError(f"Laboratory with ID {laboratory_id} not found")
+        laboratory = self.registry.find_laboratory(laboratory_id)
+        if laboratory is None:
+            raise ValueError(f"Laboratory with ID {laboratory_id} not found")
+        return laboratory
 
 
     def get_tool_status(self, tool_id: int):
         """Returns the status of a tool by its ID."""
-        for tool in self.laboratory_tools:
-            if tool.id == tool_id:
-                return tool.status
+        tool = self.registry.find_tool(tool_id)
+        if tool is not None:
+            return tool.status
 
     # ---------------------------------------------------------------
     # All functions below are for visualization and analysis purposes only.
@@ -202,38 +484,34 @@ class University:
     def get_all_booking_details(self):
         """Returns a list of dictionaries with details of all bookings."""
         details = []
-        for booking in self.bookings:
-            student = next((s for s in self.students if s.code == booking.user_id), None)
-            laboratory = next((l for l in self.laboratories if l.id == booking.room_id), None)
-            tools = [tool for tool in self.laboratory_tools if tool.id in booking.tool_ids]
+        # Se leen las columnas de los fragmentos directamente, sin crear una vista por reserva
+        status_names = {code: status.name for code, status in STATUS_BY_CODE.items()}
+        for shard, row in self.bookings.rows():
+            code = shard.statuses[row]
+            room_id = shard.room_ids[row] if code & ROOM_ASSIGNED else 0
             details.append({
-                "booking_id": booking.booking_id,
-                "student": student,
-                "laboratory": laboratory,
-                "tools": tools,
-                "status": booking.status.name
+                "booking_id": shard.booking_id(row),
+                "student": self.students_by_code.get(shard.user_ids[row]),
+                "laboratory": self.registry.find_laboratory(room_id),
+                "tools": self.registry.find_tools(shard.tools(row)[0]),
+                "status": status_names[code & STATUS_BITS]
             })
         return details
     
     def get_booking_stats(self):
-        """Returns a dictionary with booking statistics."""
-        stats = {
-            "total_bookings": len(self.bookings),
-            "pending": sum(1 for b in self.bookings if b.status == StatusBooking.PENDING),
-            "approved": sum(1 for b in self.bookings if b.status == StatusBooking.APPROVED),
-            "rejected": sum(1 for b in self.bookings if b.status == StatusBooking.REJECTED),
-            "cancelled": sum(1 for b in self.bookings if b.status == StatusBooking.CANCELLED),
-            "in_use": sum(1 for b in self.bookings if b.status == StatusBooking.IN_USE),
-            "finished": sum(1 for b in self.bookings if b.status == StatusBooking.FINISHED),
-            "Average Approved time" : sum(b.approved_time for b in self.bookings if b.status == StatusBooking.FINISHED) / max(1, sum(1 for b in self.bookings if b.status == StatusBooking.FINISHED)),
-            "Average End time": sum(b.end_time for b in self.bookings) / max(1, sum(1 for b in self.bookings)), 
-            "Min Approved time": min((b.approved_time for b in self.bookings if b.status == StatusBooking.FINISHED), default=0),
-            "Max Approved time": max((b.approved_time for b in self.bookings if b.status == StatusBooking.FINISHED), default=0),
-            "Min End time": min((b.end_time for b in self.bookings), default=0),
-            "Max End time": max((b.end_time for b in self.bookings), default=0),
-        }
+        """Returns a dictionary with booking statistics. O(1): the counters are updated on every booking status change.
+        If any request accepted any compatible laboratory, the substitution counters are included."""
+        stats = self.booking_stats.as_dict()
+        if self.substitution_stats.requests:
+            stats.update(self.substitution_stats.as_dict())
         return stats
 
+    def get_contention_stats(self):
+        """Returns the contention counters per laboratory, tool and strategy lock (empty if disabled)."""
+        if self.contention is None:
+            return {}
+        return self.contention.as_dict()
+
     
     def __str__(self):
         return f"University with {len(self.laboratories)} laboratories, {len(self.laboratory_tools)} tools, and {len(self.bookings)} bookings."
\ No newline at end of file
@@ -0,0 +1,60 @@
+import unittest
+from controllers.replay import replay
+from controllers.workload import Workload
+from models.booking import StatusBooking
+from models.concurrence_control.university_prevention import UniversityPrevention
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+from models.registry import ANY_LABORATORY, ResourceRegistry
+from models.simulation.discrete_event import DiscreteEventSimulation
+from models.student import Student
+
+class TestAnyLaboratory(unittest.TestCase):
+    def setUp(self):
+        self.tools = [LaboratoryTool(f"Tool_{i}", i) for i in range(1, 6)]
+        self.labs = [Laboratory("Instrumentation", 1, [1, 2, 3]), Laboratory("Optics", 2, [1, 2, 4]),
+                     Laboratory("Calorimetry", 3, [2, 5])]
+        self.students = [Student(f"Student_{i}", i) for i in range(1, 31)]
+
+    def test_capability_index(self):
+        registry = ResourceRegistry(self.labs, self.tools)
+        self.assertEqual([lab.id for lab in registry.compatible_laboratories([1, 2])], [1, 2])
+        self.assertEqual([lab.id for lab in registry.compatible_laboratories([2, 2])], [1, 2, 3])
+        self.assertEqual(registry.compatible_laboratories([3, 4]), ())
+        self.assertIs(registry.compatible_laboratories([2, 1]), registry.compatible_laboratories([1, 2]))
+
+    def test_busy_preferred_laboratory_is_substituted(self):
+        university = UniversityPrevention(self.labs, self.tools, self.students)
+        university.TOOL_USE_TIME = 0.001
+        self.assertEqual(university.choose_laboratory([1]), 1)
+        self.labs[0].try_book()
+        self.assertEqual(university.choose_laboratory([1]), 2)
+        self.assertEqual(university.choose_laboratory([1], preferred_room_id=2), 2)
+        booking_id = university.to_book_any(1, [3, 4])
+        self.assertEqual(university.get_booking_by_id(booking_id).status, StatusBooking.REJECTED)
+        self.labs[0].release()
+        booking = university.get_booking_by_id(university.to_book_any(2, [2, 5]))
+        self.assertEqual((booking.status, booking.room_id), (StatusBooking.FINISHED, 3))
+        stats = university.get_booking_stats()
+        self.assertEqual((stats["Any-laboratory requests"], stats["Substitutions"], stats["No compatible laboratory"]),
+                         (5, 1, 1))
+
+    def test_any_laboratory_workload(self):
+        workload = Workload(self.labs, self.tools, range(1, 31), requests=30, seed=3, request_sizes={1: 1.0, 2: 1.0},
+                            any_laboratory_probability=1.0)
+        self.assertTrue(all(request[2] == ANY_LABORATORY for request in workload))
+        for run in ("replay", "simulation"):
+            university = UniversityPrevention(self.labs, self.tools, self.students)
+            university.TOOL_USE_TIME = 0.001
+            if run == "replay":
+                replay(university, workload, workers=6)
+            else:
+                DiscreteEventSimulation(university).run(workload)
+            self.assertTrue(all(booking.status == StatusBooking.FINISHED for booking in university.bookings), run)
+            # Cada reserva quedó en un laboratorio que ofrece todas sus herramientas
+            self.assertTrue(all(set(booking.tool_ids) <= set(university.get_laboratory_by_id(booking.room_id).tools)
+                                for booking in university.bookings))
+            self.assertEqual(university.get_booking_stats()["Any-laboratory requests"], 30)
+
+if __name__ == '__main__':
+    unittest.main()
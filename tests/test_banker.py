@@ -0,0 +1,115 @@
+import threading
+import unittest
+from models.booking import StatusBooking
+from models.concurrence_control.banker import Banker
+from models.concurrence_control.university_banker import UniversityBanker
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+from models.student import Student
+
+class TestBanker(unittest.TestCase):
+    def setUp(self):
+        # Ejemplo clásico del algoritmo del banquero (5 procesos, 3 recursos)
+        total = {"A": 10, "B": 5, "C": 7}
+        max_demand = {
+            0: {"A": 7, "B": 5, "C": 3},
+            1: {"A": 3, "B": 2, "C": 2},
+            2: {"A": 9, "B": 0, "C": 2},
+            3: {"A": 2, "B": 2, "C": 2},
+            4: {"A": 4, "B": 3, "C": 3},
+        }
+        self.banker = Banker(total, max_demand)
+        self.allocations = {
+            0: {"A": 0, "B": 1, "C": 0},
+            1: {"A": 2, "B": 0, "C": 0},
+            2: {"A": 3, "B": 0, "C": 2},
+            3: {"A": 2, "B": 1, "C": 1},
+            4: {"A": 0, "B": 0, "C": 2},
+        }
+        for sid, request in self.allocations.items():
+            self.assertTrue(self.banker.request_resources(sid, request))
+
+    def test_safe_request_is_granted(self):
+        self.assertTrue(self.banker.request_resources(1, {"A": 1, "B": 0, "C": 2}))
+        self.assertEqual(self.banker.available.tolist(), [2, 3, 0])
+
+    def test_unsafe_request_is_denied(self):
+        self.assertTrue(self.banker.request_resources(1, {"A": 1, "B": 0, "C": 2}))
+        self.assertFalse(self.banker.request_resources(0, {"A": 0, "B": 2, "C": 0}))
+        self.assertEqual(self.banker.available.tolist(), [2, 3, 0])
+
+    def test_request_above_need_is_denied(self):
+        self.assertFalse(self.banker.request_resources(3, {"A": 1, "B": 0, "C": 0}))
+
+    def test_full_check_matches_incremental(self):
+        full = Banker(self.banker.total_resources, self.banker.max_demand, incremental=False)
+        for sid, request in self.allocations.items():
+            full.request_resources(sid, request)
+        for sid, request in [(1, {"A": 1, "B": 0, "C": 2}), (0, {"A": 0, "B": 2, "C": 0})]:
+            self.assertEqual(full.request_resources(sid, request), self.banker.request_resources(sid, request))
+        self.assertEqual(full.available.tolist(), self.banker.available.tolist())
+
+    def test_blocking_request_times_out(self):
+        self.assertTrue(self.banker.request_resources(1, {"A": 1, "B": 0, "C": 2}))
+        self.assertFalse(self.banker.request_resources(0, {"A": 0, "B": 2, "C": 0}, blocking=True, timeout=0.05))
+        self.assertEqual(self.banker.waiters, [])
+
+    def test_blocking_request_granted_on_release(self):
+        self.assertTrue(self.banker.request_resources(1, {"A": 1, "B": 0, "C": 2}))
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(
+            self.banker.request_resources(0, {"A": 0, "B": 2, "C": 0}, blocking=True, timeout=5)))
+        waiter.start()
+        while not self.banker.waiters:
+            pass
+        self.banker.release_resources(1)
+        waiter.join()
+        self.assertEqual(results, [True])
+
+    def test_release_restores_available(self):
+        self.banker.release_resources(2)
+        self.assertEqual(self.banker.available.tolist(), [6, 3, 4])
+
+class TestUniversityBanker(unittest.TestCase):
+    def setUp(self):
+        tools = [LaboratoryTool("Oscilloscope", 1), LaboratoryTool("Multimeter", 2)]
+        labs = [Laboratory("Instrumentation", 1, [1, 2]), Laboratory("Optics", 2, [1, 2])]
+        self.university = UniversityBanker(labs, tools, [Student("Student_1", 1), Student("Student_2", 2)])
+        self.university.TOOL_USE_TIME = 0.01
+
+    def test_bookings_of_the_same_student_are_admitted_one_at_a_time(self):
+        admissions = []
+        request_resources = self.university.banker.request_resources
+
+        def record(*args, **kwargs):
+            admissions.append(request_resources(*args, **kwargs))
+            return admissions[-1]
+
+        self.university.banker.request_resources = record
+        threads = [threading.Thread(target=self.university.to_book, args=(1, room_id, [1])) for room_id in (1, 2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(admissions, [True, True])
+        self.assertTrue(all(booking.status == StatusBooking.FINISHED for booking in self.university.bookings))
+        self.assertEqual(self.university.banker.available.tolist(), [2, 1, 1])
+
+    def test_unknown_student_is_rejected(self):
+        booking_id = self.university.to_book(99, 1, [1])
+        self.assertEqual(self.university.get_booking_by_id(booking_id).status, StatusBooking.REJECTED)
+    def test_claims_follow_the_request_bound_so_capacity_admits_several_holders(self):
+        tools = [LaboratoryTool("Oscilloscope", 1, 3)]
+        labs = [Laboratory("Instrumentation", 1, [1], capacity=3)]
+        students = [Student(f"Student_{i}", i) for i in range(1, 4)]
+        university = UniversityBanker(labs, tools, students)
+        self.assertEqual(university.banker.maximum.tolist(), [[1, 1]] * 3)
+        # Tres estudiantes con una unidad cada uno a la vez: con la capacidad como demanda solo entraría uno
+        self.assertTrue(all(university.banker.request_resources(sid, {"lab": 1, "tool_1": 1}) for sid in (1, 2, 3)))
+        # Más unidades que las declaradas: se rechaza sin esperar
+        booking_id = university.to_book(1, 1, [1, 1])
+        self.assertEqual(university.get_booking_by_id(booking_id).status, StatusBooking.REJECTED)
+        self.assertEqual(UniversityBanker(labs, tools, students, max_tool_units=5).banker.maximum.tolist(), [[1, 3]] * 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import threading
+import unittest
+from models.booking import StatusBooking
+from models.concurrence_control.university_banker import UniversityBanker
+from models.concurrence_control.university_ordered import UniversityOrdered
+from models.concurrence_control.university_prevention import UniversityPrevention
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+from models.status_source import Status
+from models.student import Student
+from models.university import University
+
+class TestCapacity(unittest.TestCase):
+    def setUp(self):
+        self.students = [Student(f"Student_{i}", i) for i in range(1, 13)]
+
+    def topology(self):
+        tools = [LaboratoryTool("Multimeter", 1, 3), LaboratoryTool("Oscilloscope", 2, 2)]
+        labs = [Laboratory("Instrumentation", 1, [1, 2], capacity=4)]
+        return labs, tools
+
+    def test_counted_tool(self):
+        tool = LaboratoryTool("Multimeter", 1, 3)
+        self.assertTrue(tool.try_book(2))
+        self.assertEqual(tool.status, Status.RESERVERD)
+        self.assertTrue(tool.is_available())
+        self.assertFalse(tool.is_available(2))
+        self.assertFalse(tool.try_book(2))
+        self.assertTrue(tool.try_book())
+        self.assertFalse(tool.try_book())
+        self.assertTrue(tool.release(3))
+        self.assertEqual((tool.free_units, tool.status), (3, Status.AVAILABLE))
+        with self.assertRaises(ValueError):
+            LaboratoryTool("Broken", 2, 0)
+
+    def test_reserved_and_in_use_units_are_released_separately(self):
+        tool = LaboratoryTool("Multimeter", 1, 2)
+        self.assertTrue(tool.try_book() and tool.try_use())
+        self.assertTrue(tool.try_book())
+        # Se libera la unidad solo reservada: la otra sigue en uso
+        self.assertTrue(tool.release())
+        self.assertEqual((tool.reserved_units, tool.units_in_use, tool.status), (0, 1, Status.IN_USE))
+        self.assertTrue(tool.try_book())
+        self.assertTrue(tool.release(in_use=True))
+        self.assertEqual((tool.reserved_units, tool.units_in_use, tool.status), (1, 0, Status.RESERVERD))
+
+    def test_k_unit_requests_fit_the_pool(self):
+        for strategy in (UniversityPrevention, UniversityOrdered, UniversityBanker):
+            labs, tools = self.topology()
+            # El banquero debe declarar las dos unidades de multímetro que pide cada solicitud
+            options = {"max_tool_units": 2} if strategy is UniversityBanker else {}
+            university = strategy(labs, tools, self.students, **options)
+            university.TOOL_USE_TIME = 0.001
+            # Doce solicitudes de 2 multímetros y 1 osciloscopio compiten por 3 y 2 unidades
+            threads = [threading.Thread(target=university.to_book, args=(i, 1, [1, 1, 2])) for i in range(1, 13)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertTrue(all(booking.status == StatusBooking.FINISHED for booking in university.bookings),
+                            strategy.__name__)
+            self.assertTrue(all(sorted(booking.tool_ids) == [1, 1, 2] for booking in university.bookings))
+            booking_id = university.to_book(1, 1, [2, 2, 2])
+            self.assertEqual(university.get_booking_by_id(booking_id).status, StatusBooking.REJECTED, strategy.__name__)
+            self.assertEqual([tool.free_units for tool in tools], [3, 2])
+
+    def test_slots_overlap_up_to_capacity(self):
+        labs, tools = self.topology()
+        university = University(labs, tools, self.students)
+        first = university.book_slot(1, 1, [1, 1], 0.0, 10.0)
+        second = university.book_slot(2, 1, [1], 5.0, 15.0)
+        third = university.book_slot(3, 1, [1], 5.0, 15.0)
+        statuses = [university.get_booking_by_id(booking_id).status for booking_id in (first, second, third)]
+        self.assertEqual(statuses, [StatusBooking.APPROVED, StatusBooking.APPROVED, StatusBooking.REJECTED])
+        self.assertEqual(university.first_free_slot(1, [1, 1], 5.0, after=0.0), 10.0)
+        self.assertEqual(university.first_free_slot(1, [1, 1, 1], 5.0, after=0.0), 15.0)
+        self.assertTrue(university.cancel_slot(first))
+        self.assertEqual(university.first_free_slot(1, [1, 1], 5.0, after=0.0), 0.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import contextlib
+import io
+import unittest
+from benchmarks import compare_strategies
+from controllers.comparison_runner import ComparisonRunner, merge_stats, summarize_runs
+from controllers.workload import Workload
+from models.concurrence_control.university_ordered import UniversityOrdered
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+
+class TestComparisonRunner(unittest.TestCase):
+    def test_merge_stats_averages_numeric_values(self):
+        merged = merge_stats([{"finished": 2, "name": "a"}, {"finished": 4, "name": "b"}])
+        self.assertEqual(merged, {"finished": 3, "name": "a"})
+
+    def test_summary_pools_latencies_of_every_run(self):
+        runs = [
+            {"stats": {"total_bookings": 4, "rejected": 1, "Throughput (bookings/s)": 2.0, "Wall time": 2.0},
+             "approval_latencies": [1.0, 2.0, 3.0]},
+            {"stats": {"total_bookings": 4, "rejected": 3, "Throughput (bookings/s)": 4.0, "Wall time": 1.0},
+             "approval_latencies": [4.0]},
+        ]
+        summary = summarize_runs(runs)
+        self.assertEqual(summary["p50_approval_latency"], 2.5)
+        self.assertEqual(summary["rejection_rate"], 0.5)
+        self.assertEqual(summary["throughput"], 3.0)
+
+    def test_runs_are_grouped_by_strategy(self):
+        tools = [LaboratoryTool("Oscilloscope", 1), LaboratoryTool("Multimeter", 2)]
+        labs = [Laboratory("Instrumentation", 1, [1, 2])]
+        results = ComparisonRunner(processes=1).run([UniversityOrdered], labs, tools, 2, 2, seeds=[1], keep_last=True)
+        result = results["UniversityOrdered"]
+        self.assertEqual(len(result["runs"]), 2)
+        self.assertEqual(result["merged"]["total_bookings"], 2)
+        self.assertEqual(result["university"].get_booking_stats()["total_bookings"], 2)
+        # Las ejecuciones trabajan sobre copias: los recursos originales siguen libres
+        self.assertTrue(all(resource.is_available() for resource in labs + tools))
+
+    def test_each_seed_gets_its_own_workload(self):
+        tools = [LaboratoryTool("Oscilloscope", 1), LaboratoryTool("Multimeter", 2)]
+        labs = [Laboratory("Instrumentation", 1, [1, 2])]
+        jobs = ComparisonRunner(processes=1).build_jobs(
+            [UniversityOrdered], labs, tools, 4, 1, seeds=[1, 2],
+            requests=lambda seed: Workload(labs, tools, range(1, 5), requests=6, seed=seed))
+        self.assertEqual([job["requests"].seed for job in jobs], [1, 2])
+        self.assertNotEqual(list(jobs[0]["requests"]), list(jobs[1]["requests"]))
+
+    def test_benchmark_rejects_flags_it_would_ignore(self):
+        for argv in (["--rate", "5"], ["--units", "2", "--any-lab", "0.5"], ["--replay", "trace.bin", "--requests", "10"]):
+            with self.assertRaises(SystemExit), contextlib.redirect_stderr(io.StringIO()):
+                compare_strategies.main(argv)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import threading
+import unittest
+from models.concurrence_control.university_mutex_abroad import UniversityMutexAbroad
+from models.concurrence_control.university_ordered import CountedSemaphore
+from models.contention import ContentionMonitor
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+from models.student import Student
+from models.university import University
+
+class TestContention(unittest.TestCase):
+    def setUp(self):
+        self.tools = [LaboratoryTool("Oscilloscope", 1), LaboratoryTool("Multimeter", 2)]
+        self.labs = [Laboratory("Instrumentation", 1, [1, 2])]
+        self.students = [Student("Alice", 1), Student("Bob", 2)]
+
+    def test_disabled_by_default(self):
+        university = University(self.labs, self.tools, self.students)
+        self.assertTrue(self.labs[0].try_book())
+        self.assertIsNone(self.labs[0].contention)
+        self.assertEqual(university.get_contention_stats(), {})
+
+    def test_attempts_failures_and_holds_are_counted(self):
+        university = University(self.labs, self.tools, self.students)
+        university.enable_contention_metrics()
+        tool = self.tools[0]
+        self.assertTrue(tool.try_book())
+        self.assertFalse(tool.try_book())
+        self.assertFalse(tool.wait_until_available(0.01))
+        tool.release()
+        stats = university.get_contention_stats()["Tool 1"]
+        self.assertEqual((stats["attempts"], stats["failures"], stats["waits"], stats["holds"]), (2, 1, 1, 1))
+        self.assertGreater(stats["wait_time"], 0)
+
+    def test_global_lock_of_the_strategy_is_recorded(self):
+        university = UniversityMutexAbroad(self.labs, self.tools, self.students)
+        university.enable_contention_metrics()
+        threads = [threading.Thread(target=university.to_book, args=(student.code, 1, [1, 2])) for student in self.students]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        stats = university.get_contention_stats()
+        self.assertEqual(stats["Global lock"]["attempts"], 2)
+        self.assertEqual(stats["Laboratory 1"]["holds"], 2)
+
+    def test_each_holder_of_a_semaphore_is_timed(self):
+        now = [0.0]
+        monitor = ContentionMonitor(clock=lambda: now[0])
+        semaphore = monitor.instrument_lock(CountedSemaphore(3), "Semaphore")
+        acquired, released = threading.Event(), threading.Event()
+
+        def other_holder():
+            semaphore.acquire()
+            acquired.set()
+            released.wait()
+            semaphore.release()
+
+        self.assertTrue(semaphore.acquire(units=2))
+        now[0] = 1.0
+        other = threading.Thread(target=other_holder)
+        other.start()
+        acquired.wait()
+        now[0] = 4.0
+        semaphore.release(2)
+        now[0] = 5.0
+        released.set()
+        other.join()
+        # Cada tenencia se mide desde su propia adquisición: 4 s y 4 s
+        stats = monitor.as_dict()["Semaphore"]
+        self.assertEqual((stats["attempts"], stats["holds"], stats["hold_time"]), (2, 2, 8.0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+import matplotlib
+matplotlib.use("Agg")
+from models.booking import Booking, BookingStore
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+from views.pending_bookings_graph import PendingBookingsGraph
+
+class TestPendingBookingsGraph(unittest.TestCase):
+    def setUp(self):
+        self.tools = [LaboratoryTool("Oscilloscope", 1), LaboratoryTool("Multimeter", 2)]
+        self.labs = [Laboratory("Instrumentation", 1, [1, 2])]
+
+    def test_sync_updates_only_changed_bookings(self):
+        first = Booking(1, 1, 1, [1, 2])
+        second = Booking(2, 2, 1, [2])
+        graph = PendingBookingsGraph([first, second], self.labs, self.tools, layout="columns")
+        graph.build_graph()
+        self.assertEqual(graph.G.number_of_nodes(), 5)
+        pos = graph.positions()
+
+        # Asignar un recurso cambia las aristas pero no los nodos: la disposición se reutiliza
+        first.add_room(1)
+        graph.sync([first, second])
+        self.assertEqual(graph.G.edges[("booking", 1), ("lab", 1)]["label"], "assigned")
+        self.assertIs(graph.positions(), pos)
+
+        graph.sync([second])
+        self.assertNotIn(("booking", 1), graph.G)
+        self.assertIsNot(graph.positions(), pos)
+
+    def test_watched_store_updates_only_changed_bookings(self):
+        store = BookingStore()
+        graph = PendingBookingsGraph([], self.labs, self.tools, layout="columns")
+        graph.watch(store)
+        first = store.create(1, 1, [1, 2])
+        second = store.create(2, 1, [2])
+        graph.apply_changes()
+        self.assertEqual(graph.G.number_of_nodes(), 5)
+        self.assertEqual(graph.changed, set())
+
+        first.add_room(1)
+        first.add_tool(1)
+        self.assertEqual(graph.changed, {1})
+        graph.apply_changes()
+        self.assertEqual(graph.G.edges[("booking", 1), ("tool", 1)]["label"], "assigned")
+        second.approve()
+        second.finish()
+        graph.apply_changes()
+        self.assertNotIn(("booking", 2), graph.G)
+        self.assertIn(("booking", 1), graph.G)
+
+    def test_column_layout(self):
+        bookings = [Booking(i, i, 1, [1]) for i in range(1, 4)]
+        graph = PendingBookingsGraph(bookings, self.labs, self.tools, layout="columns")
+        graph.build_graph()
+        pos = graph.positions()
+        self.assertEqual([pos[("booking", i)][0] for i in range(1, 4)], [0, 0, 0])
+        self.assertEqual(pos[("lab", 1)][0], 1)
+        self.assertEqual(pos[("tool", 1)][0], 2)
+
+if __name__ == '__main__':
+    unittest.main()
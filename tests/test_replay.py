@@ -0,0 +1,50 @@
+import os
+import tempfile
+import unittest
+from controllers.replay import generate_requests, replay, requests_from_trace
+from models.concurrence_control.university_ordered import UniversityOrdered
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+from models.student import Student
+from models.university import University
+
+class TestReplay(unittest.TestCase):
+    def setUp(self):
+        self.tools = [LaboratoryTool(f"Tool_{i}", i) for i in range(1, 5)]
+        self.labs = [Laboratory("Instrumentation", 1, [1, 2]), Laboratory("Optics", 2, [3, 4])]
+        self.students = [Student(f"Student_{i}", i) for i in range(1, 7)]
+
+    def university(self, university_class):
+        university = university_class(self.labs, self.tools, self.students)
+        university.TOOL_USE_TIME = 0.001
+        return university
+
+    def test_same_seed_same_stream(self):
+        first = generate_requests(self.labs, self.tools, range(1, 7), seed=3)
+        self.assertEqual(first, generate_requests(self.labs, self.tools, range(1, 7), seed=3))
+        self.assertEqual([request[0] for request in first], list(range(1, 7)))
+
+    def test_every_strategy_receives_the_same_requests(self):
+        requests = generate_requests(self.labs, self.tools, range(1, 7), seed=5)
+        received = []
+        for university_class in (University, UniversityOrdered):
+            university = self.university(university_class)
+            replay(university, requests, workers=2)
+            received.append(sorted((booking.user_id, booking.room_id_solicited if booking.room_id == 0 else booking.room_id)
+                                   for booking in university.bookings))
+        self.assertEqual(received[0], received[1])
+        self.assertEqual(received[0], sorted((request[0], request[2]) for request in requests))
+
+    def test_requests_are_rebuilt_from_a_trace(self):
+        requests = generate_requests(self.labs, self.tools, range(1, 7), seed=7)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.bin")
+            university = self.university(UniversityOrdered)
+            university.enable_trace(path)
+            replay(university, requests)
+            university.close_trace()
+            recorded = requests_from_trace(path)
+        self.assertEqual(sorted((s, r, t) for s, _, r, t in recorded), sorted((s, r, t) for s, _, r, t in requests))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import contextlib
+import importlib
+import io
+import pkgutil
+import unittest
+from controllers.replay import replay
+from controllers.workload import Workload
+from models import concurrence_control
+from models.booking import StatusBooking
+from models.university import University
+from models.concurrence_control.university_async import UniversityAsync
+from models.concurrence_control.university_detection import UniversityDetection
+from models.concurrence_control.university_release import UniversityRelease
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+from models.student import Student
+from models.simulation.discrete_event import DiscreteEventSimulation
+
+def strategy_classes():
+    """University and every strategy class of models.concurrence_control."""
+    for module in pkgutil.iter_modules(concurrence_control.__path__):
+        importlib.import_module(f"{concurrence_control.__name__}.{module.name}")
+    classes = [University]
+    for cls in classes:
+        classes.extend(sub for sub in cls.__subclasses__() if sub not in classes)
+    return classes
+
+class TestDiscreteEventSimulation(unittest.TestCase):
+    def build(self, university_class):
+        tools = [LaboratoryTool(f"Tool {i}", i) for i in range(1, 6)]
+        labs = [Laboratory("Instrumentation", 1, [1, 4, 5]), Laboratory("Optics", 2, [2, 4])]
+        students = [Student(f"Student {i}", i) for i in range(1, 21)]
+        return university_class(labs, tools, students)
+
+    def run_simulation(self, university_class, seed, timeout=None):
+        university = self.build(university_class)
+        if timeout is not None:
+            university.BOOKING_TIMEOUT = timeout
+        simulation = DiscreteEventSimulation(university, seed)
+        university = simulation.run(simulation.random_requests(range(1, 21)))
+        return university.get_booking_stats(), simulation.simulator.now
+
+    def test_same_seed_same_result(self):
+        self.assertEqual(self.run_simulation(University, 7), self.run_simulation(University, 7))
+
+    def test_all_or_nothing_finishes_every_booking(self):
+        # Sin retener nada mientras espera no hay interbloqueos: con un timeout mayor que la corrida todas terminan
+        stats, end = self.run_simulation(UniversityRelease, 3, timeout=60)
+        self.assertEqual(stats["finished"], 20)
+        self.assertGreater(end, 0)
+
+    def test_all_or_nothing_rejects_on_timeout(self):
+        for run in ("threads", "simulation"):
+            university = self.build(UniversityRelease)
+            university.BOOKING_TIMEOUT = 0.05
+            # Otra reserva retiene la herramienta 4: la solicitud no se puede conceder antes del timeout
+            university.registry.find_tool(4).try_book()
+            if run == "threads":
+                booking_id = university.to_book(1, 1, [1, 4])
+            else:
+                simulation = DiscreteEventSimulation(university)
+                simulation.run([(1, 0.0, 1, (1, 4))])
+                booking_id = 1
+                self.assertEqual(simulation.simulator.now, 0.05)
+            self.assertEqual(university.get_booking_by_id(booking_id).status, StatusBooking.REJECTED, run)
+            # Mientras esperaba no retuvo nada
+            self.assertEqual((university.get_laboratory_by_id(1).free_units, university.registry.find_tool(1).free_units),
+                             (1, 1))
+
+    def test_policies_match_threaded_strategies(self):
+        def build(university_class):
+            tools = [LaboratoryTool(f"Tool {i}", i, 2) for i in range(1, 5)]
+            students = [Student(f"Student {i}", i) for i in range(1, 9)]
+            university = university_class([Laboratory("Instrumentation", 1, [1, 2, 3, 4])], tools, students)
+            university.TOOL_USE_TIME = 0.001
+            university.BOOKING_TIMEOUT = 0.3
+            return university
+
+        labs = [Laboratory("Instrumentation", 1, [1, 2, 3, 4])]
+        tools = [LaboratoryTool(f"Tool {i}", i, 2) for i in range(1, 5)]
+        requests = list(Workload(labs, tools, range(1, 9), requests=20, seed=5, request_sizes={1: 1.0, 3: 1.0},
+                                 tool_units={1: 2.0, 2: 1.0}))
+        # Solicitudes inválidas (herramienta o laboratorio inexistente, más unidades que las que hay) que llegan
+        # cuando las demás terminaron: el resultado final no depende del orden en que corren los hilos
+        requests += [(1, 0.2, 1, (9,)), (2, 0.2, 3, (1,)), (3, 0.2, 1, (1, 1, 1))]
+        # Todas las estrategias: las que no tienen política de eventos discretos lo informan con un error
+        unsupported = set()
+        for university_class in strategy_classes():
+            try:
+                DiscreteEventSimulation(build(university_class))
+            except ValueError:
+                unsupported.add(university_class)
+                continue
+            results = []
+            for run in ("threads", "simulation"):
+                university = build(university_class)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    if run == "threads":
+                        replay(university, requests)
+                    else:
+                        DiscreteEventSimulation(university).run(requests)
+                stats = university.get_booking_stats()
+                results.append((stats["finished"], stats["rejected"]))
+            self.assertEqual(results[0], results[1], university_class.__name__)
+        self.assertEqual(unsupported, {UniversityAsync, UniversityDetection})
+
+        # Una estrategia que reemplaza to_book sin declarar su política no hereda la de su padre
+        class Custom(University):
+            def to_book(self, student_id, room_id, tool_ids):
+                return super().to_book(student_id, room_id, tool_ids)
+        with self.assertRaises(ValueError):
+            DiscreteEventSimulation(build(Custom))
+
+if __name__ == '__main__':
+    unittest.main()
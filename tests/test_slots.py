@@ -0,0 +1,58 @@
+import threading
+import unittest
+from models.booking import StatusBooking
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+from models.slot_calendar import SlotCalendar
+from models.student import Student
+from models.university import University
+
+class TestSlots(unittest.TestCase):
+    def setUp(self):
+        self.tools = [LaboratoryTool("Oscilloscope", 1), LaboratoryTool("Multimeter", 2)]
+        self.labs = [Laboratory("Instrumentation", 1, [1, 2])]
+        self.students = [Student(f"Student_{i}", i) for i in range(1, 21)]
+        self.university = University(self.labs, self.tools, self.students)
+
+    def test_calendar(self):
+        calendar = SlotCalendar()
+        self.assertTrue(calendar.reserve(1, 10.0, 20.0))
+        self.assertTrue(calendar.reserve(2, 20.0, 30.0))
+        self.assertTrue(calendar.reserve(3, 40.0, 50.0))
+        self.assertFalse(calendar.reserve(4, 15.0, 25.0))
+        self.assertFalse(calendar.overlaps(0.0, 10.0))
+        self.assertTrue(calendar.overlaps(29.0, 41.0))
+        self.assertEqual(calendar.next_free(12.0, 5.0), 30.0)
+        self.assertEqual(calendar.next_free(12.0, 15.0), 50.0)
+        self.assertTrue(calendar.free(2, 20.0))
+        self.assertEqual(calendar.next_free(12.0, 15.0), 20.0)
+        self.assertEqual(calendar.prune(20.0), 1)
+        self.assertEqual(calendar.slots(), [(40.0, 50.0, 3)])
+
+    def test_non_overlapping_slots_of_the_same_resources_are_all_approved(self):
+        threads = [threading.Thread(target=self.university.book_slot, args=(i, 1, [1, 2], 10.0 * i, 10.0 * i + 10.0))
+                   for i in range(1, 21)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertTrue(all(booking.status == StatusBooking.APPROVED for booking in self.university.bookings))
+        booking_id = self.university.book_slot(1, 1, [2], 15.0, 25.0)
+        self.assertEqual(self.university.get_booking_by_id(booking_id).status, StatusBooking.REJECTED)
+        self.assertTrue(self.labs[0].is_available())
+
+    def test_first_free_slot_of_room_and_tools(self):
+        self.university.book_slot(1, 1, [], 0.0, 10.0)
+        self.university.book_slot(2, 1, [1], 12.0, 20.0)
+        self.assertEqual(self.university.first_free_slot(1, [1, 2], 2.0, after=0.0), 10.0)
+        self.assertEqual(self.university.first_free_slot(1, [1, 2], 5.0, after=0.0), 20.0)
+        booking_id = self.university.book_first_free_slot(3, 1, [1, 2], 5.0, after=0.0)
+        booking = self.university.get_booking_by_id(booking_id)
+        self.assertEqual((booking.slot, booking.status), ((20.0, 25.0), StatusBooking.APPROVED))
+        self.assertTrue(self.university.cancel_slot(booking_id))
+        rebooked = self.university.get_booking_by_id(self.university.book_slot(4, 1, [2], 20.0, 25.0))
+        self.assertEqual(rebooked.status, StatusBooking.APPROVED)
+        self.assertEqual(self.university.first_free_slot(1, [1], 5.0, after=0.0), 25.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import threading
+import unittest
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+from models.student import Student
+from models.trace import CREATE, EVENT_NAMES, FINISH, RELEASE, TraceRecorder, read_trace
+from models.university import University
+
+class TestTrace(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "trace.bin")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_booking_transitions_are_recorded_in_order(self):
+        tools = [LaboratoryTool("Oscilloscope", 1), LaboratoryTool("Multimeter", 2)]
+        labs = [Laboratory("Instrumentation", 1, [1, 2])]
+        university = University(labs, tools, [Student("Alice", 1)])
+        university.TOOL_USE_TIME = 0
+        university.enable_trace(self.path)
+        university.to_book(1, 1, [1, 2])
+        university.close_trace()
+
+        events = read_trace(self.path)
+        names = [EVENT_NAMES[event] for event in events["event"]]
+        self.assertEqual(names, ["create", "request", "request", "request", "room_acquired", "tool_acquired",
+                                 "tool_acquired", "approve", "in_use", "finish", "release", "release", "release"])
+        self.assertEqual(events[0]["resource_id"], 1)  # Estudiante de la reserva
+        self.assertTrue((events["booking_id"] == 1).all())
+
+    def test_threads_write_their_own_buffers(self):
+        recorder = TraceRecorder(self.path, buffer_records=16, initial_records=8)
+
+        def worker(booking_id):
+            for _ in range(100):
+                recorder.record(CREATE, booking_id)
+            recorder.record(FINISH, booking_id)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(1, 5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        recorder.record(RELEASE, 9)
+        recorder.close()
+
+        events = read_trace(self.path)
+        self.assertEqual(len(events), 4 * 101 + 1)
+        for booking_id in range(1, 5):
+            own = events[events["booking_id"] == booking_id]
+            self.assertEqual(len(set(own["thread_id"])), 1)
+            self.assertEqual(own[-1]["event"], FINISH)
+
+    def test_buffers_of_finished_threads_are_reused(self):
+        recorder = TraceRecorder(self.path, buffer_records=16, initial_records=8)
+
+        def worker(booking_id):
+            recorder.record(CREATE, booking_id)
+            recorder.record(FINISH, booking_id)
+
+        # Hilos cortos, uno por reserva, en tandas de cuatro vivos a la vez
+        for start in range(1, 401, 4):
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(start, start + 4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertLessEqual(len(recorder.buffers) + len(recorder.free_buffers), 8)
+        recorder.close()
+
+        events = read_trace(self.path)
+        self.assertEqual(len(events), 800)
+        self.assertEqual(len(set(events["booking_id"])), 400)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,10 +1,12 @@
+import copy
+import threading
 import unittest
 from unittest.mock import MagicMock
 from models.university import University
 from models.laboratory import Laboratory
 from models.laboratory_tool import LaboratoryTool
 from models.student import Student
-from models.booking import Booking, StatusBooking
+from models.booking import Booking, BookingStore, StatusBooking
 
 class TestUniversity(unittest.TestCase):
     def setUp(self):
@@ -48,6 +50,101 @@ class TestUniversity(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.university.get_booking_by_id(999)
 
+    def test_registry_lookups(self):
+        self.assertIs(self.university.get_laboratory_by_id(1), self.labs[0])
+        self.assertEqual(self.university.get_tool_name_by_id(2), "Multimeter")
+        with self.assertRaises(ValueError):
+            self.university.get_laboratory_by_id(99)
+
+    def test_try_book_is_exclusive(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.tools[0].try_book())) for _ in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(results.count(True), 1)
+        self.assertTrue(self.tools[0].try_use())
+        self.assertTrue(self.tools[0].release())
+        self.assertFalse(self.tools[0].release())
+
+    def test_resources_can_be_deep_copied(self):
+        # La GUI copia laboratorios y herramientas para cada iteración
+        labs_copy = copy.deepcopy(self.labs)
+        self.assertTrue(labs_copy[0].try_book())
+        self.assertTrue(self.labs[0].is_available())
+
+    def test_booking_stats_follow_status_changes(self):
+        first = self.university.create_booking(1, 1, [1])
+        second = self.university.create_booking(1, 1, [2])
+        stats = self.university.get_booking_stats()
+        self.assertEqual((stats["total_bookings"], stats["pending"]), (2, 2))
+        first.approve()
+        first.in_use()
+        first.finish()
+        stats = self.university.get_booking_stats()
+        self.assertEqual((stats["pending"], stats["finished"]), (1, 1))
+        self.assertEqual(stats["Max Approved time"], first.approved_time)
+        # La reserva pendiente todavía no tiene tiempo de fin
+        self.assertEqual(stats["Min End time"], 0)
+        second.reject()
+        stats = self.university.get_booking_stats()
+        self.assertEqual((stats["pending"], stats["rejected"]), (0, 1))
+        self.assertEqual(stats["Min End time"], min(first.end_time, second.end_time))
+        self.assertAlmostEqual(stats["Average End time"], (first.end_time + second.end_time) / 2)
+
+    def test_booking_store_views(self):
+        tool_ids = [2, 1]
+        booking = self.university.create_booking(1, 1, tool_ids)
+        booking.add_room(1)
+        booking.add_tool(1)
+        # Mientras está activa, la reserva usa la misma lista solicitada que recibió
+        self.assertIs(booking.tool_ids_solicited, tool_ids)
+        booking.approve()
+        booking.finish()
+        same = self.university.get_booking_by_id(booking.booking_id)
+        self.assertEqual(same, booking)
+        self.assertEqual((same.room_id, same.room_id_solicited), (1, 0))
+        self.assertEqual((same.tool_ids, same.tool_ids_solicited), ([1], [2]))
+        self.assertEqual(self.university.get_bookings_by_student(1), [booking])
+        self.assertEqual(len(self.university.bookings), 1)
+
+    def test_concurrent_booking_ids_are_unique(self):
+        created = []
+        def create(student_id):
+            for _ in range(300):
+                created.append((student_id, self.university.create_booking(student_id, 1, [1]).booking_id))
+        threads = [threading.Thread(target=create, args=(student_id,)) for student_id in range(1, 17)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sorted(booking_id for _, booking_id in created), list(range(1, 16 * 300 + 1)))
+        for student_id, booking_id in created:
+            self.assertEqual(self.university.get_booking_by_id(booking_id).user_id, student_id)
+        self.assertEqual(len(self.university.get_bookings_by_student(5)), 300)
+        self.assertEqual([booking.booking_id for booking in self.university.bookings], list(range(1, 16 * 300 + 1)))
+
+    def test_iterating_a_store_with_unwritten_ids(self):
+        # Con reservas concurrentes un ID mayor puede escribirse antes que los menores
+        store = BookingStore()
+        for booking_id in (1, 17):
+            shard, row = store.locate(booking_id)
+            shard.put(row, booking_id, 1, [1])
+        self.assertEqual([booking.booking_id for booking in store], [1, 17])
+        self.assertEqual(store.find(2), None)
+
+    def test_bookings_by_student_come_from_the_shard_index(self):
+        store = BookingStore(shards=4)
+        # Filas escritas en desorden, como con reservas concurrentes
+        for booking_id, user_id in ((9, 7), (1, 7), (2, 8), (5, 7), (6, 8)):
+            shard, row = store.locate(booking_id)
+            shard.put(row, user_id, 1, [1])
+        self.assertEqual([booking.booking_id for booking in store.find_by_user(7)], [1, 5, 9])
+        self.assertEqual([booking.booking_id for booking in store.find_by_user(8)], [2, 6])
+        self.assertEqual(store.find_by_user(9), [])
+        self.assertEqual(sorted(store.shards[0].user_rows), [7])
+
     def test_str(self):
         s = str(self.university)
         self.assertIn("University with", s)
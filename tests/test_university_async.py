@@ -0,0 +1,39 @@
+import asyncio
+import unittest
+from models.concurrence_control.university_async import UniversityAsync
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+from models.student import Student
+
+class TestUniversityAsync(unittest.TestCase):
+    def setUp(self):
+        self.tools = [LaboratoryTool("Oscilloscope", 1), LaboratoryTool("Multimeter", 2)]
+        self.labs = [Laboratory("Instrumentation", 1, [1, 2])]
+        self.students = [Student(f"Student {i}", i) for i in range(1, 6)]
+        self.university = UniversityAsync(self.labs, self.tools, self.students)
+
+    def test_concurrent_bookings_share_the_laboratory(self):
+        async def book_all():
+            await asyncio.gather(*(self.university.to_book(i, 1, [1, 2]) for i in range(1, 6)))
+        asyncio.run(book_all())
+        stats = self.university.get_booking_stats()
+        self.assertEqual(stats["finished"], 5)
+        self.assertTrue(all(resource.is_available() for resource in self.labs + self.tools))
+
+    def test_unknown_tool_is_rejected(self):
+        asyncio.run(self.university.to_book(1, 1, [3]))
+        self.assertEqual(self.university.get_booking_stats()["rejected"], 1)
+
+    def test_multi_unit_requests_wait_for_enough_units(self):
+        tools = [LaboratoryTool("Multimeter", 1, 3)]
+        university = UniversityAsync([Laboratory("Instrumentation", 1, [1], capacity=5)], tools, self.students)
+        university.TOOL_USE_TIME = 0.01
+        async def book_all():
+            # Solicitudes de 2 y de 1 unidad compiten por 3 multímetros
+            await asyncio.gather(*(university.to_book(i, 1, [1, 1] if i % 2 else [1]) for i in range(1, 6)))
+        asyncio.run(book_all())
+        self.assertEqual(university.get_booking_stats()["finished"], 5)
+        self.assertEqual(tools[0].free_units, 3)
+
+if __name__ == '__main__':
+    unittest.main()
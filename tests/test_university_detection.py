@@ -0,0 +1,61 @@
+import threading
+import unittest
+from models.concurrence_control.university_detection import UniversityDetection
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+from models.student import Student
+
+class TestUniversityDetection(unittest.TestCase):
+    def setUp(self):
+        self.tools = [LaboratoryTool("Oscilloscope", 1), LaboratoryTool("Multimeter", 2)]
+        self.labs = [Laboratory("Instrumentation", 1, [1, 2]), Laboratory("Optics", 2, [1, 2])]
+        self.students = [Student("Alice", 1), Student("Bob", 2)]
+
+    def deadlock(self, university):
+        """A holds tool 1 and waits for tool 2; B holds tool 2 and requests tool 1."""
+        a = university.create_booking(1, 1, [1, 2]).booking_id
+        b = university.create_booking(2, 2, [2, 1]).booking_id
+        self.assertTrue(university.acquire(a, self.tools[0], university.clock()))
+        self.assertTrue(university.acquire(b, self.tools[1], university.clock()))
+        results = {}
+
+        def wait_a():
+            results["a"] = university.acquire(a, self.tools[1], university.clock())
+            if not results["a"]:
+                university.release_held(a)
+
+        thread = threading.Thread(target=wait_a)
+        thread.start()
+        while a not in university.waiting:
+            thread.join(0.001)
+        results["b"] = university.acquire(b, self.tools[0], university.clock())
+        if not results["b"]:
+            university.release_held(b)
+        thread.join(1)
+        self.assertFalse(thread.is_alive())
+        return results
+
+    def test_requester_is_aborted_with_youngest_policy(self):
+        university = UniversityDetection(self.labs, self.tools, self.students)
+        university.BOOKING_TIMEOUT = 60
+        results = self.deadlock(university)
+        # B cerró el ciclo y es la más reciente: se aborta y A obtiene la herramienta 2
+        self.assertEqual(results, {"a": True, "b": False})
+        stats = university.get_detection_stats()
+        self.assertEqual(stats["Deadlocks detected"], 1)
+        self.assertEqual(stats["Average deadlock cycle length"], 2)
+
+    def test_waiting_victim_is_woken_and_releases(self):
+        university = UniversityDetection(self.labs, self.tools, self.students, victim_policy="oldest")
+        university.BOOKING_TIMEOUT = 60
+        results = self.deadlock(university)
+        # A es la víctima: al liberar la herramienta 1, B la obtiene sin esperar el timeout
+        self.assertEqual(results, {"a": False, "b": True})
+        self.assertLess(university.get_detection_stats()["Max deadlock recovery time"], 1)
+
+    def test_unknown_policy(self):
+        with self.assertRaises(ValueError):
+            UniversityDetection(self.labs, self.tools, self.students, victim_policy="random")
+
+if __name__ == '__main__':
+    unittest.main()
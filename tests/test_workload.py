@@ -0,0 +1,49 @@
+import unittest
+from collections import Counter
+from itertools import islice
+from controllers.replay import replay
+from controllers.workload import Workload
+from models.concurrence_control.university_ordered import UniversityOrdered
+from models.laboratory import Laboratory
+from models.laboratory_tool import LaboratoryTool
+from models.student import Student
+
+class TestWorkload(unittest.TestCase):
+    def setUp(self):
+        self.tools = [LaboratoryTool(f"Tool_{i}", i) for i in range(1, 9)]
+        self.labs = [Laboratory("Instrumentation", 1, [1, 2]), Laboratory("Optics", 2, [3, 4])]
+
+    def test_same_seed_same_stream_and_endless_streams_are_lazy(self):
+        workload = Workload(self.labs, self.tools, range(1, 11), requests=50, seed=4, arrivals="bursty",
+                            tool_skew=1.0, repeat_probability=0.3)
+        self.assertEqual(list(workload), list(workload))
+        self.assertNotEqual(list(workload), list(Workload(self.labs, self.tools, range(1, 11), requests=50, seed=5,
+                                                         arrivals="bursty", tool_skew=1.0, repeat_probability=0.3)))
+        endless = Workload(self.labs, self.tools, range(1, 11), arrivals="poisson")
+        arrivals = [request[1] for request in islice(endless, 1000)]
+        self.assertEqual(arrivals, sorted(arrivals))
+
+    def test_distributions(self):
+        workload = Workload(self.labs, self.tools, range(1, 11), requests=5000, seed=1, tool_skew=1.5,
+                            laboratory_weights={1: 9.0, 2: 1.0}, request_sizes={1: 1.0, 4: 1.0})
+        requests = list(workload)
+        tools = Counter(tool_id for request in requests for tool_id in request[3])
+        self.assertGreater(tools[1], tools[2])
+        self.assertGreater(tools[2], tools[8])
+        self.assertGreater(Counter(request[2] for request in requests)[1], 4000)
+        self.assertEqual({len(request[3]) for request in requests}, {1, 4})
+        self.assertTrue(all(len(set(request[3])) == len(request[3]) for request in requests))
+
+    def test_replay_consumes_a_workload(self):
+        students = [Student(f"Student_{i}", i) for i in range(1, 6)]
+        university = UniversityOrdered(self.labs, self.tools, students)
+        university.TOOL_USE_TIME = 0.001
+        workload = Workload(self.labs, self.tools, range(1, 6), requests=12, seed=2, repeat_probability=0.5)
+        run = replay(university, workload, workers=3)
+        self.assertEqual(run["requests"], 12)
+        self.assertEqual(sorted((booking.user_id, booking.room_id or booking.room_id_solicited)
+                                for booking in university.bookings),
+                         sorted((request[0], request[2]) for request in workload))
+
+if __name__ == '__main__':
+    unittest.main()
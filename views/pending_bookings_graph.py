@@ -1,63 +1,224 @@
+from threading import Lock
+
 import networkx as nx
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+from models.booking import StatusBooking
+
+# Columna de cada tipo de nodo en la disposición por columnas
+COLUMNS = {"booking": 0, "lab": 1, "tool": 2}
+NODE_COLORS = {"booking": "lightgreen", "lab": "lightblue", "tool": "orange"}
 
 class PendingBookingsGraph:
-    def __init__(self, pending_bookings, laboratories, laboratory_tools):
+    """Graph of the pending bookings and the laboratories and tools they request or hold.
+    It is kept up to date booking by booking (sync / booking_changed / booking_removed) and
+    the layout is cached between draws. With watch() it follows the transitions of a booking
+    store: only the bookings that changed since the last draw are updated, without scanning the store."""
+    # Con más nodos la disposición "auto" pasa de resortes a columnas (reservas, laboratorios, herramientas)
+    SPRING_LIMIT = 300
+    # Con más reservas no se dibujan sus etiquetas ni las de las aristas
+    LABEL_LIMIT = 200
+    # Con más reservas, en columnas, las aristas se agrupan en este número de tramos por recurso
+    EDGE_BUNDLES = 100
+
+    def __init__(self, pending_bookings, laboratories, laboratory_tools, layout: str = "auto"):
+        if layout not in ("auto", "spring", "columns"):
+            raise ValueError(f"Unknown layout {layout!r}")
         self.pending_bookings = pending_bookings
-        self.laboratories = laboratories
-        self.laboratory_tools = laboratory_tools
+        # Índices ID -> recurso para no recorrer las listas en cada arista
+        self.laboratories = {laboratory.id: laboratory for laboratory in laboratories}
+        self.laboratory_tools = {tool.id: tool for tool in laboratory_tools}
+        self.layout = layout
         self.G = nx.Graph()
+        # Estado (estado, laboratorio, herramientas) con el que se dibujó cada reserva
+        self.signatures: dict[int, tuple] = {}
+        # Posiciones calculadas y disposición con la que se calcularon; se recalculan solo si cambian los nodos
+        self.pos: dict = {}
+        self.pos_layout: str | None = None
+        self.layout_dirty = True
+        # Almacén observado e IDs de las reservas que cambiaron desde la última actualización
+        self.store = None
+        self.changed: set[int] = set()
+        self.changed_lock = Lock()
+
+    def watch(self, store):
+        """Starts following the transitions of a BookingStore (only one graph can watch a store)."""
+        self.store = store
+        store.observer = self.booking_event
+
+    def booking_event(self, booking_id: int):
+        """Observer of the store: notes the booking as changed. Runs in the thread that changed it,
+        so the graph itself is only modified by apply_changes."""
+        with self.changed_lock:
+            self.changed.add(booking_id)
+
+    def apply_changes(self):
+        """Updates the bookings that changed since the last call: still pending ones are (re)linked
+        and the finished ones are removed."""
+        with self.changed_lock:
+            changed, self.changed = self.changed, set()
+        for booking_id in sorted(changed):
+            booking = self.store.find(booking_id)
+            if booking is None:
+                continue
+            if booking.status != StatusBooking.FINISHED:
+                self.booking_changed(booking)
+            else:
+                self.booking_removed(booking_id)
 
     def build_graph(self):
-        for booking in self.pending_bookings:
-            booking_node = f"Booking {booking.booking_id}\n{booking.status.name}"
-            self.G.add_node(booking_node, type='booking')
-
-            # --- Laboratorio solicitado ---
-            lab_solicited = next((l for l in self.laboratories if l.id == booking.room_id_solicited), None)
-            if lab_solicited:
-                lab_node = f"Lab {lab_solicited.id}: \n{lab_solicited.name}"
-                self.G.add_node(lab_node, type='lab')
-                self.G.add_edge(booking_node, lab_node, label='requests')
-
-            # --- Laboratorio asignado (si hay) ---
-            if booking.room_id:
-                lab_assigned = next((l for l in self.laboratories if l.id == booking.room_id), None)
-                if lab_assigned:
-                    lab_node = f"Lab {lab_assigned.id}: \n{lab_assigned.name}"
-                    self.G.add_node(lab_node, type='lab')
-                    self.G.add_edge(booking_node, lab_node, label='assigned')
-
-            # --- Herramientas solicitadas ---
-            for tool_id in booking.tool_ids_solicited:
-                tool = next((t for t in self.laboratory_tools if t.id == tool_id), None)
-                if tool:
-                    tool_node = f"{tool.id} tool: \n{tool.name}"
-                    self.G.add_node(tool_node, type='tool')
-                    self.G.add_edge(booking_node, tool_node, label='requests')
-
-            # --- Herramientas asignadas (si hay) ---
-            for tool_id in booking.tool_ids:
-                tool = next((t for t in self.laboratory_tools if t.id == tool_id), None)
-                if tool:
-                    tool_node = f"{tool.id} tool: \n{tool.name}"
-                    self.G.add_node(tool_node, type='tool')
-                    self.G.add_edge(booking_node, tool_node, label='assigned')
+        self.sync(self.pending_bookings)
+
+    def sync(self, pending_bookings):
+        """Applies the changes since the last sync: new and changed bookings are (re)linked and
+        bookings that are no longer pending are removed. Unchanged bookings are not touched."""
+        self.pending_bookings = pending_bookings
+        seen = set()
+        for booking in pending_bookings:
+            seen.add(booking.booking_id)
+            self.booking_changed(booking)
+        for booking_id in [booking_id for booking_id in self.signatures if booking_id not in seen]:
+            self.booking_removed(booking_id)
+
+    def booking_changed(self, booking):
+        """Adds a booking or updates its status and its requested and assigned resources."""
+        signature = (booking.status, booking.room_id, tuple(booking.tool_ids), tuple(booking.tool_ids_solicited))
+        if self.signatures.get(booking.booking_id) == signature:
+            return
+        self.signatures[booking.booking_id] = signature
+
+        booking_node = ("booking", booking.booking_id)
+        if booking_node in self.G:
+            self.G.remove_edges_from(list(self.G.edges(booking_node)))
+        else:
+            self.layout_dirty = True
+        self.G.add_node(booking_node, type="booking", label=f"Booking {booking.booking_id}\n{booking.status.name}")
+
+        # --- Laboratorio solicitado y asignado (si hay) ---
+        self.link(booking_node, self.lab_node(booking.room_id_solicited), "requests")
+        if booking.room_id:
+            self.link(booking_node, self.lab_node(booking.room_id), "assigned")
+
+        # --- Herramientas solicitadas y asignadas ---
+        for tool_id in booking.tool_ids_solicited:
+            self.link(booking_node, self.tool_node(tool_id), "requests")
+        for tool_id in booking.tool_ids:
+            self.link(booking_node, self.tool_node(tool_id), "assigned")
+
+    def booking_removed(self, booking_id: int):
+        """Removes a booking that is no longer pending."""
+        if self.signatures.pop(booking_id, None) is None:
+            return
+        booking_node = ("booking", booking_id)
+        self.G.remove_node(booking_node)
+        self.pos.pop(booking_node, None)
+        self.layout_dirty = True
+
+    def lab_node(self, lab_id: int):
+        laboratory = self.laboratories.get(lab_id)
+        if laboratory is None:
+            return None
+        node = ("lab", laboratory.id)
+        if node not in self.G:
+            self.G.add_node(node, type="lab", label=f"Lab {laboratory.id}: \n{laboratory.name}")
+            self.layout_dirty = True
+        return node
+
+    def tool_node(self, tool_id: int):
+        tool = self.laboratory_tools.get(tool_id)
+        if tool is None:
+            return None
+        node = ("tool", tool.id)
+        if node not in self.G:
+            self.G.add_node(node, type="tool", label=f"{tool.id} tool: \n{tool.name}")
+            self.layout_dirty = True
+        return node
+
+    def link(self, booking_node, resource_node, label: str):
+        if resource_node is not None:
+            self.G.add_edge(booking_node, resource_node, label=label)
+
+    def layout_mode(self):
+        if self.layout != "auto":
+            return self.layout
+        return "spring" if self.G.number_of_nodes() <= self.SPRING_LIMIT else "columns"
+
+    def positions(self):
+        """Node positions, recomputed only when nodes were added or removed or the layout changed."""
+        mode = self.layout_mode()
+        if self.layout_dirty or mode != self.pos_layout:
+            if mode == "columns":
+                self.pos = self.column_layout()
+            else:
+                # Arranque en caliente desde las posiciones anteriores: pocas iteraciones bastan
+                initial = {node: pos for node, pos in self.pos.items() if node in self.G} if self.pos_layout == "spring" else {}
+                self.pos = nx.spring_layout(self.G, pos=initial or None, k=1.2, iterations=50 if initial else 200, seed=0)
+            self.pos_layout = mode
+            self.layout_dirty = False
+        return self.pos
+
+    def column_layout(self):
+        """Bookings, laboratories and tools in three columns, each one sorted by ID."""
+        pos = {}
+        for kind, column in COLUMNS.items():
+            nodes = sorted(node for node in self.G if node[0] == kind)
+            ys = np.linspace(1.0, 0.0, len(nodes)) if len(nodes) > 1 else np.full(len(nodes), 0.5)
+            pos.update({node: np.array([column, y]) for node, y in zip(nodes, ys)})
+        return pos
+
+    def draw_bundled_edges(self, pos, labels):
+        """Draws the edges of the column layout grouped by resource and by block of consecutive
+        bookings, with a width proportional to the number of edges of the group: the cost of
+        drawing does not grow with the number of bookings."""
+        bookings = sorted(node for node in self.G if node[0] == "booking")
+        block = max(1, -(-len(bookings) // self.EDGE_BUNDLES))
+        rank = {node: i // block for i, node in enumerate(bookings)}
+        blocks = np.arange(len(bookings)) // block
+        # Altura media de cada bloque de reservas
+        ys = np.array([pos[node][1] for node in bookings])
+        centers = np.bincount(blocks, weights=ys) / np.bincount(blocks)
+
+        bundles: dict[tuple, int] = {}
+        for (u, v), label in labels.items():
+            booking, resource = (u, v) if u[0] == "booking" else (v, u)
+            key = (rank[booking], resource, label)
+            bundles[key] = bundles.get(key, 0) + 1
+        widest = max(bundles.values(), default=1)
+        for label, style in (("requests", "dashed"), ("assigned", "solid")):
+            keys = [key for key in bundles if key[2] == label]
+            segments = [[(COLUMNS["booking"], centers[bucket]), tuple(pos[resource])] for bucket, resource, _ in keys]
+            widths = [0.2 + 3.0 * bundles[key] / widest for key in keys]
+            plt.gca().add_collection(LineCollection(segments, linewidths=widths, linestyles=style, colors="k", alpha=0.4))
 
     def draw(self):
         plt.figure(figsize=(14, 8))
-        pos = nx.spring_layout(self.G, k=1.2, iterations=2000)
-        labels = nx.get_edge_attributes(self.G, 'label')
-        node_colors = []
-        for n, d in self.G.nodes(data=True):
-            if d.get('type') == 'tool':
-                node_colors.append('orange')
-            elif d.get('type') == 'lab':
-                node_colors.append('lightblue')
-            else:
-                node_colors.append('lightgreen')
-        nx.draw(self.G, pos, with_labels=True, node_color=node_colors, node_size=1200, font_size=9, arrows=False)
-        nx.draw_networkx_edge_labels(self.G, pos, edge_labels=labels, font_size=8)
+        pos = self.positions()
+        n_bookings = len(self.signatures)
+        small = n_bookings <= self.LABEL_LIMIT
+
+        for kind, color in NODE_COLORS.items():
+            nodes = [node for node in self.G if node[0] == kind]
+            size = 1200 if small or kind != "booking" else max(5, 1200 * self.LABEL_LIMIT // n_bookings)
+            nx.draw_networkx_nodes(self.G, pos, nodelist=nodes, node_color=color, node_size=size)
+        labels = nx.get_edge_attributes(self.G, "label")
+        if not small and self.pos_layout == "columns":
+            self.draw_bundled_edges(pos, labels)
+        else:
+            # Las aristas se dibujan en dos colecciones (solicitadas y asignadas), no una por una
+            for label, style in (("requests", "dashed"), ("assigned", "solid")):
+                edges = [edge for edge, edge_label in labels.items() if edge_label == label]
+                nx.draw_networkx_edges(self.G, pos, edgelist=edges, style=style, alpha=1.0 if small else 0.2)
+
+        if small:
+            nx.draw_networkx_labels(self.G, pos, labels=nx.get_node_attributes(self.G, "label"), font_size=9)
+            nx.draw_networkx_edge_labels(self.G, pos, edge_labels=labels, font_size=8)
+        else:
+            # Solo se etiquetan los laboratorios y las herramientas
+            resource_labels = {node: label for node, label in self.G.nodes(data="label") if node[0] != "booking"}
+            nx.draw_networkx_labels(self.G, pos, labels=resource_labels, font_size=9)
         plt.title("Pending Bookings Graph (Solicited & Assigned)")
+        plt.axis("off")
         plt.tight_layout()
-        plt.show()
\ No newline at end of file
+        plt.show()
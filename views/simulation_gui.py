@@ -2,7 +2,7 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import threading
 import time
-import copy
+from controllers.comparison_runner import ComparisonRunner
 
 class SimulationGUI:
     def __init__(self, controller, university_classes):
@@ -39,8 +39,13 @@ class SimulationGUI:
         self.iter_var = tk.IntVar(value=1)
         tk.Entry(main_frame, textvariable=self.iter_var, font=("Arial", 11), width=8).grid(row=1, column=2, sticky="w")
 
+        # Número de hilos trabajadores (0 = un hilo por alumno)
+        tk.Label(main_frame, text="N° de hilos (0 = uno por alumno):", font=("Arial", 12, "bold")).grid(row=0, column=3, sticky="w")
+        self.workers_var = tk.IntVar(value=0)
+        tk.Entry(main_frame, textvariable=self.workers_var, font=("Arial", 11), width=8).grid(row=1, column=3, sticky="w")
+
         # Botón de simulación
-        tk.Button(main_frame, text="Comparar", font=("Arial", 12, "bold"), command=self.run_comparison).grid(row=1, column=3, padx=20)
+        tk.Button(main_frame, text="Comparar", font=("Arial", 12, "bold"), command=self.run_comparison).grid(row=1, column=4, padx=20)
 
         # Botones para ver grafo y estadísticas (deshabilitados por defecto)
         self.btn_graph = tk.Button(main_frame, text="Ver Grafo", font=("Arial", 11), state=tk.DISABLED, command=self.show_graph)
@@ -56,10 +61,10 @@ class SimulationGUI:
         self.metrics_tree.column("Clase", width=180)
         self.metrics_tree.column("Métrica", width=250)
         self.metrics_tree.column("Promedio", width=120)
-        self.metrics_tree.grid(row=3, column=0, columnspan=4, pady=20, sticky="nsew")
+        self.metrics_tree.grid(row=3, column=0, columnspan=5, pady=20, sticky="nsew")
 
         main_frame.grid_rowconfigure(3, weight=1)
-        main_frame.grid_columnconfigure(3, weight=1)
+        main_frame.grid_columnconfigure(4, weight=1)
 
     def show_class_description(self, event=None):
         selected = self.class_listbox.curselection()
@@ -107,7 +112,8 @@ class SimulationGUI:
         selected_indices = self.class_listbox.curselection()
         n_students = self.students_var.get()
         n_iter = self.iter_var.get()
-        if not selected_indices or n_students < 1 or n_iter < 1:
+        n_workers = self.workers_var.get()
+        if not selected_indices or n_students < 1 or n_iter < 1 or n_workers < 0:
             messagebox.showerror("Error", "Selecciona al menos una clase, un número válido de alumnos y de iteraciones.")
             return
 
@@ -118,34 +124,35 @@ class SimulationGUI:
 
         def task():
             selected_classes = [self.university_classes[i] for i in selected_indices]
-            results = {cls.__name__: [] for cls in selected_classes}
-            last_university = None
-
-            for cls in selected_classes:
-                for _ in range(n_iter):
-                    students = [self.controller.university.students[0].__class__(f"Student_{i+1}", i+1) for i in range(n_students)]
-                    labs_copy = copy.deepcopy(self.controller.university.laboratories)
-                    tools_copy = copy.deepcopy(self.controller.university.laboratory_tools)
-                    university = cls(labs_copy, tools_copy, students)
-                    controller = self.controller.__class__(university)
-                    controller.concurrent_ramdom_bookings([i+1 for i in range(n_students)])
-                    stats = controller.get_statistics()
-                    results[cls.__name__].append(stats)
-                    last_university = university
+            # Cada (clase, iteración) corre en su propio proceso
+            results = ComparisonRunner().run(
+                selected_classes,
+                self.controller.university.laboratories,
+                self.controller.university.laboratory_tools,
+                n_students, n_iter,
+                workers=n_workers,
+                keep_last=len(selected_classes) == 1,
+                contention=True,
+            )
+            last_university = next(iter(results.values()))["university"]
 
             def update_table():
                 for row in self.metrics_tree.get_children():
                     self.metrics_tree.delete(row)
                 metric_keys = set()
-                for stats in results.values():
-                    for stat in stats:
-                        metric_keys.update(stat.keys())
-                metric_keys = [k for k in metric_keys if "time" in k.lower() or "total" in k.lower() or "pending" in k.lower() or "approved" in k.lower() or "rejected" in k.lower() or "finished" in k.lower()]
-                for cls_name, stats_list in results.items():
-                    for stat in stats_list:
-                        for key in metric_keys:
-                            value = stat.get(key, "-")
-                            self.metrics_tree.insert("", "end", values=(cls_name, key, f"{value:.4f}" if isinstance(value, float) else value))
+                for result in results.values():
+                    metric_keys.update(result["merged"].keys())
+                metric_keys = [k for k in metric_keys if "time" in k.lower() or "total" in k.lower() or "pending" in k.lower() or "approved" in k.lower() or "rejected" in k.lower() or "finished" in k.lower() or "throughput" in k.lower() or "deadlock" in k.lower() or "latency" in k.lower()]
+                for cls_name, result in results.items():
+                    # Promedio de las iteraciones de la clase
+                    for key in metric_keys:
+                        value = result["merged"].get(key, "-")
+                        self.metrics_tree.insert("", "end", values=(cls_name, key, f"{value:.4f}" if isinstance(value, float) else value))
+                    # Contención de cada laboratorio, herramienta y lock de la estrategia
+                    for resource, counters in result["contention"].items():
+                        for key in ("attempts", "failures", "wait_time", "hold_time"):
+                            value = counters[key]
+                            self.metrics_tree.insert("", "end", values=(cls_name, f"{resource} {key}", f"{value:.4f}" if isinstance(value, float) else value))
                 self.hide_loading()
                 # Si solo hay una clase, guarda la universidad y habilita los botones
                 if len(selected_indices) == 1 and last_university is not None: